@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Compare accumulation loops using prefixed.Float with the same loops using float
+
+Usage: PYTHONPATH=. python benchmarks/arithmetic.py [COUNT]
+
+Measured Float/float ratios with the default count:
+
+    operation      3.11   3.13   2.7
+    add           18.0x  18.6x  22.8x
+    multiply-add  22.6x  32.3x  32.7x
+    divide        11.3x   9.8x  20.6x
+    divmod         5.0x   6.1x   6.9x
+    negate        14.1x  14.2x  26.6x
+
+Float is not close to float and can't be while it is implemented in Python.
+Every Float operation runs a Python method, and float operations don't.
+A float subclass whose __add__() only returns float.__add__(self, value)
+is still 6x slower than float for add and 9x slower for negate. Most of
+the remaining cost comes from wrapping the result in a new Float.
+"""
+
+from __future__ import print_function
+
+import sys
+import timeit
+
+SETUP = '''
+from prefixed import Float
+values = [%s(num) for num in range(%d)]
+'''
+
+LOOPS = (
+    ('add', 'total = values[0]\nfor value in values: total = total + value'),
+    ('multiply-add', 'total = values[0]\nfor value in values: total = total + value * 1.5'),
+    ('divide', 'for value in values: value / 3'),
+    ('divmod', 'for value in values: divmod(value, 7)'),
+    ('negate', 'for value in values: -value'),
+)
+
+
+def main(count=10000):
+    """
+    Time each loop for float and Float and report the ratio
+    """
+
+    print('%-14s %12s %12s %8s' % ('operation', 'float (ms)', 'Float (ms)', 'ratio'))
+    for name, statement in LOOPS:
+        results = []
+        for cls in ('float', 'Float'):
+            timer = timeit.Timer(statement, SETUP % (cls, count))
+            results.append(min(timer.repeat(5, 1)) * 1000)
+
+        print('%-14s %12.3f %12.3f %7.1fx' % (name, results[0], results[1],
+                                              results[1] / results[0]))
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
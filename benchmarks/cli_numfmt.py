@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Compare throughput of ``python -m prefixed`` with GNU numfmt
+
+A deterministic benchmark file is generated in a temporary directory, then both tools
+convert the same fields to and from SI prefixes. numfmt is skipped if it isn't installed.
+
+Usage: python benchmarks/cli_numfmt.py [LINES]
+"""
+
+from __future__ import print_function
+
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def generate(path, lines):
+    """
+    Write benchmark file with a host name column and two numeric columns
+    """
+
+    rand = random.Random(42)
+    with open(path, 'w') as bench_file:
+        for num in range(lines):
+            bench_file.write('host%d %d %d\n' % (num, rand.randint(0, 10**12),
+                                                 rand.randint(0, 10**6)))
+
+
+def convert(command, source, destination):
+    """
+    Run command with source as standard input and destination as standard output
+    """
+
+    with open(source, 'rb') as stdin, open(destination, 'wb') as stdout:
+        subprocess.check_call(command, stdin=stdin, stdout=stdout)
+
+
+def run(label, command, source, size):
+    """
+    Run command with source as standard input and report throughput
+    """
+
+    with open(source, 'rb') as stdin, open(os.devnull, 'wb') as stdout:
+        start = time.time()
+        subprocess.check_call(command, stdin=stdin, stdout=stdout)
+        elapsed = time.time() - start
+
+    print('%-28s %8.3fs %8.2f MB/s' % (label, elapsed, size / elapsed / 1e6))
+
+
+def main(lines=500000):
+    """
+    Generate benchmark file and time conversions
+    """
+
+    tempdir = tempfile.mkdtemp()
+    try:
+        raw = os.path.join(tempdir, 'raw.txt')
+        generate(raw, lines)
+        size = os.path.getsize(raw)
+
+        to_si = [sys.executable, '-m', 'prefixed', '--to', 'si', '--field', '2-3']
+        prefixed = os.path.join(tempdir, 'prefixed.txt')
+        convert(to_si, raw, prefixed)
+
+        print('%d lines, %.1f MB' % (lines, size / 1e6))
+        run('prefixed --to si', to_si, raw, size)
+        run('prefixed --from auto', [sys.executable, '-m', 'prefixed', '--field', '2-3'],
+            prefixed, size)
+
+        numfmt = shutil.which('numfmt') if hasattr(shutil, 'which') else None
+        if numfmt:
+            # numfmt uses a different suffix for kilo, so it reads its own output
+            numfmt_si = os.path.join(tempdir, 'numfmt.txt')
+            convert([numfmt, '--to=si', '--field=2-3'], raw, numfmt_si)
+            run('numfmt --to=si', [numfmt, '--to=si', '--field=2-3'], raw, size)
+            run('numfmt --from=si', [numfmt, '--from=si', '--field=2-3'], numfmt_si, size)
+        else:
+            print('numfmt not found')
+
+    finally:
+        shutil.rmtree(tempdir)
+
+
+if __name__ == '__main__':
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+Entry point for ``python -m prefixed``
+"""
+
+import sys
+
+from prefixed.cli import main
+
+sys.exit(main())
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed arrays**
+
+Compact storage with :py:class:`prefixed.FloatArray` and
+binary output with :py:func:`prefixed.format_into`
+"""
+
+from array import array
+import itertools
+import sys
+
+from prefixed import _compat
+from prefixed._common import WRITE_CHUNK_SIZE
+from prefixed._float import Float, _new, parse_many
+from prefixed._formatter import SPEC_CACHE
+
+
+def format_into(buf, values, format_spec, sep=b'\n'):
+    """
+    Args:
+        buf: Writable :py:class:`bytearray`, :py:class:`memoryview`, or binary file object
+        values(iterable): Numbers to format
+        format_spec(str): Format specification
+        sep(bytes): Written after each value
+
+    Returns:
+        int: Number of bytes written
+
+    Write formatted values to buf as UTF-8 encoded bytes
+
+    .. code-block:: python
+
+        >>> buf = bytearray(b'rates: ')
+        >>> format_into(buf, [1246, 2.5e6], '.2h', sep=b' ')
+        12
+        >>> buf
+        bytearray(b'rates: 1.25k 2.50M ')
+
+    Values are formatted and encoded in chunks, so there is a single encode and copy
+    for each chunk rather than for each value.
+
+    A :py:class:`bytearray` or file is appended to.
+    A :py:class:`memoryview` (or other writable buffer) is filled from the start and
+    :py:exc:`ValueError` is raised if the output doesn't fit. In this case, the buffer
+    will contain any complete chunks written before the error.
+    """
+
+    formatter = SPEC_CACHE(format_spec)
+
+    # Formatted values are text on Python 3 and encoded native strings on Python 2
+    separator = bytes(sep)
+    if not _compat.PY2:  # pragma: no branch
+        separator = separator.decode('utf-8')
+
+    if hasattr(buf, 'write'):
+        write = buf.write
+    elif isinstance(buf, bytearray):
+        write = buf.extend
+    else:
+        view = memoryview(buf)
+        if view.readonly:
+            raise TypeError('Buffer is not writable')
+        view = _compat.byte_view(view)
+        write = None
+
+    written = 0
+    values = iter(values)
+    for chunk in iter(lambda: [formatter(value) for value in
+                               itertools.islice(values, WRITE_CHUNK_SIZE)], []):
+        data = separator.join(chunk) + separator
+        if not _compat.PY2:  # pragma: no branch
+            data = data.encode('utf-8')
+        length = len(data)
+
+        if write is None:
+            if written + length > len(view):
+                raise ValueError('Buffer too small: %d bytes available, at least %d required' %
+                                 (len(view), written + length))
+            view[written:written + length] = data
+        else:
+            write(data)
+
+        written += length
+
+    return written
+
+
+def _restore_float_array(cls, data, byteorder):
+    """
+    Unpickle FloatArray from raw bytes
+    """
+
+    result = cls(data)
+    if byteorder != sys.byteorder:
+        result.byteswap()
+
+    return result
+
+
+class FloatArray(array):
+    """
+    Args:
+        values(iterable): Numbers
+
+    Compact sequence of floats stored as C doubles in an :py:class:`array.array` of type ``'d'``
+
+    Elements are stored as raw values and only converted to :py:class:`Float` instances
+    when they are accessed by index or iteration. Slices are also :py:class:`FloatArray` instances.
+
+    .. code-block:: python
+
+        >>> values = FloatArray.parse(['2Ki', '3.5M', '12μ'])
+        >>> values[0]
+        Float(2048.0)
+        >>> values.format('.2h')
+        ['2.05k', '3.50M', '12.00μ']
+
+    The buffer protocol is supported, so values can be viewed
+    without copying by :py:func:`numpy.frombuffer`, :py:func:`numpy.asarray`,
+    and :py:class:`memoryview`. Instances are pickled as raw bytes.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, values=()):
+        return super(FloatArray, cls).__new__(cls, 'd', values)
+
+    def __repr__(self):
+        return '%s(%r)' % (self.__class__.__name__, self.tolist())
+
+    def __getitem__(self, index):
+
+        value = array.__getitem__(self, index)
+        if isinstance(index, slice):
+            return self.__class__(value)
+
+        return _new(Float, value)
+
+    if _compat.PY2:  # pragma: no cover
+        __getslice__ = _compat.getslice
+
+    def __iter__(self):
+        return (_new(Float, value) for value in array.__iter__(self))
+
+    def __reduce_ex__(self, protocol):
+        return _restore_float_array, (self.__class__, _compat.array_bytes(self), sys.byteorder)
+
+    def __copy__(self):
+        return self.__class__(self)
+
+    def __deepcopy__(self, memo):
+        return self.__class__(self)
+
+    def format(self, format_spec):
+        """
+        Args:
+            format_spec(str): Format specification
+
+        Returns:
+            list: Formatted strings
+
+        Equivalent to ``[format(value, format_spec) for value in self]``
+
+        When `NumPy <https://numpy.org>`_ is available, values are formatted with
+        :py:func:`format_array` without copying them
+        """
+
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            from prefixed._numpy import format_array as _format_array
+        except ImportError:
+            return SPEC_CACHE(format_spec).format_many(array.__iter__(self))
+
+        return _format_array(SPEC_CACHE(format_spec), self).tolist()
+
+    @classmethod
+    def parse(cls, values, errors='raise'):
+        """
+        Args:
+            values(iterable): Strings (or numbers) to convert
+            errors(str): ``'raise'`` for :py:exc:`ValueError` or ``'coerce'`` for ``nan``
+
+        Returns:
+            :py:class:`FloatArray`: Converted values
+
+        Convert values using the same rules as :py:class:`Float`, see :py:func:`parse_many`
+        """
+
+        if errors not in {'raise', 'coerce'}:
+            raise ValueError("errors must be 'raise' or 'coerce', not %r" % (errors,))
+
+        return cls(parse_many(values, errors))
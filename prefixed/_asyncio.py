@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed asyncio support**
+
+Async generators for formatting and parsing streams of values
+This module requires Python 3.6 or later
+"""
+
+from prefixed._common import ASYNC_OFFLOAD_THRESHOLD
+from prefixed._float import Float, _apply_prefix, _new, parse_many
+from prefixed._formatter import SPEC_CACHE
+
+
+def _format_batch(format_spec, values):
+    """
+    Format a batch of values, may be called in an executor
+    """
+
+    return SPEC_CACHE(format_spec).format_many(values)
+
+
+async def _batches(aiterable, size, latency=None):
+    """
+    Collect items from an async iterable into lists of up to size items
+
+    When latency is given and the batch isn't empty, the next item is read in a task.
+    If it isn't received within latency seconds, the partial batch is returned first.
+    """
+
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    # aiter() and anext() were added in Python 3.10
+    # pylint: disable=unnecessary-dunder-call
+    iterator = aiterable.__aiter__()
+    batch = []
+    pending = None
+
+    try:
+        while True:
+            if latency is None or not batch:
+                awaitable = iterator.__anext__()
+            else:
+                awaitable = pending = asyncio.ensure_future(iterator.__anext__())
+                done, _ = await asyncio.wait((pending,), timeout=latency)
+                if not done:
+                    yield batch
+                    batch = []
+
+            try:
+                item = await awaitable
+            except StopAsyncIteration:
+                break
+
+            pending = None
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+
+    finally:
+        # Generator was closed while waiting for the source
+        if pending is not None:
+            pending.cancel()
+
+    if batch:
+        yield batch
+
+
+async def _call(executor, func, *args):
+    """
+    Call function in the executor and wait for the result
+    If executor is True, the default executor for the event loop is used
+    """
+
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    return await asyncio.get_event_loop().run_in_executor(
+        None if executor is True else executor, func, *args
+    )
+
+
+def _check_batch(batch):
+    """
+    Validate batch size
+    """
+
+    if batch < 1:
+        raise ValueError('batch must be a positive integer, not %r' % (batch,))
+
+
+async def aformat(aiterable, format_spec, batch=1024, executor=None, latency=None):
+    """
+    Args:
+        aiterable: Asynchronous iterable of numbers
+        format_spec(str): Format specification
+        batch(int): Maximum number of values formatted at a time
+        executor: :py:class:`concurrent.futures.Executor` for large batches,
+            :py:data:`True` for the event loop's default executor
+        latency(float): Maximum seconds to wait for more values before formatting a
+            partial batch, :py:data:`None` to wait until the batch is full
+
+    Returns:
+        async generator: Formatted strings in the same order as the values
+
+    Format values from an asynchronous iterable in batches
+
+    .. code-block:: python
+
+        >>> async for line in aformat(samples, '.2h', executor=True):
+        ...     await writer.write(line)
+
+    Values are read until a batch is full or the iterable is exhausted, so by default a batch
+    isn't formatted until it's complete. For slow or bursty sources, set latency so values
+    which have been received aren't held back while the source waits for more.
+    Each value is then read in a separate task, which adds overhead for fast sources.
+    The next batch isn't read until all strings from the current batch have been consumed.
+
+    When executor is given, batches of at least :py:data:`ASYNC_OFFLOAD_THRESHOLD` values
+    are formatted in the executor so the event loop isn't blocked.
+    For process pools, values must be picklable.
+    """
+
+    _check_batch(batch)
+    SPEC_CACHE(format_spec)  # Raise for invalid specs before reading values
+
+    async for values in _batches(aiterable, batch, latency):
+        if executor is None or len(values) < ASYNC_OFFLOAD_THRESHOLD:
+            strings = _format_batch(format_spec, values)
+        else:
+            strings = await _call(executor, _format_batch, format_spec, values)
+
+        for string in strings:
+            yield string
+
+
+async def aparse(aiterable, errors='raise', batch=1024, executor=None, latency=None):
+    """
+    Args:
+        aiterable: Asynchronous iterable of strings (or numbers)
+        errors(str): ``'raise'`` for :py:exc:`ValueError` or ``'coerce'`` for ``nan``
+        batch(int): Maximum number of values converted at a time
+        executor: :py:class:`concurrent.futures.Executor` for large batches,
+            :py:data:`True` for the event loop's default executor
+        latency(float): Maximum seconds to wait for more values before converting a
+            partial batch, :py:data:`None` to wait until the batch is full
+
+    Returns:
+        async generator: :py:class:`Float` instances in the same order as the values
+
+    Convert values from an asynchronous iterable in batches using :py:func:`parse_many`
+
+    Batching, executors, and latency are handled the same as :py:func:`aformat`.
+    Indexes in error messages are positions in the stream.
+    """
+
+    if errors not in {'raise', 'coerce'}:
+        raise ValueError("errors must be 'raise' or 'coerce', not %r" % (errors,))
+    _check_batch(batch)
+
+    offset = 0
+    async for values in _batches(aiterable, batch, latency):
+        if executor is None or len(values) < ASYNC_OFFLOAD_THRESHOLD:
+            parsed, mask = parse_many(values, 'mask')
+        else:
+            parsed, mask = await _call(executor, parse_many, values, 'mask')
+
+        if errors == 'raise' and any(mask):
+            index = mask.index(1)
+            value = values[index]
+            try:
+                float(_apply_prefix(value))
+            except (TypeError, ValueError) as exc:
+                raise exc.__class__('Could not convert %s to Float at index %d: %r' %
+                                    (value.__class__.__name__, offset + index, value)) from None
+
+        for value in parsed:
+            yield _new(Float, value)
+
+        offset += len(values)
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed common definitions**
+
+Prefix tables, constants, and caches shared by the prefixed modules
+"""
+
+from collections import namedtuple
+import itertools
+import re
+
+from prefixed import _compat
+
+RE_FORMAT_SPEC = re.compile(
+    # fill: requires align - capture if second char is align char
+    r'(?P<fill>.(?=[\<\>\=\^]))?'
+    # align: <>=^
+    r'(?P<align>[\<\>\=\^])?'
+    # sign +-(space)
+    r'(?P<sign>[\+\- ])?'
+    # # Alternative form (Only numeric classes)
+    r'(?P<alt>\#)?'
+    # 0: same as 0=, Ignored if fill/align is given
+    r'(?P<zero>0)?'
+    # !: Add space before prefix
+    r'(?P<prefix_space>!!?)?'
+    # width: integer
+    r'(?P<width>\d+)?'
+    # grouping_option: ,_
+    r'(?P<grouping>[,_])?'
+    # margin:
+    r'(?:%(?P<margin>-?\d+))?'
+    # .precision: integer
+    r'(?:\.(?P<precision>\d+))?'
+    # spec_type: Single non-numeric character
+    r'(?P<type>\D)?$'
+)
+
+SI_SMALL = {
+    1e-30: 'q',  # Quecto
+    1e-27: 'r',  # Ronto
+    1e-24: 'y',  # Yocto
+    1e-21: 'z',  # Zepto
+    1e-18: 'a',  # Atto
+    1e-15: 'f',  # Femto
+    1e-12: 'p',  # Pico
+    1e-9: 'n',  # Nano
+    1e-6: 'μ',  # Micro
+    1e-3: 'm',  # Milli
+}
+SI_LARGE = {
+    1e3: 'k',  # Kilo
+    1e6: 'M',  # Mega
+    1e9: 'G',  # Giga
+    1e12: 'T',  # Tera
+    1e15: 'P',  # Peta
+    1e18: 'E',  # Exa
+    1e21: 'Z',  # Zetta
+    1e24: 'Y',  # Yotta
+    1e27: 'R',  # Ronna
+    1e30: 'Q',  # Quetta
+}
+
+SI_SMALLEST = 1e-30
+
+INF = float('inf')
+NAN = float('nan')
+
+SI_MAGNITUDE = {val: key for key, val in itertools.chain(SI_SMALL.items(), SI_LARGE.items())}
+
+IEC_PREFIXES = {
+    2**10: 'K',  # Kibi
+    2**20: 'M',  # Mebi
+    2**30: 'G',  # Gibi
+    2**40: 'T',  # Tebi
+    2**50: 'P',  # Pedi
+    2**60: 'E',  # Exbi
+    2**70: 'Z',  # Zebi
+    2**80: 'Y',  # Yobi
+}
+
+IEC_MAGNITUDE = {val: key for key, val in IEC_PREFIXES.items()}
+
+# Magnitudes by suffix used when parsing strings
+# Support for both Greek letter mu and legacy micro symbol
+# Python 2.7 strings encode micro in two bytes, so suffixes are one or two characters
+PREFIX_MAGNITUDE = dict(SI_MAGNITUDE)
+PREFIX_MAGNITUDE.update((prefix + 'i', magnitude) for prefix, magnitude in IEC_MAGNITUDE.items())
+PREFIX_MAGNITUDE.update({u'\u03bc': 1e-6, u'\u00b5': 1e-6})
+if _compat.PY2:  # pragma: no cover
+    PREFIX_MAGNITUDE['µ'] = 1e-6
+
+SPEC_FIELDS = ('fill', 'align', 'sign', 'alt', 'zero', 'width', 'grouping')
+
+# Use OrderedDict for older versions of Python
+SI_SMALL = _compat.ordered(SI_SMALL)
+SI_LARGE = _compat.ordered(SI_LARGE)
+IEC_PREFIXES = _compat.ordered(IEC_PREFIXES)
+
+DEPRECATED = {'j': 'k', 'J': 'm'}
+PREFIX_TYPES = frozenset(('h', 'H', 'k', 'K', 'm', 'M'))
+
+SPEC_CACHE_SIZE = 256
+
+COLUMN_STRATEGIES = ('max', 'median', 'min')
+
+# Minimum number of values for format_many() to use a process pool
+PARALLEL_THRESHOLD = 100000
+
+# Minimum batch size for aformat() and aparse() to use an executor
+ASYNC_OFFLOAD_THRESHOLD = 256
+
+# Number of values encoded at a time by format_into()
+WRITE_CHUNK_SIZE = 4096
+
+# Values within this relative distance of a threshold are checked against the rounding rule
+# Float division and rounding can only move the boundary by a few ULPs
+THRESHOLD_TOLERANCE = 1e-9
+
+CacheInfo = namedtuple('CacheInfo', ('hits', 'misses', 'maxsize', 'currsize'))
+
+
+# Defined with PREFIX_MAGNITUDE since Python 3.12+ doesn't optimize method calls on imported names
+def _split_prefix(value):
+    """
+    Split a string consisting of a number and an SI or IEC prefix into number and magnitude
+    Returns :py:data:`None` if value is not in that form
+    """
+
+    suffix = value[-2:]
+    magnitude = PREFIX_MAGNITUDE.get(suffix)
+    if magnitude is None:
+        suffix = value[-1:]
+        magnitude = PREFIX_MAGNITUDE.get(suffix)
+        if magnitude is None:
+            return None
+
+    number = value[:-len(suffix)]
+
+    # A single space is accepted between the number and prefix
+    if number[-1:] == ' ':
+        number = number[:-1]
+
+    # Numbers must end in a digit or decimal point, so 'inf' and 'nan' aren't parsed
+    if number[-1:].isdigit() or number[-1:] == '.':
+        return number, magnitude
+
+    return None
+
+
+class _BoundedCache(object):
+    """
+    Args:
+        function(function): Function to call with key when key is not in the cache
+        maxsize(int): Maximum number of entries to store
+
+    Cache the results of a single argument function
+
+    When the cache is full, the oldest entry is discarded
+    Exceptions raised by function are not cached
+    """
+
+    __slots__ = ('function', 'maxsize', 'hits', 'misses', '_cache')
+
+    def __init__(self, function, maxsize):
+
+        self.function = function
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = _compat.ordered({})
+
+    def __call__(self, key):
+
+        try:
+            result = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            result = self.function(key)
+            if self.maxsize:
+                # Other threads may add entries while the oldest key is found
+                while len(self._cache) >= self.maxsize:
+                    try:
+                        self._cache.pop(next(iter(self._cache), None), None)
+                    except RuntimeError:
+                        pass
+                self._cache[key] = result
+            return result
+
+        self.hits += 1
+        return result
+
+    def info(self):
+        """
+        Returns:
+            :py:class:`CacheInfo`: Cache statistics
+        """
+
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._cache))
+
+    def clear(self):
+        """
+        Remove all entries and reset statistics
+        """
+
+        self._cache.clear()
+        self.hits = self.misses = 0
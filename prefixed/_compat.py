@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 - 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed compatibility module**
+
+Shims for Python 2.7 and versions of Python 3 before 3.7
+"""
+
+from array import array
+import sys
+
+PY2 = sys.version_info[0] < 3
+
+try:
+    BASESTRING = basestring
+except NameError:
+    BASESTRING = str
+
+try:
+    INTEGER = long
+except NameError:
+    INTEGER = int
+
+
+def raise_from_none(exc):  # pragma: no cover
+    """
+    Convenience function to raise from None in a Python 2/3 compatible manner
+    """
+    raise exc
+
+
+if not PY2:  # pragma: no branch
+    exec('def raise_from_none(exc):\n    raise exc from None')  # pylint: disable=exec-used
+
+
+def ordered(mapping):
+    """
+    Return mapping with keys in sorted order for versions of Python with unordered dictionaries
+    """
+
+    if sys.version_info[:2] < (3, 7):  # pragma: no cover
+        from collections import OrderedDict  # pylint: disable=import-outside-toplevel
+        return OrderedDict(sorted(mapping.items()))
+
+    return mapping
+
+
+def cpu_count():
+    """
+    Number of processors, 1 if it can't be determined
+    """
+
+    import multiprocessing  # pylint: disable=import-outside-toplevel
+
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:  # pragma: no cover
+        return 1
+
+
+def byte_view(view):
+    """
+    Return memoryview as a flat view of unsigned bytes
+    Python 2 memoryviews can't be cast, but are always bytes
+    """
+
+    if PY2 or (view.format == 'B' and view.ndim == 1):  # pragma: no cover
+        return view
+
+    return view.cast('B')
+
+
+def array_bytes(values):
+    """
+    Return contents of array as bytes
+    Python 2 arrays only have tostring()
+    """
+
+    if PY2:  # pragma: no cover
+        return values.tostring()  # pylint: disable=no-member
+
+    return values.tobytes()
+
+
+def getslice(self, start, stop):  # pragma: no cover
+    """
+    Simple slices for array subclasses. Implemented to support Python 2.7
+    """
+
+    return self.__class__(array.__getslice__(self, start, stop))  # pylint: disable=no-member
+
+
+def div(self, value):  # pragma: no cover
+    """
+    Old style division. Implemented to support Python 2.7
+    """
+
+    result = float.__div__(self, value)  # pylint: disable=no-member
+    return result if result is NotImplemented else float.__new__(self.__class__, result)
+
+
+def rdiv(self, value):  # pragma: no cover
+    """
+    Old style division. Implemented to support Python 2.7
+    """
+
+    result = float.__rdiv__(self, value)  # pylint: disable=no-member
+    return result if result is NotImplemented else float.__new__(self.__class__, result)
@@ -0,0 +1,408 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed Float**
+
+Parsing prefixed strings and :py:class:`prefixed.Float`
+"""
+
+from array import array
+
+from prefixed import _compat
+from prefixed._common import NAN, _BoundedCache, _split_prefix
+from prefixed._compat import BASESTRING, raise_from_none
+from prefixed._formatter import SPEC_CACHE
+
+
+def _parse_prefix(value):
+    """
+    Parse a string consisting of a number and an SI or IEC prefix
+    Returns :py:data:`None` if value is not in that form
+    """
+
+    parts = _split_prefix(value)
+    if parts is not None:
+        try:
+            return float(parts[0]) * parts[1]
+        except ValueError:
+            pass
+
+    return None
+
+
+# Cache of parsed strings, disabled by default, see set_parse_cache_size()
+PARSE_CACHE = _BoundedCache(_parse_prefix, 0)
+
+
+def parse_cache_info():
+    """
+    Returns:
+        :py:class:`CacheInfo`: Named tuple with hits, misses, maxsize, and currsize
+
+    Statistics for the cache of parsed strings used by :py:class:`Float`
+    """
+
+    return PARSE_CACHE.info()
+
+
+def clear_parse_cache():
+    """
+    Clear the cache of parsed strings and reset statistics
+    """
+
+    PARSE_CACHE.clear()
+
+
+def set_parse_cache_size(maxsize):
+    """
+    Args:
+        maxsize(int): Maximum number of parsed strings to cache, 0 to disable
+
+    Cache the results of parsing prefixed strings with :py:class:`Float`
+    and :py:func:`parse_many`
+
+    The cache is disabled by default. Enabling it helps when the same strings are parsed
+    repeatedly, such as when reloading configuration or ingesting logs.
+    Changing the size clears the cache.
+    """
+
+    if maxsize < 0:
+        raise ValueError('maxsize must be a non-negative integer, not %r' % (maxsize,))
+
+    PARSE_CACHE.maxsize = maxsize
+    PARSE_CACHE.clear()
+
+
+def _prefix_text(value):
+    """
+    Return value as a string if it could end in a prefix, otherwise :py:data:`None`
+    """
+
+    if isinstance(value, BASESTRING):
+        text = value
+    elif isinstance(value, bytes):
+        try:
+            text = value.decode('utf-8')
+        except UnicodeDecodeError:
+            return None
+    else:
+        return None
+
+    # Strings ending in a digit can't have a prefix
+    return None if text[-1:].isdigit() else text
+
+
+def _apply_prefix(value):
+    """
+    If value is a string ending in a known SI or IEC prefix, return the value as a float
+    Otherwise value is returned unchanged
+    """
+
+    text = _prefix_text(value)
+    if text is None:
+        return value
+
+    result = PARSE_CACHE(text) if PARSE_CACHE.maxsize else _parse_prefix(text)
+
+    return value if result is None else result
+
+
+# Results of math operations are already floats, so Float.__new__() is not needed
+_new = float.__new__
+
+
+# pylint: disable=super-with-arguments
+class Float(float):
+    """
+    Subclass of the built-in :py:class:`float` class
+
+    Key differences:
+
+    - When a math operation is performed with another real number type
+      (:py:class:`float`, :py:class:`int`), the result will be a
+      :py:class:`prefixed.Float` instance.
+
+    - Additional presentation types ``'h'``, ``'H'``, ``'k'``, ``'K'``,
+      ``'m'``, and ``'M'`` are supported for f-strings and :py:func:`format`.
+
+      +---------+-------------------------------------------------------------------+
+      | Type    | Meaning                                                           |
+      +=========+===================================================================+
+      | ``'h'`` | SI format. Outputs the number with closest divisible SI prefix.   |
+      |         | (k, M, G, ...)                                                    |
+      +---------+-------------------------------------------------------------------+
+      | ``'H'`` | Same as ``'h'`` with precision indicating significant digits.     |
+      +---------+-------------------------------------------------------------------+
+      | ``'k'`` | IEC Format. Outputs the number with closest divisible IEC prefix. |
+      |         | (Ki, Mi, Gi, ...)                                                 |
+      +---------+-------------------------------------------------------------------+
+      | ``'K'`` | Same as ``'k'`` with precision indicating significant digits.     |
+      +---------+-------------------------------------------------------------------+
+      | ``'m'`` | Short IEC Format. Same as ``'k'`` but only a single character.    |
+      |         | (K, M, G, ...)                                                    |
+      +---------+-------------------------------------------------------------------+
+      | ``'M'`` | Same as ``'m'`` with precision indicating significant digits.     |
+      +---------+-------------------------------------------------------------------+
+      |         |                                                                   |
+      +---------+-------------------------------------------------------------------+
+      | ``'j'`` | Alias for ``'k'`` - DEPRECATED                                    |
+      +---------+-------------------------------------------------------------------+
+      | ``'J'`` | Alias for ``'m'`` - DEPRECATED                                    |
+      +---------+-------------------------------------------------------------------+
+
+    - When initializing from strings, SI and IEC prefixes are honored
+
+      .. code-block:: python
+
+        >>> Float('2k')
+        Float(2000.0)
+
+        >>> Float('2Ki')
+        Float(2048.0)
+
+    - An additional format flag '!' is available which adds a space before the prefix
+
+      .. code-block:: python
+
+        >>> f'{Float(3250):!.2h}'
+        '3.25 k'
+
+    - When the ``'H'``, ``'K``, or ``'M'`` presentation types are used, precision is treated as
+      the number of significant digits to include. Standard rounding will occur for the final digit.
+
+      .. code-block:: python
+
+        >>> f'{Float(1246):.3h}'
+        '1.246k'
+
+        >>> f'{Float(1246):.3H}'
+        '1.25k'
+
+      By default, trailing zeros are removed.
+
+      .. code-block:: python
+
+        >>> f'{Float(1000):.3H}'
+        '1k'
+
+      To preserve trailing zeros, include the ``'#'`` flag.
+
+      .. code-block:: python
+
+        >>> f'{Float(1000):#.3H}'
+        '1.00k'
+
+    - An additional field, margin, can be specified which lowers or raises the threshold for
+      for each prefix by the given percentage.
+      Margin is specified before precision with the syntax  ``%[-]digit+``.
+
+      .. code-block:: python
+
+        >>> f'{Float(950):.2h}'
+        '950.00'
+
+        >>> f'{Float(950):%-5.2h}'
+        '0.95k'
+
+        >>> f'{Float(1000):%5.2h}'
+        '1000.00'
+
+        >>> f'{Float(1050):%5.2h}'
+        '1.05k'
+
+"""
+
+    __slots__ = ()
+
+    def __new__(cls, value=0.0):
+
+        try:
+            new = super(Float, cls).__new__(cls, _apply_prefix(value))
+        except ValueError:
+            raise_from_none(
+                ValueError('Could not convert %s to Float: %r' % (value.__class__.__name__, value))
+            )
+        except TypeError:
+            raise_from_none(
+                TypeError("Can't convert %s to Float: %r" % (value.__class__.__name__, value))
+            )
+
+        return new
+
+    def __repr__(self):
+
+        return 'Float(%s)' % super(Float, self).__repr__()
+
+    def __str__(self):
+        return str(float(self))
+
+    def __format__(self, format_spec):
+
+        # Use cached compiled format spec
+        return SPEC_CACHE(format_spec)(self)
+
+    def __abs__(self):
+        return _new(self.__class__, float.__abs__(self))
+
+    def __add__(self, value):
+        result = float.__add__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    if _compat.PY2:  # pragma: no cover
+        __div__ = _compat.div
+
+    def __divmod__(self, value):
+        result = float.__divmod__(self, value)
+        if result is NotImplemented:
+            return result
+        cls = self.__class__
+        return _new(cls, result[0]), _new(cls, result[1])
+
+    def __floordiv__(self, value):
+        result = float.__floordiv__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    def __mod__(self, value):
+        result = float.__mod__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    def __mul__(self, value):
+        result = float.__mul__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    def __neg__(self):
+        return _new(self.__class__, float.__neg__(self))
+
+    def __pos__(self):
+        return _new(self.__class__, float.__pos__(self))
+
+    def __pow__(self, value):
+        result = float.__pow__(self, value)
+        # Complex results are returned by float.__rpow__() instead
+        if result is NotImplemented or result.__class__ is complex:
+            return NotImplemented
+        return _new(self.__class__, result)
+
+    def __radd__(self, value):
+        result = float.__radd__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    if _compat.PY2:  # pragma: no cover
+        __rdiv__ = _compat.rdiv
+
+    def __rdivmod__(self, value):
+        result = float.__rdivmod__(self, value)
+        if result is NotImplemented:
+            return result
+        cls = self.__class__
+        return _new(cls, result[0]), _new(cls, result[1])
+
+    def __rfloordiv__(self, value):
+        result = float.__rfloordiv__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    def __rmod__(self, value):
+        result = float.__rmod__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    def __rmul__(self, value):
+        result = float.__rmul__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    def __rpow__(self, value):
+        result = float.__rpow__(self, value)
+        # Complex results are returned by float.__rpow__() instead
+        if result is NotImplemented or result.__class__ is complex:
+            return NotImplemented
+        return _new(self.__class__, result)
+
+    def __rsub__(self, value):
+        result = float.__rsub__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    def __rtruediv__(self, value):
+        result = float.__rtruediv__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    def __sub__(self, value):
+        result = float.__sub__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+    def __truediv__(self, value):
+        result = float.__truediv__(self, value)
+        return result if result is NotImplemented else _new(self.__class__, result)
+
+
+def parse_many(values, errors='raise', ndarray=False):
+    """
+    Args:
+        values(iterable): Strings (or numbers) to convert
+        errors(str): How to handle values which can't be converted
+        ndarray(bool): Return :py:class:`numpy.ndarray` instances instead of arrays
+
+    Returns:
+        :py:class:`array.array`: Array of type ``'d'`` with converted values
+
+    Convert many values using the same rules as :py:class:`Float`, including SI and IEC prefixes
+
+    Values of errors:
+
+    +--------------+----------------------------------------------------------------------------+
+    | ``'raise'``  | Raise :py:exc:`ValueError` or :py:exc:`TypeError` for the first invalid    |
+    |              | value (default)                                                            |
+    +--------------+----------------------------------------------------------------------------+
+    | ``'coerce'`` | Invalid values are converted to ``nan``                                    |
+    +--------------+----------------------------------------------------------------------------+
+    | ``'mask'``   | Same as ``'coerce'``, but a tuple of values and a mask are returned.       |
+    |              | The mask is an array of type ``'B'`` with 1 for each invalid value         |
+    +--------------+----------------------------------------------------------------------------+
+
+    .. code-block:: python
+
+        >>> parse_many(['2Ki', '3.5M', '12μ'])
+        array('d', [2048.0, 3500000.0, 1.2e-05])
+
+        >>> parse_many(['2Ki', 'bad'], errors='mask')
+        (array('d', [2048.0, nan]), array('B', [0, 1]))
+
+    When ndarray is :py:data:`True`, the values are returned as a float64
+    :py:class:`numpy.ndarray` and the mask as a boolean :py:class:`numpy.ndarray`.
+    This requires `NumPy <https://numpy.org>`_.
+    """
+
+    if errors not in {'raise', 'coerce', 'mask'}:
+        raise ValueError("errors must be 'raise', 'coerce', or 'mask', not %r" % (errors,))
+
+    output = array('d')
+    append = output.append
+    invalid = []
+
+    for index, value in enumerate(values):
+        try:
+            append(float(_apply_prefix(value)))
+        except (TypeError, ValueError) as exc:
+            if errors == 'raise':
+                raise_from_none(exc.__class__('Could not convert %s to Float at index %d: %r' %
+                                              (value.__class__.__name__, index, value)))
+            append(NAN)
+            invalid.append(index)
+
+    if errors == 'mask':
+        mask = array('B', [0]) * len(output)
+        for index in invalid:
+            mask[index] = 1
+
+    if ndarray:
+        import numpy  # pylint: disable=import-outside-toplevel
+        output = numpy.frombuffer(output, dtype=numpy.float64)
+        if errors == 'mask':
+            mask = numpy.frombuffer(mask, dtype=numpy.uint8).view(numpy.bool_)
+
+    if errors == 'mask':
+        return output, mask
+
+    return output
@@ -0,0 +1,742 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed formatter**
+
+Compiled format specifications used by :py:class:`prefixed.Float` and the bulk interfaces
+"""
+
+from array import array
+from bisect import bisect_right
+from collections import namedtuple
+from decimal import ROUND_HALF_EVEN, Decimal, localcontext
+from fractions import Fraction
+from math import floor, log10
+import re
+
+from prefixed import _compat
+from prefixed._common import (COLUMN_STRATEGIES, DEPRECATED, IEC_PREFIXES, INF, PREFIX_MAGNITUDE,
+                              PREFIX_TYPES, RE_FORMAT_SPEC, SI_LARGE, SI_SMALL, SI_SMALLEST,
+                              SPEC_CACHE_SIZE, THRESHOLD_TOLERANCE, _BoundedCache)
+
+
+# Float format spec as composed by Formatter._float_spec()
+RE_FLOAT_SPEC = re.compile(
+    r'(?P<fill_align>.?[<>=^])?(?P<sign>[-+ ])?(?P<alt>#)?(?P<zero>0)?(?P<width>\d+)?'
+    r'(?P<grouping>[,_])?(?P<precision>\.\d+)?f$'
+)
+
+# Parsed format specification
+# margin is stored as a multiplication factor and precision as an integer (or None)
+FormatSpec = namedtuple(
+    'FormatSpec',
+    ('fill', 'align', 'sign', 'alt', 'zero', 'prefix_space',
+     'width', 'grouping', 'margin', 'precision', 'type')
+)
+
+
+def _parse_format_spec(format_spec):
+    """
+    Parse a format specification into a FormatSpec instance
+    Raises ValueError if the specification is invalid
+    """
+
+    match = RE_FORMAT_SPEC.match(format_spec)
+    if match is None:
+        raise ValueError('Invalid format specifier')
+
+    spec = match.groupdict()
+
+    # Handle deprecated spec types
+    if spec['type'] in DEPRECATED:
+        spec['type'] = DEPRECATED[spec['type']]
+
+    spec['margin'] = 1.0 if spec['margin'] is None else (100.0 + float(spec['margin'])) / 100.0
+    spec['precision'] = None if spec['precision'] is None else int(spec['precision'])
+
+    return FormatSpec(**spec)
+
+
+def _thresholds(key):
+    """
+    Args:
+        key(tuple): magnitudes, margin, precision
+
+    Returns:
+        tuple: Lowest absolute value for each magnitude
+
+    Values at or above a threshold are approximately those which still round to a nonzero
+    quotient when divided by the magnitude and margin.
+    Float division and rounding may shift the exact boundary slightly,
+    so results are only used to select a candidate which is then verified.
+    """
+
+    magnitudes, margin, precision = key
+    factor = abs(margin) * (1.0 - 0.5 * 10.0 ** -precision)
+
+    return tuple(magnitude * factor for magnitude in magnitudes)
+
+
+# Thresholds are shared by all specs with the same prefix table, margin, and precision
+THRESHOLD_CACHE = _BoundedCache(_thresholds, SPEC_CACHE_SIZE)
+
+
+# Prefix table entry
+# magnitude is 0 when no prefix is applied
+# spec is the float format spec used for the scaled value
+# For significant digit types, spec is incomplete and precision is added when formatting
+_PrefixEntry = namedtuple('_PrefixEntry', ('magnitude', 'prefix', 'spec'))
+
+
+# Fixed point format specs by number of decimals
+FIXED_SPECS = tuple('.%df' % decimals for decimals in range(32))
+
+# round() rounds halfway values to even like float formatting, except Python 2 rounds away from 0
+ROUND_TIES_TO_EVEN = not _compat.PY2
+
+
+def _sig_ranges(precision):
+    """
+    Ranges of scaled values for which significant digits can be formatted with a single rounding
+
+    Formatter._render() rounds values of 1 or more to precision + 1 decimals before rounding
+    to the number of significant digits. The result only differs from a single rounding when
+    the digits after the significant digits are within half a unit of the last place of a tie.
+    For each number of integer digits, returns a tuple of the lowest value, the highest value
+    that can't round up to the next power of 10, decimals, the scale to bring the last
+    significant digit to the ones place, and the window around ties which must be rounded twice.
+
+    Limited to precision of 10 or less so floating point error is negligible
+    """
+
+    if precision > 10:
+        return ()
+
+    return tuple(
+        (10.0 ** digits, 10.0 ** (digits + 1) - 10.0 ** -(precision + 1),
+         precision - digits - 1, 10.0 ** (precision - digits - 1), 10.0 ** -(digits + 2))
+        for digits in range(min(precision, 3))
+    )
+
+
+def _exact(magnitude):
+    """
+    Exact value of a magnitude, SI magnitudes are floats and may not be exact
+    """
+
+    return Fraction(repr(magnitude)) if isinstance(magnitude, float) else magnitude
+
+
+class Formatter(object):  # pylint: disable=too-many-instance-attributes
+    """
+    Args:
+        format_spec(str): Format specification
+
+    Precompiled format specification
+
+    The format specification is validated and compiled once, so values can be formatted
+    without parsing the specification or rebuilding prefixes for every value.
+    Output is identical to ``format(Float(value), format_spec)``.
+
+    .. code-block:: python
+
+        >>> formatter = Formatter('!.3H')
+
+        >>> formatter(1246)
+        '1.25 k'
+
+        >>> formatter.format_many([1246, 2.5e6])
+        ['1.25 k', '2.5 M']
+
+    Raises :py:exc:`ValueError` if the format specification is invalid
+    """
+
+    __slots__ = ('format_spec', 'spec', '_native', '_sig_digits', '_sig_precision', '_trim',
+                 '_margin', '_precision', '_large', '_small', '_smallest', '_unscaled',
+                 '_large_thresholds', '_small_thresholds', '_int_magnitudes', '_int_thresholds',
+                 '_sig_ranges', '_sign', '_sign_aware', '_text_specs')
+
+    def __init__(self, format_spec):
+
+        self.format_spec = format_spec
+        self.spec = spec = _parse_format_spec(format_spec)
+
+        # Exact values for integers, created when first needed
+        self._int_magnitudes = self._int_thresholds = None
+
+        # If not a spec we handle, use float.__format__()
+        self._native = spec.type not in PREFIX_TYPES
+        if self._native:
+            return
+
+        self._sig_digits = spec.type in 'HKM'
+        self._sig_precision = spec.precision or 6
+        self._trim = not spec.alt
+        self._margin = spec.margin
+        self._sig_ranges = _sig_ranges(self._sig_precision) if self._sig_digits else ()
+
+        # Precision used for rounding when selecting prefix
+        self._precision = 6 if spec.precision is None else spec.precision
+
+        if spec.type in 'hH':
+            large, small = SI_LARGE, SI_SMALL
+        else:
+            large, small = IEC_PREFIXES, {}
+
+        self._large = tuple(self._entry(magnitude, prefix) for magnitude, prefix in large.items())
+        self._small = tuple(self._entry(magnitude, prefix) for magnitude, prefix in small.items())
+
+        self._large_thresholds = THRESHOLD_CACHE(
+            (tuple(large), spec.margin, self._precision)
+        )
+        self._small_thresholds = THRESHOLD_CACHE(
+            (tuple(small), spec.margin, self._precision)
+        )
+
+        # Values below the smallest SI prefix still use it
+        self._smallest = SI_SMALLEST * spec.margin if self._small else 0
+
+        self._unscaled = _PrefixEntry(
+            0, ' ' if spec.prefix_space == '!' else '', self._float_spec(spec.width)
+        )
+
+        # Sign, fill, alignment, and width are applied to significant digits as text
+        # Grouping and widths too narrow for a prefix still format the number again
+        # Zero flag is the default fill and alignment, but explicit values take precedence
+        self._sign = spec.sign if spec.sign in ('+', ' ') else ''
+        self._sign_aware = (spec.align or ('=' if spec.zero else '>')) == '='
+        self._text_specs = None
+        if self._sig_digits and spec.grouping is None and \
+           (spec.width is None or
+                int(spec.width) > max(len(entry.prefix) for entry in self._large + self._small)):
+            self._text_specs = self._compile_text_specs()
+
+    def _compile_text_specs(self):
+        """
+        String format specs for padding formatted text, keyed by prefix
+
+        Each value is a tuple of specs for text without and with a sign character.
+        For sign-aware padding ('=' alignment), the sign is added after padding the digits.
+        """
+
+        spec = self.spec
+        fill = spec.fill or ('0' if spec.zero else ' ')
+        align = '>' if self._sign_aware else spec.align or '>'
+
+        text_specs = {}
+        for entry in self._large + self._small + (self._unscaled,):
+            if spec.width is None:
+                text_specs[entry.prefix] = ('', '')
+                continue
+
+            # Prefix is included in the width, except for unscaled values
+            width = int(spec.width) - (0 if entry is self._unscaled else len(entry.prefix))
+            text_specs[entry.prefix] = tuple(
+                '%s%s%s' % (fill, align, width - sign_width if width > sign_width else '')
+                for sign_width in ((0, 1) if self._sign_aware else (0, 0))
+            )
+
+        return text_specs
+
+    def __repr__(self):
+
+        return '%s(%r)' % (self.__class__.__name__, self.format_spec)
+
+    def _float_spec(self, width):
+        """
+        Compose float format spec using the given width
+        """
+
+        spec = self.spec
+        fields = (spec.fill, spec.align, spec.sign,
+                  # Trailing decimals are handled separately for significant digits
+                  None if self._sig_digits else spec.alt,
+                  spec.zero, width, spec.grouping)
+        float_spec = ''.join(field for field in fields if field is not None)
+
+        if self._sig_digits:
+            return float_spec
+
+        if spec.precision is None:
+            return float_spec + 'f'
+
+        return '%s.%if' % (float_spec, spec.precision)
+
+    def _entry(self, magnitude, prefix):
+        """
+        Create prefix table entry for the given magnitude
+        """
+
+        spec = self.spec
+        prefix = '%s%s%s' % ('' if spec.prefix_space is None else ' ',
+                             prefix,
+                             'i' if spec.type in 'kK' else '')
+
+        width = spec.width
+        if width is not None and int(width):
+            width = str(int(width) - len(prefix))
+
+        return _PrefixEntry(magnitude, prefix, self._float_spec(width))
+
+    def _convert(self, value):
+        """
+        Convert value to scaled value, prefix entry pair
+        """
+
+        absolute_value = abs(value)
+
+        # Infinity and NaN are never scaled
+        if not absolute_value < INF:
+            return value, self._unscaled
+
+        if absolute_value >= 1.0:
+            entries = self._large
+            thresholds = self._large_thresholds
+        else:
+            entries = self._small
+            thresholds = self._small_thresholds
+
+        if not entries:
+            return value, self._unscaled
+
+        # Select candidate, then correct for variance at the boundaries
+        # Only values near a threshold need to be checked against the rounding rule
+        # Round here to avoid cases like 1000K
+        margin = self._margin
+        precision = self._precision
+        index = bisect_right(thresholds, absolute_value) - 1
+        tolerance = absolute_value * THRESHOLD_TOLERANCE
+
+        # A margin of -100% is always checked so division errors are raised consistently
+        if index + 1 < len(entries) and \
+           (thresholds[index + 1] - absolute_value <= tolerance or not margin) and \
+           int(round(absolute_value / (entries[index + 1].magnitude * margin), precision)):
+            index += 1
+        elif index >= 0 and \
+                (absolute_value - thresholds[index] <= tolerance or not margin) and \
+                not int(round(absolute_value / (entries[index].magnitude * margin), precision)):
+            index -= 1
+
+        if index >= 0:
+            entry = entries[index]
+        elif 0 < absolute_value < self._smallest:
+            # Values below the smallest SI prefix still use it
+            entry = entries[0]
+        else:
+            return value, self._unscaled
+
+        return value / entry.magnitude, entry
+
+    def __call__(self, value):
+
+        value = float(value)
+
+        if self._native:
+            return value.__format__(self.format_spec)
+
+        value, entry = self._convert(value)
+        return self._render(value, entry)
+
+    def _render(self, value, entry):
+        """
+        Format scaled value with the given prefix entry
+        """
+
+        _, prefix, spec = entry
+
+        if not self._sig_digits:
+            return '%s%s' % (format(value, spec), prefix)
+
+        if not -INF < value < INF:
+            return '%s%s' % (format(value, spec + 'f'), prefix)
+
+        # Significant digits
+        # Values are rounded twice, first to limit floating point variance,
+        # then to the number of significant digits as determined by the rounded value
+        absolute_value = value if value >= 0 else -value
+
+        # Fast path, see _sig_ranges()
+        text = None
+        for low, high, decimals, scale, window in self._sig_ranges:
+            if absolute_value < high:
+                if absolute_value >= low and \
+                   (value < 0 and ROUND_TIES_TO_EVEN or abs(value * scale % 1.0 - 0.5) > window):
+                    text = format(value, FIXED_SPECS[decimals])
+                break
+
+        if text is None:
+            precision = self._sig_precision
+            if value >= 1:
+                value = round(value, precision + 1)
+
+            # In Python 2.7, floor sometimes returns a float, so coerce with int
+            int_digits = 1 if value == 0.0 else int(floor(log10(abs(value)))) + 1
+            decimals = precision - int_digits
+
+            # Rounding to decimals and formatting with the same decimals produces the same
+            # string as formatting directly, as long as the result is exact in a float
+            if decimals < 0 or precision > 14 or not ROUND_TIES_TO_EVEN:
+                value = round(value, decimals)
+                decimals = max(0, decimals)
+
+            text = format(value, FIXED_SPECS[decimals] if decimals < len(FIXED_SPECS)
+                          else '.%df' % decimals)
+
+        # Remove trailing zeros unless alternate form was requested
+        # Trailing digits are zeros, so fewer decimals don't change the remaining digits
+        if decimals and self._trim:
+            decimals -= len(text)
+            text = text.rstrip('0')
+            decimals += len(text)
+            if not decimals:
+                text = text[:-1]
+
+        if not spec:
+            return text + prefix
+
+        if self._text_specs is None:
+            return '%s%s' % (format(value, '%s.%df' % (spec, decimals)), prefix)
+
+        if text[0] == '-':
+            sign, text = '-', text[1:]
+        else:
+            sign = self._sign
+
+        if self._sign_aware:
+            return sign + format(text, self._text_specs[prefix][len(sign)]) + prefix
+
+        return format(sign + text, self._text_specs[prefix][0]) + prefix
+
+    def format_int(self, value):
+        """
+        Args:
+            value(int): Integer to format
+
+        Returns:
+            str: Formatted string
+
+        Format an integer without converting it to a float
+
+        Prefixes are selected and values are rounded with exact integer arithmetic,
+        so integers above ``2**53`` keep all their digits. Exact rounding means results
+        for values exactly halfway between two outputs may differ from :py:class:`Float`,
+        which rounds the nearest float instead.
+        """
+
+        value = int(value)
+
+        if self._native:
+            return format(value, self.format_spec)
+
+        # A margin of -100% raises the same error as for floats
+        if not self._margin:
+            return self(value)
+
+        entry, magnitude = self._int_entry(abs(value))
+        _, prefix, spec = entry
+
+        # Exact quotient, magnitudes are powers of 10 or 2
+        if magnitude % 10:
+            exponent = magnitude.bit_length() - 1
+            value *= 5 ** exponent
+        else:
+            exponent = len(str(magnitude)) - 1
+
+        scaled = Decimal('%de-%d' % (value, exponent))
+
+        with localcontext() as context:
+            context.prec = len(scaled.as_tuple().digits) + self._sig_precision + self._precision
+            context.rounding = ROUND_HALF_EVEN
+
+            if self._sig_digits:
+                precision = self._sig_precision
+                int_digits = scaled.adjusted() + 1 if scaled else 1
+                scaled = scaled.quantize(Decimal(1).scaleb(int_digits - precision))
+                precision = max(0, precision - int_digits)
+
+                # Remove trailing zeros unless alternate form was requested
+                if precision and self._trim:
+                    preformat = format(scaled, '.%df' % precision)
+                    precision -= (len(preformat) - len(preformat.rstrip('0')))
+
+                spec = '%s.%if' % (spec, precision)
+
+            else:
+                scaled = scaled.quantize(Decimal(1).scaleb(-self._precision))
+
+            # Floats hold 15 significant digits exactly and support all format options
+            if len(scaled.as_tuple().digits) <= 15:
+                return '%s%s' % (format(float(scaled), spec), prefix)
+
+            return '%s%s' % (_format_decimal(scaled, spec), prefix)
+
+    def _int_entry(self, absolute_value):
+        """
+        Select prefix table entry and exact magnitude for an integer
+        """
+
+        entries = self._large
+        magnitudes = self._int_magnitudes
+        thresholds = self._int_thresholds
+
+        if magnitudes is None:
+            magnitudes = self._int_magnitudes = tuple(
+                int(_exact(entry.magnitude)) for entry in entries
+            )
+            # Same rounding rule as _thresholds(), but exact
+            factor = _exact(abs(self._margin)) * (1 - Fraction(1, 2 * 10 ** self._precision))
+            thresholds = self._int_thresholds = tuple(
+                magnitude * factor for magnitude in magnitudes
+            )
+
+        if not absolute_value or not entries:
+            return self._unscaled, 1
+
+        # Candidate from number of digits or bits, then correct for margin and rounding
+        if self.spec.type in 'hH':
+            index = (len(str(absolute_value)) - 1) // 3 - 1
+        else:
+            index = (absolute_value.bit_length() - 1) // 10 - 1
+        index = min(index, len(entries) - 1)
+
+        # Halfway values round to even, so with no decimals the threshold itself rounds to 0
+        if self._precision:
+            while index + 1 < len(entries) and absolute_value >= thresholds[index + 1]:
+                index += 1
+            while index >= 0 and absolute_value < thresholds[index]:
+                index -= 1
+        else:
+            while index + 1 < len(entries) and absolute_value > thresholds[index + 1]:
+                index += 1
+            while index >= 0 and absolute_value <= thresholds[index]:
+                index -= 1
+
+        if index < 0:
+            return self._unscaled, 1
+
+        return entries[index], magnitudes[index]
+
+    def format_many(self, values):
+        """
+        Args:
+            values(iterable): Numbers to format
+
+        Returns:
+            list: Formatted strings in the same order as values
+        """
+
+        return [self(value) for value in values]
+
+    @property
+    def prefixes(self):
+        """
+        Prefixes which can be selected by this format spec, the last is ``''`` for no prefix
+
+        Used to interpret indices returned by :py:meth:`split_many`
+        """
+
+        if self._native:
+            return ('',)
+
+        return tuple(entry.prefix.strip() for entry in self._small + self._large) + ('',)
+
+    def split(self, value):
+        """
+        Args:
+            value: Number to split
+
+        Returns:
+            tuple: Scaled value and prefix
+
+        Scaled value and prefix which would be formatted, without building a string.
+        The scaled value is not rounded.
+
+        For presentation types without prefixes, the value is returned with an empty prefix
+        """
+
+        value = float(value)
+
+        if self._native:
+            return value, ''
+
+        value, entry = self._convert(value)
+        return value, entry.prefix.strip()
+
+    def split_many(self, values, ndarray=False):
+        """
+        Args:
+            values(iterable): Numbers to split
+            ndarray(bool): Use NumPy for vectorized conversion and return
+                :py:class:`numpy.ndarray` instances instead of arrays
+
+        Returns:
+            tuple: Scaled values, prefix indices, and prefixes
+
+        Scaled values are an array of type ``'d'`` and prefix indices are an array of type
+        ``'B'`` indexing into :py:attr:`prefixes`. When ndarray is :py:data:`True`, these are
+        float64 and uint8 :py:class:`numpy.ndarray` instances with the same shape as values.
+        """
+
+        prefixes = self.prefixes
+
+        if ndarray:
+            import numpy  # pylint: disable=import-outside-toplevel
+
+            values = numpy.asarray(values, dtype=numpy.float64)
+            if self._native:
+                return values.copy(), numpy.zeros(values.shape, dtype=numpy.uint8), prefixes
+
+            # pylint: disable-next=import-outside-toplevel
+            from prefixed._numpy import split as _split
+
+            scaled, indices, _ = _split(self, values.ravel())
+            return (scaled.reshape(values.shape),
+                    indices.astype(numpy.uint8).reshape(values.shape), prefixes)
+
+        if self._native:
+            scaled = array('d', values)
+            return scaled, array('B', [0]) * len(scaled), prefixes
+
+        positions = {entry: index
+                     for index, entry in enumerate(self._small + self._large + (self._unscaled,))}
+        scaled = array('d')
+        indices = array('B')
+        convert = self._convert
+
+        for value in values:
+            value, entry = convert(float(value))
+            scaled.append(value)
+            indices.append(positions[entry])
+
+        return scaled, indices, prefixes
+
+    def column_entry(self, magnitude):
+        """
+        Args:
+            magnitude: Magnitude as a number (``1e6``, ``2**20``) or prefix (``'M'``, ``'Mi'``)
+
+        Returns:
+            Prefix table entry for magnitude
+            :py:data:`None` for presentation types without prefixes
+
+        Raises :py:exc:`ValueError` if magnitude isn't valid for the presentation type
+        """
+
+        if self._native:
+            return None
+
+        if magnitude in (1, ''):
+            return self._unscaled
+
+        # Either micro symbol, as text or, on Python 2, encoded bytes
+        if PREFIX_MAGNITUDE.get(magnitude) == 1e-6:
+            magnitude = 1e-6
+
+        for entry in self._small + self._large:
+            prefix = entry.prefix.strip()
+            if magnitude in (entry.magnitude, prefix, prefix.rstrip('i')):
+                return entry
+
+        raise ValueError('Invalid magnitude for %r: %r' % (self.format_spec, magnitude))
+
+    def format_column(self, values, strategy='max', magnitude=None):
+        """
+        Args:
+            values(iterable): Numbers to format
+            strategy(str): Statistic used to select magnitude, ``'max'``, ``'median'``, or ``'min'``
+            magnitude: Magnitude to use, see :py:meth:`column_entry`
+
+        Returns:
+            generator: Formatted strings in the same order as values
+
+        Format values with a single shared prefix
+
+        When magnitude is not given, values must be a collection and all values are formatted
+        before the first string is returned. The magnitude is selected from the maximum, median,
+        or minimum of the absolute values of the finite, nonzero values, using the same rules as
+        a single value. Output is right-aligned to the width of the longest string.
+
+        When magnitude is given, values are iterated once and no padding is added
+        beyond the width in the format spec, so columns of any length can be streamed.
+
+        Infinity and NaN are formatted without a prefix.
+        Presentation types without prefixes are formatted individually without padding.
+        """
+
+        if strategy not in COLUMN_STRATEGIES:
+            raise ValueError("strategy must be 'max', 'median', or 'min', not %r" % (strategy,))
+
+        if magnitude is not None or self._native:
+            return self._format_column(values, self.column_entry(magnitude))
+
+        if iter(values) is values:
+            raise TypeError('values must be a re-iterable collection when magnitude is not given')
+
+        floats = array('d', (float(value) for value in values))
+        finite = sorted(abs(value) for value in floats if 0 < abs(value) < INF)
+
+        if not finite:
+            entry = self._unscaled
+        elif strategy == 'max':
+            entry = self._convert(finite[-1])[1]
+        elif strategy == 'min':
+            entry = self._convert(finite[0])[1]
+        else:
+            entry = self._convert(finite[len(finite) // 2])[1]
+
+        # Trimmed trailing zeros and signs vary by value, so pad to the longest string
+        cells = list(self._format_column(floats, entry))
+        width = max(len(cell) for cell in cells) if cells else 0
+
+        return (cell.rjust(width) for cell in cells)
+
+    def _format_column(self, values, entry):
+        """
+        Generator for format_column()
+        """
+
+        if self._native:
+            for value in values:
+                yield self(value)
+            return
+
+        render = self._render
+        magnitude = entry.magnitude or 1.0
+
+        for value in values:
+            value = float(value)
+            if -INF < value < INF:
+                yield render(value / magnitude, entry)
+            else:
+                yield render(value, self._unscaled)
+
+
+SPEC_CACHE = _BoundedCache(Formatter, SPEC_CACHE_SIZE)
+
+
+def _format_decimal(value, format_spec):
+    """
+    Format a decimal with a float format spec
+
+    Decimal.__format__() doesn't support '_' for grouping or the '#' flag.
+    '_' is substituted after formatting and '#' only changes output when precision is 0,
+    in which case the decimal point is added before padding.
+    """
+
+    fields = RE_FLOAT_SPEC.match(format_spec).groupdict('')
+    grouping = fields['grouping'] and ','
+
+    if fields['alt'] and fields['precision'] == '.0':
+        text = format(value, '%s%s.0f' % (fields['sign'], grouping)) + '.'
+        if fields['width']:
+            text = format(text, '%s%s' % (fields['fill_align'].replace('=', '>') or '>',
+                                          fields['width']))
+    else:
+        text = format(value, '%(fill_align)s%(sign)s%(zero)s%(width)s' % fields +
+                      '%s%sf' % (grouping, fields['precision']))
+
+    return text.replace(',', '_') if fields['grouping'] == '_' else text
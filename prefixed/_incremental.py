@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed incremental formatting**
+
+Formatting for frequently changing values with :py:class:`prefixed.IncrementalFormatter`
+"""
+
+from math import floor, log10
+
+from prefixed._common import INF, THRESHOLD_TOLERANCE
+from prefixed._formatter import SPEC_CACHE
+
+
+class IncrementalFormatter(object):
+    """
+    Args:
+        format_spec(str): Format specification
+
+    Formatter for a value which changes frequently, but is displayed infrequently,
+    such as a counter in a progress bar
+
+    After formatting a value, the range of values which produce the same output is stored.
+    While updated values remain in that range, the previous result is returned
+    without formatting again.
+    Output is identical to ``format(Float(value), format_spec)``.
+
+    .. code-block:: python
+
+        >>> counter = IncrementalFormatter('.1h')
+
+        >>> counter.update(1520)
+        ('1.5k', True)
+
+        >>> counter.update(1530)
+        ('1.5k', False)
+
+        >>> counter(1560)
+        '1.6k'
+
+    Raises :py:exc:`ValueError` if the format specification is invalid
+    """
+
+    __slots__ = ('formatter', 'result', '_low', '_high')
+
+    def __init__(self, format_spec):
+
+        self.formatter = SPEC_CACHE(format_spec)
+        self.result = None
+
+        # Values between low and high (exclusive) produce result
+        self._low = self._high = 0.0
+
+    def __repr__(self):
+
+        return '%s(%r)' % (self.__class__.__name__, self.formatter.format_spec)
+
+    def __call__(self, value):
+
+        return self.update(value)[0]
+
+    def update(self, value):
+        """
+        Args:
+            value: Number to format
+
+        Returns:
+            tuple: Formatted string and :py:data:`True` if it differs from the previous result
+        """
+
+        value = float(value)
+        if self._low < value < self._high:
+            return self.result, False
+
+        formatter = self.formatter
+        if formatter._native:  # pylint: disable=protected-access
+            result = formatter(value)
+            self._low = self._high = 0.0
+        else:
+            scaled, entry = formatter._convert(value)  # pylint: disable=protected-access
+            result = formatter._render(scaled, entry)  # pylint: disable=protected-access
+            self._low, self._high = self._interval(value, scaled, entry)
+
+        changed = result != self.result
+        self.result = result
+
+        return result, changed
+
+    def _prefix_interval(self, absolute_value, entry):
+        """
+        Range of absolute values which select the same prefix entry
+        """
+
+        # pylint: disable=protected-access
+        formatter = self.formatter
+        if absolute_value >= 1.0:
+            entries, thresholds, ceiling = formatter._large, formatter._large_thresholds, INF
+        else:
+            entries, thresholds, ceiling = formatter._small, formatter._small_thresholds, 1.0
+
+        if entry.magnitude:
+            index = entries.index(entry)
+            return thresholds[index], thresholds[index + 1] if index + 1 < len(entries) else ceiling
+
+        if absolute_value >= 1.0:
+            return 1.0, thresholds[0] if entries else INF
+
+        # Unscaled values below 1.0 share a range only when there are no small prefixes
+        return (0.0, 1.0) if not entries else (0.0, 0.0)
+
+    def _interval(self, value, scaled, entry):
+        """
+        Determine a range around value which produces the same output
+
+        The range is conservative, values near the edges are formatted again.
+        An empty range is returned when a range can't be determined reliably.
+        """
+
+        # pylint: disable=protected-access
+        formatter = self.formatter
+        absolute_value = abs(value)
+
+        # Zero is excluded so the sign of zero is always honored
+        if not 0.0 < absolute_value < INF or not formatter._margin:
+            return 0.0, 0.0
+
+        low, high = self._prefix_interval(absolute_value, entry)
+        if not high:
+            return 0.0, 0.0
+
+        # Stay clear of the band checked against the rounding rule in Formatter._convert()
+        low *= 1.0 + 4 * THRESHOLD_TOLERANCE
+        high *= 1.0 - 4 * THRESHOLD_TOLERANCE
+
+        # Range of scaled values which round to the same digits
+        scaled = abs(scaled)
+        if formatter._sig_digits:
+            int_digits = int(floor(log10(scaled))) + 1
+            quantum = 10.0 ** (int_digits - formatter._sig_precision)
+
+            # The number of integer digits must not change either
+            # Edges are also clear of rounding applied before counting digits
+            low_scaled = 10.0 ** (int_digits - 1) + quantum / 8
+            high_scaled = 10.0 ** int_digits - quantum / 8
+        else:
+            quantum = 10.0 ** -formatter._precision
+            low_scaled, high_scaled = 0.0, INF
+
+        # Floating point error must be insignificant compared to the rounding step
+        # The step underflows to zero for subnormal values
+        if not quantum or quantum < scaled * 2.0 ** -36:
+            return 0.0, 0.0
+
+        step = round(scaled / quantum)
+        low_scaled = max(low_scaled, (step - 0.375) * quantum)
+        high_scaled = min(high_scaled, (step + 0.375) * quantum)
+
+        magnitude = entry.magnitude or 1.0
+        low = max(low, low_scaled * magnitude)
+        high = min(high, high_scaled * magnitude)
+
+        if not low < absolute_value < high:
+            return 0.0, 0.0
+
+        return (low, high) if value > 0 else (-high, -low)
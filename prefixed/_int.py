@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed integers**
+
+Exact integer formatting and parsing with :py:class:`prefixed.Int`
+"""
+
+from fractions import Fraction
+
+from prefixed import _compat
+from prefixed._compat import raise_from_none
+from prefixed._common import _split_prefix
+from prefixed._float import Float, _new, _prefix_text
+from prefixed._formatter import SPEC_CACHE, _exact
+
+
+def _apply_int_prefix(value):
+    """
+    If value is a string ending in a known SI or IEC prefix, return the value as an integer
+    Otherwise value is returned unchanged
+
+    Raises :py:exc:`ValueError` if the value with the prefix is not an integer
+    """
+
+    text = _prefix_text(value)
+    split = None if text is None else _split_prefix(text)
+    if split is None:
+        return value
+
+    result = Fraction(split[0]) * _exact(split[1])
+    if result.denominator != 1:
+        raise ValueError('Not an integer: %r' % (value,))
+
+    return result.numerator
+
+
+# Results of integer math operations are already integers, so Int.__new__() is not needed
+_new_int = _compat.INTEGER.__new__
+_int = _compat.INTEGER
+
+
+class Int(_int):
+    """
+    Subclass of the built-in :py:class:`int` class
+
+    Supports the same presentation types and prefixed strings as :py:class:`Float`,
+    but prefixes are selected and values are rounded with exact integer arithmetic,
+    so integers larger than ``2**53`` are formatted without loss of precision.
+
+    .. code-block:: python
+
+        >>> f'{Int(12345678901234567891):.15h}'
+        '12.345678901234568E'
+
+        >>> f'{Float(12345678901234567891):.15h}'
+        '12.345678901234567E'
+
+        >>> Int('1.5Ki')
+        Int(1536)
+
+        >>> Int('2.5k') * 3
+        Int(7500)
+
+    - Prefixed strings must represent an integer, ``Int('1.5')`` and ``Int('1m')``
+      raise :py:exc:`ValueError`.
+
+    - When a math operation with another integer results in an integer,
+      the result is an :py:class:`Int` instance. True division results in a :py:class:`Float`.
+
+    - Values exactly halfway between two outputs are rounded to even,
+      so output may differ from :py:class:`Float` for these values.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value=0, base=None):
+
+        try:
+            if base is None:
+                new = super(Int, cls).__new__(cls, _apply_int_prefix(value))
+            else:
+                new = super(Int, cls).__new__(cls, value, base)
+        except ValueError:
+            raise_from_none(
+                ValueError('Could not convert %s to Int: %r' % (value.__class__.__name__, value))
+            )
+        except TypeError:
+            raise_from_none(
+                TypeError("Can't convert %s to Int: %r" % (value.__class__.__name__, value))
+            )
+
+        return new
+
+    def __repr__(self):
+
+        return 'Int(%s)' % self
+
+    def __str__(self):
+        return str(_int(self))
+
+    def __format__(self, format_spec):
+
+        # Use cached compiled format spec
+        return SPEC_CACHE(format_spec).format_int(self)
+
+    def __abs__(self):
+        return _new_int(self.__class__, _int.__abs__(self))
+
+    def __add__(self, value):
+        result = _int.__add__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __and__(self, value):
+        result = _int.__and__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    if _compat.PY2:  # pragma: no cover
+        def __div__(self, value):
+            return self.__floordiv__(value)
+
+    def __divmod__(self, value):
+        result = _int.__divmod__(self, value)
+        if result is NotImplemented:
+            return result
+        cls = self.__class__
+        return _new_int(cls, result[0]), _new_int(cls, result[1])
+
+    def __floordiv__(self, value):
+        result = _int.__floordiv__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __invert__(self):
+        return _new_int(self.__class__, _int.__invert__(self))
+
+    def __lshift__(self, value):
+        result = _int.__lshift__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __mod__(self, value):
+        result = _int.__mod__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __mul__(self, value):
+        result = _int.__mul__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __neg__(self):
+        return _new_int(self.__class__, _int.__neg__(self))
+
+    def __or__(self, value):
+        result = _int.__or__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __pos__(self):
+        return _new_int(self.__class__, _int.__pos__(self))
+
+    def __pow__(self, value, modulo=None):
+        result = _int.__pow__(self, value, modulo)
+        if result is NotImplemented:
+            return result
+        # Negative exponents result in floats
+        if isinstance(result, float):
+            return _new(Float, result)
+        return _new_int(self.__class__, result)
+
+    def __radd__(self, value):
+        result = _int.__radd__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __rand__(self, value):
+        result = _int.__rand__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    if _compat.PY2:  # pragma: no cover
+        def __rdiv__(self, value):
+            return self.__rfloordiv__(value)
+
+    def __rdivmod__(self, value):
+        result = _int.__rdivmod__(self, value)
+        if result is NotImplemented:
+            return result
+        cls = self.__class__
+        return _new_int(cls, result[0]), _new_int(cls, result[1])
+
+    def __rfloordiv__(self, value):
+        result = _int.__rfloordiv__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __rlshift__(self, value):
+        result = _int.__rlshift__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __rmod__(self, value):
+        result = _int.__rmod__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __rmul__(self, value):
+        result = _int.__rmul__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __ror__(self, value):
+        result = _int.__ror__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __rpow__(self, value):
+        result = _int.__rpow__(self, value)
+        if result is NotImplemented:
+            return result
+        # Negative exponents result in floats
+        if isinstance(result, float):
+            return _new(Float, result)
+        return _new_int(self.__class__, result)
+
+    def __rrshift__(self, value):
+        result = _int.__rrshift__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __rshift__(self, value):
+        result = _int.__rshift__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __rsub__(self, value):
+        result = _int.__rsub__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __rtruediv__(self, value):
+        result = _int.__rtruediv__(self, value)
+        return result if result is NotImplemented else _new(Float, result)
+
+    def __rxor__(self, value):
+        result = _int.__rxor__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __sub__(self, value):
+        result = _int.__sub__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
+
+    def __truediv__(self, value):
+        result = _int.__truediv__(self, value)
+        return result if result is NotImplemented else _new(Float, result)
+
+    def __xor__(self, value):
+        result = _int.__xor__(self, value)
+        return result if result is NotImplemented else _new_int(self.__class__, result)
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed NumPy support**
+
+Vectorized implementations of prefixed operations
+This module requires NumPy and is only imported when these operations are used
+"""
+
+import numpy
+
+from prefixed._common import THRESHOLD_TOLERANCE
+
+
+def _select(formatter, entries, thresholds, absolute_values):
+    """
+    Vectorized version of Formatter._convert() prefix selection for a single prefix table
+    Returns array of indices into entries, -1 indicates no prefix
+    """
+
+    # pylint: disable=protected-access
+    thresholds = numpy.asarray(thresholds, dtype=numpy.float64)
+    indices = numpy.searchsorted(thresholds, absolute_values, side='right') - 1
+
+    # Values near a threshold are resolved with the scalar implementation
+    last = len(thresholds) - 1
+    lower = thresholds[numpy.clip(indices, 0, last)]
+    upper = thresholds[numpy.clip(indices + 1, 0, last)]
+    tolerance = absolute_values * THRESHOLD_TOLERANCE
+    ambiguous = (numpy.abs(absolute_values - lower) <= tolerance) | \
+        (numpy.abs(upper - absolute_values) <= tolerance)
+
+    for position in numpy.flatnonzero(ambiguous):
+        _, entry = formatter._convert(float(absolute_values[position]))
+        indices[position] = entries.index(entry) if entry.magnitude else -1
+
+    return indices
+
+
+def split(formatter, values):
+    """
+    Args:
+        formatter(:py:class:`prefixed.Formatter`): Compiled format spec with a prefixed type
+        values(:py:class:`numpy.ndarray`): One-dimensional float64 array
+
+    Returns:
+        tuple: scaled values, indices into table, table of prefix entries
+
+    The last entry in table is used for values without a prefix
+    """
+
+    # pylint: disable=protected-access
+    absolute_values = numpy.abs(values)
+    small, large = formatter._small, formatter._large
+    table = small + large + (formatter._unscaled,)
+    indices = numpy.full(values.shape, len(table) - 1, dtype=numpy.intp)
+
+    # Infinity and NaN are never scaled
+    finite = numpy.isfinite(absolute_values)
+
+    # Non-positive margins are rare, leave them to the scalar implementation
+    if formatter._margin <= 0:
+        for position in numpy.flatnonzero(finite):
+            _, entry = formatter._convert(float(values[position]))
+            indices[position] = table.index(entry)
+
+    else:
+        # Every prefixed type has large prefixes, only SI has small prefixes
+        is_large = finite & (absolute_values >= 1.0)
+        selected = _select(formatter, large, formatter._large_thresholds,
+                           absolute_values[is_large])
+        indices[is_large] = numpy.where(selected >= 0, selected + len(small), len(table) - 1)
+
+        is_small = finite & ~is_large
+        if small:
+            subset = absolute_values[is_small]
+            selected = _select(formatter, small, formatter._small_thresholds, subset)
+
+            # Values below the smallest SI prefix still use it
+            selected[(selected < 0) & (subset > 0) & (subset < formatter._smallest)] = 0
+
+            indices[is_small] = numpy.where(selected >= 0, selected, len(table) - 1)
+
+    magnitudes = numpy.array([entry.magnitude or 1.0 for entry in table], dtype=numpy.float64)
+
+    return values / magnitudes[indices], indices, table
+
+
+def format_array(formatter, values):
+    """
+    Vectorized implementation of prefixed.format_array()
+    """
+
+    values = numpy.asarray(values, dtype=numpy.float64)
+    flat = values.ravel()
+    output = numpy.empty(flat.shape, dtype=object)
+
+    if formatter._native:  # pylint: disable=protected-access
+        output[:] = [formatter(value) for value in flat.tolist()]
+
+    else:
+        scaled, indices, table = split(formatter, flat)
+        render = formatter._render  # pylint: disable=protected-access
+        output[:] = [render(value, table[index])
+                     for value, index in zip(scaled.tolist(), indices.tolist())]
+
+    return output.reshape(values.shape)
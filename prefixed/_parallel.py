@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed process pool support**
+
+Bulk formatting with :py:mod:`concurrent.futures` process pools
+This module is only imported when parallel operations are used
+"""
+
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+
+from prefixed._compat import cpu_count
+from prefixed._formatter import SPEC_CACHE
+
+# Chunks submitted to the pool for each worker before waiting for results
+CHUNKS_PER_WORKER = 2
+
+
+def _format_chunk(format_spec, values):
+    """
+    Format an array of values in a worker process
+
+    Strings are returned joined with an array of their lengths
+    so the result is two compact buffers rather than a list of objects
+    """
+
+    formatter = SPEC_CACHE(format_spec)
+    strings = [formatter(value) for value in values]
+
+    return ''.join(strings), array('I', [len(string) for string in strings])
+
+
+def _split(text, lengths):
+    """
+    Reverse of joining in _format_chunk()
+    """
+
+    start = 0
+    for length in lengths:
+        end = start + length
+        yield text[start:end]
+        start = end
+
+
+def format_many(values, format_spec, workers=None, chunksize=65536):
+    """
+    Implementation of prefixed.format_many() for process pools
+    """
+
+    workers = workers or cpu_count()
+    values = iter(values)
+    chunks = iter(lambda: array('d', [float(value) for value in
+                                      itertools.islice(values, chunksize)]), array('d'))
+    pending = deque()
+
+    with ProcessPoolExecutor(workers) as executor:
+        try:
+            for chunk in chunks:
+                pending.append(executor.submit(_format_chunk, format_spec, chunk))
+
+                # Limit chunks in flight so memory use doesn't depend on the length of values
+                if len(pending) >= workers * CHUNKS_PER_WORKER:
+                    for string in _split(*pending.popleft().result()):
+                        yield string
+
+            while pending:
+                for string in _split(*pending.popleft().result()):
+                    yield string
+
+        finally:
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed templates**
+
+Deferred and precompiled formatting with :py:func:`prefixed.lazy` and
+:py:class:`prefixed.Template`
+"""
+
+import re
+import string
+
+from prefixed import _compat
+from prefixed._formatter import SPEC_CACHE
+from prefixed._int import Int
+
+
+class LazyFormat(object):
+    """
+    Args:
+        value: Number to format
+        format_spec(str): Format specification
+
+    Value formatted on first use, see :py:func:`lazy`
+    """
+
+    __slots__ = ('value', 'format_spec', '_result')
+
+    def __init__(self, value, format_spec):
+
+        self.value = value
+        self.format_spec = format_spec
+        self._result = None
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (self.__class__.__name__, self.value, self.format_spec)
+
+    def __str__(self):
+
+        result = self._result
+        if result is None:
+            result = self._result = SPEC_CACHE(self.format_spec)(self.value)
+
+        return result
+
+    def __format__(self, format_spec):
+
+        if format_spec:
+            return format(str(self), format_spec)
+
+        return str(self)
+
+
+def lazy(value, format_spec):
+    """
+    Args:
+        value: Number to format
+        format_spec(str): Format specification
+
+    Returns:
+        :py:class:`LazyFormat`: Object which formats value when converted to a string
+
+    Defer formatting until the result is needed, such as for log messages which may be filtered.
+    The result is cached after the first conversion.
+
+    .. code-block:: python
+
+        >>> logger.debug('Throughput: %s/s', lazy(rate, '.2h'))
+
+        >>> str(lazy(2.5e6, '.2h'))
+        '2.50M'
+
+    Format spec errors are raised when the value is converted
+    """
+
+    return LazyFormat(value, format_spec)
+
+
+RE_FIELD_KEY = re.compile(r'[^.\[]*')
+RE_FIELD_ACCESS = re.compile(r'\.([^.\[]+)|\[([^\]]+)\]')
+
+CONVERSIONS = {'r': repr, 's': str}
+if not _compat.PY2:  # pragma: no branch
+    CONVERSIONS['a'] = ascii  # pylint: disable=undefined-variable
+
+
+class Template(object):
+    """
+    Args:
+        format_string(str): Format string using :py:meth:`str.format` syntax
+
+    Precompiled format string for rendering many values repeatedly
+
+    .. code-block:: python
+
+        >>> status = Template('{rx:!.2h}B/s {tx:!.2h}B/s {mem:.1k}B')
+
+        >>> status.render(rx=1.5e6, tx=2048, mem=3 * 2 ** 30)
+        '1.50 MB/s 2.05 kB/s 3.0GiB'
+
+    The format string and the format specification of each field are parsed once.
+    Fields with prefixed presentation types are bound to a :py:class:`Formatter`,
+    so numbers are formatted the same as :py:class:`Float` without being wrapped.
+    :py:class:`Int` values keep exact integer formatting.
+    Other fields are formatted with :py:func:`format`, the same as :py:meth:`str.format`.
+
+    Fields can be named or positional, use automatic numbering, attributes, indexes,
+    and conversions. Nested replacement fields in format specifications are not supported.
+
+    Raises :py:exc:`ValueError` if the format string is invalid
+    """
+
+    __slots__ = ('format_string', '_parts', '_fields')
+
+    def __init__(self, format_string):
+
+        self.format_string = format_string
+        self._parts = parts = []
+        self._fields = fields = []
+        numbering = None
+        next_index = 0
+
+        for literal, field_name, format_spec, conversion in \
+                string.Formatter().parse(format_string):
+
+            if literal:
+                parts.append(literal)
+
+            if field_name is None:
+                continue
+
+            if '{' in format_spec:
+                raise ValueError('Nested replacement fields are not supported: %r' %
+                                 (format_string,))
+
+            key = RE_FIELD_KEY.match(field_name).group()
+            access = self._access(field_name[len(key):], field_name)
+            positional = not key or key.isdigit()
+
+            # Automatic and manual numbering can't be mixed, same as str.format()
+            if positional:
+                if numbering not in (None, 'manual' if key else 'automatic'):
+                    raise ValueError('cannot mix automatic field numbering '
+                                     'and manual field specification')
+                if key:
+                    key, numbering = int(key), 'manual'
+                else:
+                    key, numbering = next_index, 'automatic'
+                    next_index += 1
+
+            if conversion is not None and conversion not in CONVERSIONS:
+                raise ValueError('Unknown conversion specifier %s' % conversion)
+
+            # Only compile specs for prefixed presentation types
+            formatter = None
+            if conversion is None:
+                try:
+                    formatter = SPEC_CACHE(format_spec)
+                except ValueError:
+                    pass
+                else:
+                    if formatter._native:  # pylint: disable=protected-access
+                        formatter = None
+
+            fields.append((len(parts), positional, key, access, CONVERSIONS.get(conversion),
+                           formatter, format_spec))
+            parts.append(None)
+
+    @staticmethod
+    def _access(access, field_name):
+        """
+        Parse attribute and index access in a field name
+
+        Returns:
+            tuple: Tuples of True for attributes or False for indexes and the name or index
+        """
+
+        steps = []
+        position = 0
+        for match in RE_FIELD_ACCESS.finditer(access):
+            if match.start() != position:
+                break
+            attribute, index = match.groups()
+            if attribute is not None:
+                steps.append((True, attribute))
+            else:
+                steps.append((False, int(index) if index.isdigit() else index))
+            position = match.end()
+
+        if position != len(access):
+            raise ValueError('Invalid field name: %r' % (field_name,))
+
+        return tuple(steps)
+
+    def __repr__(self):
+
+        return '%s(%r)' % (self.__class__.__name__, self.format_string)
+
+    def render(self, *args, **kwargs):
+        """
+        Args:
+            args: Values for positional fields
+            kwargs: Values for named fields
+
+        Returns:
+            str: Rendered string
+
+        Raises :py:exc:`KeyError` or :py:exc:`IndexError` if a value is missing
+        """
+
+        parts = self._parts[:]
+
+        for index, positional, key, access, conversion, formatter, format_spec in self._fields:
+            value = args[key] if positional else kwargs[key]
+
+            for attribute, name in access:
+                value = getattr(value, name) if attribute else value[name]
+
+            if conversion is not None:
+                value = conversion(value)
+
+            if formatter is None or isinstance(value, Int):
+                parts[index] = format(value, format_spec)
+            else:
+                parts[index] = formatter(value)
+
+        return ''.join(parts)
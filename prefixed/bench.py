@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed benchmarks**
+
+Benchmarks for formatting, parsing, and arithmetic hot paths
+
+.. code-block:: console
+
+    $ python -m prefixed.bench --output results.json
+    $ python -m prefixed.bench --baseline benchmarks/baseline.json --threshold 0.2
+
+Results are reported in nanoseconds per operation.
+When a baseline is given, the exit status is 1 if any benchmark is slower than the
+baseline by more than the threshold.
+"""
+
+from __future__ import print_function
+
+import argparse
+import fnmatch
+import io
+import json
+import platform
+import sys
+import timeit
+
+import prefixed
+
+# Values spread across prefixes for formatting benchmarks
+VALUES = '[Float(1.2345 * 10 ** exp) for exp in range(-32, 33, 2)]'
+
+SETUP = '''
+from prefixed import Float, Formatter
+values = %s
+''' % VALUES
+
+PREFIXES = ('q', 'r', 'y', 'z', 'a', 'f', 'p', 'n', u'μ', u'µ', 'm', '',
+            'k', 'M', 'G', 'T', 'P', 'E', 'Z', 'Y', 'R', 'Q',
+            'Ki', 'Mi', 'Gi', 'Ti', 'Pi', 'Ei', 'Zi', 'Yi')
+
+
+def _format(spec):
+    return "for value in values: format(value, %r)" % spec
+
+
+def get_benchmarks():
+    """
+    Returns:
+        list: Tuples of name, setup, statement, and number of operations per statement
+    """
+
+    count = len(eval(VALUES, {'Float': prefixed.Float}))  # pylint: disable=eval-used
+    benchmarks = []
+
+    # Presentation types
+    for spec_type in 'hkm':
+        for spec in ('.2' + spec_type, '!>10.2' + spec_type):
+            benchmarks.append(('format:%s' % spec, SETUP, _format(spec), count))
+
+    # Significant digits
+    for spec_type in 'HKM':
+        for spec in ('.3' + spec_type, '#.3' + spec_type, '>10.3' + spec_type):
+            benchmarks.append(('format:%s' % spec, SETUP, _format(spec), count))
+
+    # Margins
+    for spec in ('%-5.2h', '%5.2h', '%-5.3H'):
+        benchmarks.append(('format:%s' % spec, SETUP, _format(spec), count))
+
+    # Fallback to float.__format__()
+    benchmarks.append(('format:.2f', SETUP, _format('.2f'), count))
+
+    # Precompiled
+    benchmarks.append(('formatter:.2h', SETUP + "formatter = Formatter('.2h')",
+                       'for value in values: formatter(value)', count))
+    benchmarks.append(('formatter:.3H', SETUP + "formatter = Formatter('.3H')",
+                       'for value in values: formatter(value)', count))
+
+    # String parsing
+    parse_setup = 'from prefixed import Float, set_parse_cache_size\nset_parse_cache_size(%d)'
+    for prefix in PREFIXES:
+        benchmarks.append(('parse:%s' % (prefix or 'none'), parse_setup % 0,
+                           'Float(%r)' % ('1.5' + prefix), 1))
+    benchmarks.append(('parse:exponent', parse_setup % 0, 'Float("1.5e3k")', 1))
+    benchmarks.append(('parse:invalid', parse_setup % 0,
+                       'try:\n    Float("1.5x")\nexcept ValueError:\n    pass', 1))
+    benchmarks.append(('parse:cached', parse_setup % 256, 'Float("1.5k")', 1))
+
+    # Arithmetic
+    benchmarks.append(('math:add', SETUP,
+                       'total = Float(0)\nfor value in values: total = total + value', count))
+    benchmarks.append(('math:chain', SETUP,
+                       'total = Float(0)\nfor value in values: total = (total * 1.5 + value) / 2',
+                       count * 3))
+    benchmarks.append(('math:divmod', SETUP, 'for value in values: divmod(value, 7)', count))
+
+    return benchmarks
+
+
+def measure(setup, statement, operations, repeat=5, min_time=0.2):
+    """
+    Args:
+        setup(str): Setup code
+        statement(str): Code to time
+        operations(int): Number of operations performed by statement
+        repeat(int): Number of times to repeat measurement
+        min_time(float): Minimum time for each measurement in seconds
+
+    Returns:
+        float: Best time in nanoseconds per operation
+    """
+
+    timer = timeit.Timer(statement, setup)
+
+    # Calibrate number of loops
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+
+    best = min([elapsed] + timer.repeat(repeat - 1, number))
+
+    return best / number / operations * 1e9
+
+
+def run(pattern='*', repeat=5, min_time=0.2, stream=None):
+    """
+    Args:
+        pattern(str): Shell style pattern to select benchmarks by name
+        repeat(int): Number of times to repeat each measurement
+        min_time(float): Minimum time for each measurement in seconds
+        stream(file): Stream for progress output, :py:data:`None` (default) to disable
+
+    Returns:
+        dict: Results in a JSON serializable structure
+    """
+
+    results = {}
+    for name, setup, statement, operations in get_benchmarks():
+        if not fnmatch.fnmatchcase(name, pattern):
+            continue
+        results[name] = round(measure(setup, statement, operations, repeat, min_time), 1)
+        if stream is not None:
+            print('%-20s %10.1f ns' % (name, results[name]), file=stream)
+
+    return {
+        'prefixed': prefixed.__version__,
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'unit': 'ns',
+        'results': results,
+    }
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Args:
+        results(dict): Results from :py:func:`run`
+        baseline(dict): Previous results from :py:func:`run`
+        threshold(float): Allowed slowdown as a fraction of the baseline
+
+    Returns:
+        list: Tuples of name, baseline time, current time, and ratio for each regression
+    """
+
+    regressions = []
+    for name, current in sorted(results['results'].items()):
+        previous = baseline['results'].get(name)
+        if previous and current / previous > 1.0 + threshold:
+            regressions.append((name, previous, current, current / previous))
+
+    return regressions
+
+
+def get_parser():
+    """
+    Returns:
+        :py:class:`argparse.ArgumentParser`: Parser for command line arguments
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m prefixed.bench',
+                                     description='Benchmark prefixed hot paths')
+    parser.add_argument('-o', '--output', metavar='FILE',
+                        help='Write results as JSON to FILE')
+    parser.add_argument('-b', '--baseline', metavar='FILE',
+                        help='Compare results with JSON results in FILE')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1,
+                        help='Allowed slowdown compared to baseline (default: 0.1 = 10%%)')
+    parser.add_argument('-k', '--filter', default='*', metavar='PATTERN',
+                        help="Only run benchmarks matching shell pattern, e.g. 'format:*'")
+    parser.add_argument('-r', '--repeat', type=int, default=5,
+                        help='Number of times to repeat each measurement (default: 5)')
+    parser.add_argument('--min-time', type=float, default=0.2, metavar='SECONDS',
+                        help='Minimum time for each measurement (default: 0.2)')
+
+    return parser
+
+
+def main(args=None):
+    """
+    Args:
+        args(list): Command line arguments, default is :py:data:`sys.argv`
+
+    Returns:
+        int: Exit status, 1 if regressions were found
+    """
+
+    options = get_parser().parse_args(args)
+    results = run(options.filter, options.repeat, options.min_time, sys.stdout)
+
+    if options.output:
+        with io.open(options.output, 'w', encoding='utf-8') as output:
+            output.write(u'%s\n' % json.dumps(results, indent=2, sort_keys=True))
+
+    if not options.baseline:
+        return 0
+
+    with io.open(options.baseline, encoding='utf-8') as baseline:
+        regressions = compare(results, json.load(baseline), options.threshold)
+
+    for name, previous, current, ratio in regressions:
+        print('REGRESSION %-20s %10.1f ns -> %10.1f ns (%.2fx)' % (name, previous, current, ratio))
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
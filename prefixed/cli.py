@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed command line interface**
+
+Convert fields in text streams to and from prefixed numbers, similar to GNU numfmt
+
+.. code-block:: console
+
+    $ printf '1024 2048000\\n' | python -m prefixed --to si --field 1-
+    1.02k 2.05M
+
+    $ printf 'eth0 2Ki\\n' | python -m prefixed --from auto --field 2
+    eth0 2048
+"""
+
+import argparse
+import contextlib
+import io
+import re
+import sys
+
+from prefixed._compat import PY2, raise_from_none
+from prefixed._float import _apply_prefix
+from prefixed._formatter import SPEC_CACHE
+
+# Read and write in chunks of approximately this many bytes
+CHUNK_SIZE = 1 << 20
+
+# numfmt scale names and the equivalent significant digit presentation types
+TO_TYPES = {'si': 'H', 'iec': 'M', 'iec-i': 'K',
+            'h': 'h', 'H': 'H', 'k': 'k', 'K': 'K', 'm': 'm', 'M': 'M'}
+
+RE_FIELDS = re.compile(r'^(?:\d+|\d+-\d*|-\d+)(?:,(?:\d+|\d+-\d*|-\d+))*$')
+RE_WHITESPACE = re.compile(r'(\s+)')
+
+
+class InvalidNumber(ValueError):
+    """
+    Raised when a field can't be converted
+    """
+
+
+def parse_fields(fields):
+    """
+    Args:
+        fields(str): Field list such as ``'1'``, ``'1,3'``, ``'2-4'``, ``'3-'``, or ``'-'``
+
+    Returns:
+        tuple: Sorted tuple of (first, last) pairs, last is :py:data:`None` for open ranges
+
+    Fields are numbered from 1
+    Raises :py:exc:`ValueError` if field list is invalid
+    """
+
+    if fields == '-':
+        return ((1, None),)
+
+    if not RE_FIELDS.match(fields):
+        raise ValueError('Invalid field list: %r' % fields)
+
+    ranges = []
+    for item in fields.split(','):
+        first, _, last = item.partition('-')
+        first = int(first) if first else 1
+        if '-' not in item:
+            last = first
+        else:
+            last = int(last) if last else None
+
+        if first < 1 or (last is not None and last < first):
+            raise ValueError('Invalid field range: %r' % item)
+
+        ranges.append((first, last))
+
+    return tuple(sorted(ranges))
+
+
+class Converter(object):
+    """
+    Args:
+        fields(tuple): Field ranges from :py:func:`parse_fields`
+        delimiter(str): Field delimiter, :py:data:`None` for whitespace
+        from_unit(str): ``'auto'`` to honor prefixes in input, ``'none'`` for plain numbers
+        format_spec(str): Format spec for output, :py:data:`None` for plain numbers
+        invalid(str): ``'abort'`` to raise :py:exc:`InvalidNumber`, ``'ignore'`` to leave as-is
+
+    Convert selected fields of lines
+    """
+
+    def __init__(self, fields=((1, 1),), delimiter=None, from_unit='auto', format_spec=None,
+                 invalid='abort'):
+
+        self.fields = fields
+        self.delimiter = delimiter
+        self.invalid = invalid
+        self._parse = _apply_prefix if from_unit == 'auto' else None
+        self._format = SPEC_CACHE(format_spec) if format_spec else self._plain
+
+        # Positions of fields, keyed by number of fields
+        self._positions = {}
+
+    @staticmethod
+    def _plain(value):
+        """
+        Output value without a prefix, integral values are output as integers
+        """
+
+        if value.is_integer() and abs(value) < 2**53:
+            return str(int(value))
+
+        return repr(value)
+
+    def positions(self, count):
+        """
+        Zero-based indices of selected fields for a line with count fields
+        """
+
+        try:
+            return self._positions[count]
+        except KeyError:
+            positions = []
+            for first, last in self.fields:
+                last = count if last is None else min(last, count)
+                positions.extend(range(first - 1, last))
+            positions = self._positions[count] = tuple(sorted(set(positions)))
+            return positions
+
+    def convert_field(self, field):
+        """
+        Convert a single field
+        """
+
+        parse = self._parse
+        try:
+            value = float(parse(field) if parse else field)
+        except (TypeError, ValueError):
+            if self.invalid == 'ignore':
+                return field
+            raise_from_none(InvalidNumber('Invalid number: %r' % field))
+
+        return self._format(value)
+
+    def convert_line(self, line):
+        """
+        Convert selected fields in line, preserving delimiters and line ending
+        """
+
+        body = line.rstrip('\r\n')
+        ending = line[len(body):]
+        convert_field = self.convert_field
+
+        if self.delimiter is None:
+            # Even indices are fields, odd indices are whitespace
+            parts = RE_WHITESPACE.split(body)
+            start = 2 if len(parts) > 1 and not parts[0] else 0
+            for position in self.positions((len(parts) - start + 1) // 2):
+                index = start + 2 * position
+                if parts[index]:
+                    parts[index] = convert_field(parts[index])
+            return ''.join(parts) + ending
+
+        parts = body.split(self.delimiter)
+        for position in self.positions(len(parts)):
+            if parts[position]:
+                parts[position] = convert_field(parts[position])
+
+        return self.delimiter.join(parts) + ending
+
+    def convert_stream(self, stream, output, header=0):
+        """
+        Args:
+            stream(file): Input text stream
+            output(file): Output text stream
+            header(int): Number of lines to pass through unchanged
+
+        Convert stream in chunks, memory use does not depend on the length of the stream
+        """
+
+        for _ in range(header):
+            output.write(stream.readline())
+
+        convert_line = self.convert_line
+        while True:
+            lines = stream.readlines(CHUNK_SIZE)
+            if not lines:
+                break
+            output.write(''.join([convert_line(line) for line in lines]))
+
+
+def get_parser():
+    """
+    Returns:
+        :py:class:`argparse.ArgumentParser`: Parser for command line arguments
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m prefixed',
+        description='Convert numbers in text to and from SI and IEC prefixed forms',
+    )
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help="Files to read, '-' or none for standard input")
+    parser.add_argument('-d', '--delimiter', default=None,
+                        help='Field delimiter (default: whitespace)')
+    parser.add_argument('--field', default='1', metavar='FIELDS',
+                        help="Fields to convert, e.g. '1', '1,3', '2-4', '3-', '-' (default: 1)")
+    parser.add_argument('--from', dest='from_unit', choices=('auto', 'none'), default='auto',
+                        help="'auto' to honor SI and IEC prefixes in input (default: auto)")
+    parser.add_argument('--to', choices=sorted(TO_TYPES), default=None,
+                        help="Output presentation type or numfmt scale "
+                             "(si: 'H', iec: 'M', iec-i: 'K')")
+    parser.add_argument('--format', dest='format_spec', default=None, metavar='SPEC',
+                        help="Format spec for output, e.g. '!.2' (default: '.3'). "
+                             "If it includes a presentation type, --to is not required")
+    parser.add_argument('--header', type=int, default=0, metavar='N',
+                        help='Number of header lines to output without conversion')
+    parser.add_argument('--invalid', choices=('abort', 'ignore'), default='abort',
+                        help="Action for fields which can't be converted (default: abort)")
+
+    return parser
+
+
+def get_format_spec(parser, options):
+    """
+    Determine output format spec from --to and --format
+    """
+
+    format_spec = options.format_spec
+
+    if options.to is not None:
+        format_spec = (format_spec or '.3') + TO_TYPES[options.to]
+
+    if format_spec is None:
+        return None
+
+    try:
+        formatter = SPEC_CACHE(format_spec)
+    except ValueError:
+        parser.error('invalid format spec: %r' % format_spec)
+
+    if options.to is None and formatter.spec.type is None:
+        parser.error('--format requires a presentation type when --to is not specified')
+
+    return format_spec
+
+
+@contextlib.contextmanager
+def _open(path, mode):
+    """
+    Open path as a UTF-8 text stream, '-' is standard input or output
+
+    Bytes which aren't valid UTF-8 are passed through unchanged.
+    On Python 2, streams are binary, so lines are byte strings like formatted output.
+    """
+
+    if PY2:  # pragma: no cover
+        if path == '-':
+            yield sys.stdin if mode == 'r' else sys.stdout
+        else:
+            with io.open(path, mode + 'b', buffering=CHUNK_SIZE) as stream:
+                yield stream
+        return
+
+    if path != '-':
+        with io.open(path, mode, encoding='utf-8', errors='surrogateescape', newline='',
+                     buffering=CHUNK_SIZE) as stream:
+            yield stream
+        return
+
+    stream = sys.stdin if mode == 'r' else sys.stdout
+
+    # Replaced streams
+    if not hasattr(stream, 'buffer'):  # pragma: no cover
+        yield stream
+        return
+
+    wrapper = io.TextIOWrapper(stream.buffer, encoding='utf-8', errors='surrogateescape',
+                               newline='')
+    try:
+        yield wrapper
+    finally:
+        wrapper.flush()
+        wrapper.detach()
+
+
+def main(args=None):
+    """
+    Args:
+        args(list): Command line arguments, default is :py:data:`sys.argv`
+
+    Returns:
+        int: Exit status
+    """
+
+    parser = get_parser()
+    options = parser.parse_args(args)
+
+    try:
+        fields = parse_fields(options.field)
+    except ValueError as exc:
+        parser.error(str(exc))
+
+    if options.delimiter == '':
+        parser.error('delimiter must not be empty')
+
+    converter = Converter(fields, options.delimiter, options.from_unit,
+                          get_format_spec(parser, options), options.invalid)
+
+    with _open('-', 'w') as output:
+        try:
+            for path in options.files or ['-']:
+                with _open(path, 'r') as stream:
+                    converter.convert_stream(stream, output, options.header)
+
+        except (InvalidNumber, IOError) as exc:
+            output.flush()
+            sys.stderr.write('%s: %s\n' % (parser.prog, exc))
+            return 2 if isinstance(exc, InvalidNumber) else 1
+
+    return 0
@@ -0,0 +1,723 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed differential fuzzing**
+
+Compares optimized formatting and parsing paths with the frozen reference implementation
+in :py:mod:`prefixed._reference`
+
+.. code-block:: console
+
+    $ python -m prefixed.fuzz --seed 1 --count 1000
+    $ python -m prefixed.fuzz --boundaries
+
+Random mode generates format specifications and values spread across all prefixes,
+including values near rounding ties. Boundary mode checks every value adjacent to
+a prefix or rounding threshold, as well as zeros, subnormals, and values
+near :py:data:`prefixed.SI_SMALLEST`.
+
+Each mismatch is shrunk to a simpler specification and value which still fail
+before it is reported. The exit status is 1 if any mismatches are found.
+
+New fast paths should be added to :py:data:`FORMAT_PATHS` or :py:data:`PARSE_PATHS`.
+"""
+
+from __future__ import print_function
+
+import argparse
+from collections import namedtuple
+import random
+import struct
+import sys
+
+import prefixed
+from prefixed import _compat, _reference
+
+# Prefix magnitudes, including 1 for unscaled values
+MAGNITUDES = tuple(sorted(set(prefixed.PREFIX_MAGNITUDE.values()) | {1.0}))
+
+# Native strings only, Python 2 also accepts unicode prefixes
+PREFIXES = tuple(sorted((prefix for prefix in prefixed.PREFIX_MAGNITUDE if isinstance(prefix, str)),
+                        key=lambda prefix: (-len(prefix), prefix)))
+
+SPECIAL_VALUES = (
+    0.0, 1.0, float('inf'), float('nan'),
+    5e-324,  # Smallest subnormal
+    1e-310,  # Subnormal
+    2.2250738585072014e-308,  # Smallest normal
+    1.7976931348623157e+308,  # Largest finite
+    prefixed.SI_SMALLEST,
+    prefixed.SI_SMALLEST * 0.9995,
+    prefixed.SI_SMALLEST * 1.0005,
+)
+
+# Flags used for boundary specifications
+BOUNDARY_FLAGS = ('', '#', '!!', '%-5', '%20')
+BOUNDARY_PRECISIONS = ('', '.0', '.1', '.2', '.3', '.6')
+
+# Parts used to generate parse strings
+NUMBERS = ('0', '1', '12', '999', '1024', '1.5', '1.', '.5', '0.001', '1e3', '1.5e-3', '2E10',
+           '1_000', '007', 'inf', 'nan', '', '1.2.3', 'e5', '1e', 'x1')
+SEPARATORS = ('', '', ' ', '  ', '\t')
+SIGNS = ('', '', '-', '+', ' ')
+SUFFIXES = PREFIXES + ('', '', 'i', 'ki', 'KI', 'mi', 'x', 'kk', ' ', '\n')
+
+
+class Mismatch(namedtuple('Mismatch', ('path', 'value', 'spec', 'expected', 'actual'))):
+    """
+    Differences between a path and the reference implementation
+
+    For parsing, value is the string parsed and spec is :py:data:`None`
+    """
+
+    __slots__ = ()
+
+
+def _format_float(values, spec):
+    return [_outcome(lambda value: format(prefixed.Float(value), spec), value) for value in values]
+
+
+def _format_formatter(values, spec):
+    formatter = prefixed.Formatter(spec)
+    return [_outcome(formatter, value) for value in values]
+
+
+def _format_incremental(values, spec):
+    formatter = prefixed.IncrementalFormatter(spec)
+    return [_outcome(formatter, value) for value in values]
+
+
+def _format_template(values, spec):
+    template = prefixed.Template('{:%s}' % spec)
+    return [_outcome(template.render, value) for value in values]
+
+
+def _format_many(values, spec):
+    return list(prefixed.format_many(values, spec, workers=1))
+
+
+def _format_into(values, spec):
+    buffer = bytearray()
+    prefixed.format_into(buffer, values, spec)
+    text = bytes(buffer) if _compat.PY2 else buffer.decode('utf-8')
+    return text.split('\n')[:-1]
+
+
+def _format_array(values, spec):
+    return prefixed.format_array(values, spec).tolist()
+
+
+def _parse_float(strings):
+    return [_outcome(lambda string: float(prefixed.Float(string)), string) for string in strings]
+
+
+def _parse_cached(strings):
+    previous = prefixed.parse_cache_info().maxsize
+    prefixed.set_parse_cache_size(64)
+    try:
+        # Parse twice so the second result comes from the cache
+        _parse_float(strings)
+        return _parse_float(strings)
+    finally:
+        prefixed.set_parse_cache_size(previous)
+
+
+def _parse_many(strings):
+    values, mask = prefixed.parse_many(strings, errors='mask')
+    return [ValueError if invalid else value for value, invalid in zip(values, mask)]
+
+
+# Paths called with a list of values and a format specification
+# Return a list of strings, or exception classes for values which raised
+FORMAT_PATHS = [
+    ('Float', _format_float),
+    ('Formatter', _format_formatter),
+    ('IncrementalFormatter', _format_incremental),
+    ('Template', _format_template),
+    ('format_many', _format_many),
+    ('format_into', _format_into),
+]
+
+try:
+    import numpy  # noqa: F401  # pylint: disable=unused-import
+except ImportError:  # pragma: no cover
+    pass
+else:
+    FORMAT_PATHS.append(('format_array', _format_array))
+
+# Paths called with a list of strings
+# Return a list of floats, or exception classes for strings which raised
+PARSE_PATHS = [
+    ('Float', _parse_float),
+    ('Float (cached)', _parse_cached),
+    ('parse_many', _parse_many),
+]
+
+
+def _outcome(func, *args):
+    """
+    Returns:
+        Result of calling func or the class of the exception raised
+    """
+
+    try:
+        return func(*args)
+    except Exception as exc:  # pylint: disable=broad-except
+        return exc.__class__
+
+
+def _same(expected, actual):
+    """
+    Compare outcomes, floats are compared by representation so -0.0 and nan are distinct
+    """
+
+    if isinstance(expected, float) and isinstance(actual, float):
+        return repr(expected) == repr(actual)
+    return expected == actual
+
+
+def reference_format(value, spec):
+    """
+    Args:
+        value(float): Value to format
+        spec(str): Format specification
+
+    Returns:
+        Formatted string, or the class of the exception raised by the reference implementation
+    """
+
+    return _outcome(format, _reference.Float(value), spec)
+
+
+def reference_parse(string):
+    """
+    Args:
+        string(str): String to parse
+
+    Returns:
+        Parsed value, or the class of the exception raised by the reference implementation
+    """
+
+    return _outcome(lambda: float(_reference.Float(string)))
+
+
+def _expected_format(value, spec):
+    """
+    Reference outcome for formatting value
+
+    The reference raises for infinity and NaN with prefix presentation types.
+    These are formatted unscaled by design, so all paths are compared with :py:class:`Float`.
+    On Python 2, unscaled floats don't support ``'#'``, so Float may raise a different exception.
+    """
+
+    expected = reference_format(value, spec)
+    if isinstance(expected, type) and not -prefixed.INF < value < prefixed.INF:
+        return _format_float([value], spec)[0]
+
+    return expected
+
+
+def _broadened(string, actual):
+    """
+    Strings the reference rejects, but are accepted by design:
+    any number accepted by :py:class:`float` followed by a prefix,
+    such as ``'.5k'``, ``'1e-3M'``, and ``'1_000k'``
+    """
+
+    if not isinstance(actual, float):
+        return False
+
+    for prefix in PREFIXES:
+        if string.endswith(prefix):
+            number = string[:-len(prefix)]
+            if number[-1:] == ' ':
+                number = number[:-1]
+            if not (number[-1:].isdigit() or number[-1:] == '.'):
+                return False
+            try:
+                return _same(float(number) * prefixed.PREFIX_MAGNITUDE[prefix], actual)
+            except ValueError:
+                return False
+
+    return False
+
+
+def _culprit(func, values, *args):
+    """
+    Returns:
+        int: Index of the first value which raises on its own, or 0 if none do
+    """
+
+    for index, value in enumerate(values):
+        if isinstance(_outcome(func, [value], *args), type):
+            return index
+
+    return 0
+
+
+def check_format(values, spec, paths=None):
+    """
+    Args:
+        values(list): Values to format
+        spec(str): Format specification
+        paths(list): Tuples of name and function, default is :py:data:`FORMAT_PATHS`
+
+    Returns:
+        list: :py:class:`Mismatch` for each path and value which differs from the reference
+    """
+
+    expected = [_expected_format(value, spec) for value in values]
+    mismatches = []
+
+    for name, func in paths or FORMAT_PATHS:
+        actual = _outcome(func, values, spec)
+
+        # Paths which handle all values at once raise for the whole batch
+        if isinstance(actual, type):
+            if actual not in expected:
+                index = _culprit(func, values, spec)
+                mismatches.append(Mismatch(name, values[index], spec, expected[index], actual))
+            continue
+
+        for value, result, outcome in zip(values, expected, actual):
+            if not _same(result, outcome):
+                mismatches.append(Mismatch(name, value, spec, result, outcome))
+
+    return mismatches
+
+
+def check_parse(strings, paths=None):
+    """
+    Args:
+        strings(list): Strings to parse
+        paths(list): Tuples of name and function, default is :py:data:`PARSE_PATHS`
+
+    Returns:
+        list: :py:class:`Mismatch` for each path and string which differs from the reference
+    """
+
+    expected = [reference_parse(string) for string in strings]
+    mismatches = []
+
+    for name, func in paths or PARSE_PATHS:
+        actual = _outcome(func, strings)
+
+        if isinstance(actual, type):
+            if actual not in expected:
+                index = _culprit(func, strings)
+                mismatches.append(Mismatch(name, strings[index], None, expected[index], actual))
+            continue
+
+        for string, result, outcome in zip(strings, expected, actual):
+            if _same(result, outcome):
+                continue
+            if result is ValueError and _broadened(string, outcome):
+                continue
+            mismatches.append(Mismatch(name, string, None, result, outcome))
+
+    return mismatches
+
+
+def _adjacent(value, steps):
+    """
+    Returns:
+        float: Positive finite value, steps representable values away
+    """
+
+    bits = struct.unpack('<q', struct.pack('<d', value))[0] + steps
+    return struct.unpack('<d', struct.pack('<q', max(bits, 0)))[0]
+
+
+def boundary_values():
+    """
+    Returns:
+        list: Positive and negative values adjacent to prefix and rounding thresholds
+
+    For each prefix, these are values near the magnitude, near rounding up into
+    the next prefix for each precision, and near common margins
+    """
+
+    thresholds = set(SPECIAL_VALUES)
+    for magnitude in MAGNITUDES:
+        for precision in range(8):
+            tie = 0.5 * 10 ** -precision
+            for limit in (1, 10, 100, 1000, 1024):
+                thresholds.add(magnitude * (limit - tie))
+        for factor in (1, 0.5, 0.95, 1.05, 1.2):
+            thresholds.add(magnitude * factor)
+
+    values = []
+    for threshold in sorted(thresholds):
+        if 0.0 < threshold < prefixed.INF:
+            values.extend(_adjacent(threshold, steps) for steps in (-1, 0, 1))
+        else:
+            values.append(threshold)
+
+    return values + [-value for value in values]
+
+
+def boundary_specs():
+    """
+    Returns:
+        list: Format specifications checked with every boundary value
+    """
+
+    return ['%s%s%s' % (flags, precision, spec_type)
+            for spec_type in sorted(prefixed.PREFIX_TYPES)
+            for flags in BOUNDARY_FLAGS
+            for precision in BOUNDARY_PRECISIONS]
+
+
+def random_value(rng):
+    """
+    Args:
+        rng(:py:class:`random.Random`): Random number generator
+
+    Returns:
+        float: Random value, weighted toward prefix thresholds and rounding ties
+    """
+
+    choice = rng.random()
+    if choice < 0.05:
+        value = rng.choice(SPECIAL_VALUES)
+    elif choice < 0.35:
+        value = 10 ** rng.uniform(-35, 35)
+    elif choice < 0.55:
+        value = round(10 ** rng.uniform(-3, 6), rng.randint(0, 6)) * rng.choice(MAGNITUDES)
+    elif choice < 0.75:
+        # Rounding ties, such as 2.5 and 1.125, scaled by a prefix
+        digits = rng.randint(0, 5)
+        value = (rng.randint(0, 10 ** (digits + 3)) + 0.5) / 10 ** digits * \
+            rng.choice(MAGNITUDES)
+    else:
+        # Near a prefix threshold
+        value = rng.choice(MAGNITUDES) * rng.choice((1, 1000, 1024)) * \
+            (1 - rng.choice((0.5, 1, 5)) * 10 ** -rng.randint(1, 12))
+        value = _adjacent(value, rng.randint(-2, 2))
+
+    return -value if rng.random() < 0.5 else value
+
+
+def random_spec(rng):
+    """
+    Args:
+        rng(:py:class:`random.Random`): Random number generator
+
+    Returns:
+        str: Random format specification, occasionally invalid
+    """
+
+    parts = []
+    if rng.random() < 0.2:
+        parts.append(rng.choice(('', '*', ' ', '0')) + rng.choice('<>=^'))
+    parts.append(rng.choice(('', '', '', '+', '-', ' ')))
+    parts.append(rng.choice(('', '', '#')))
+    parts.append(rng.choice(('', '', '', '0')))
+    parts.append(rng.choice(('', '', '!', '!!')))
+    parts.append(rng.choice(('', '', '', '1', '8', '12')))
+    parts.append(rng.choice(('', '', '', ',', '_')))
+    if rng.random() < 0.2:
+        parts.append('%%%d' % rng.choice((-100, -50, -5, 0, 5, 20, 300)))
+    if rng.random() < 0.8:
+        parts.append('.%d' % rng.choice((0, 0, 1, 2, 3, 3, 4, 6, 9, 15, 17)))
+    parts.append(rng.choice('hhhkkmmHHHKKMMfeg%') if rng.random() < 0.95 else '')
+
+    return ''.join(parts)
+
+
+def random_string(rng):
+    """
+    Args:
+        rng(:py:class:`random.Random`): Random number generator
+
+    Returns:
+        str: Random string, usually a number followed by a prefix
+    """
+
+    number = rng.choice(NUMBERS)
+    if rng.random() < 0.3:
+        number = repr(random_value(rng)).lstrip('-')
+
+    return rng.choice(SIGNS) + number + rng.choice(SEPARATORS) + rng.choice(SUFFIXES)
+
+
+def _spec_parts(spec):
+    """
+    Returns:
+        list: Parts of a format specification as tuples of name and text
+    """
+
+    match = _reference.RE_FORMAT_SPEC.match(spec)
+    if match is None:
+        return None
+
+    parts = []
+    for name in ('fill', 'align', 'sign', 'alt', 'zero', 'prefix_space', 'width',
+                 'grouping', 'margin', 'precision', 'type'):
+        text = match.group(name)
+        if text is not None:
+            prefix = {'margin': '%', 'precision': '.'}.get(name, '')
+            parts.append((name, prefix + text))
+
+    return parts
+
+
+def _spec_candidates(spec):
+    """
+    Simpler format specifications, each with one part removed or a number reduced
+    """
+
+    parts = _spec_parts(spec)
+    if parts is None:
+        return
+
+    for index, (name, text) in enumerate(parts):
+        if name == 'fill':
+            continue
+
+        # Removing align also removes fill
+        skip = {index, index - 1} if name == 'align' and index and \
+            parts[index - 1][0] == 'fill' else {index}
+        yield ''.join(part for position, (_, part) in enumerate(parts) if position not in skip)
+
+        if name in ('width', 'margin', 'precision'):
+            prefix = text[0] if name != 'width' else ''
+            number = int(text[len(prefix):])
+            for smaller in (0, number // 2, number - 1 if number > 0 else number + 1):
+                if abs(smaller) < abs(number):
+                    yield ''.join(prefix + str(smaller) if position == index else part
+                                  for position, (_, part) in enumerate(parts))
+
+
+def _value_candidates(value):
+    """
+    Simpler values, with fewer significant digits or positive
+    """
+
+    if value < 0.0 or (value == 0.0 and repr(value)[0] == '-'):
+        yield -value
+
+    for digits in range(1, 17):
+        yield float('%.*g' % (digits, value))
+
+
+def _complexity(value):
+    """
+    Sort key for values, negative values and more significant digits are more complex
+    """
+
+    text = repr(value)
+    digits = text.lstrip('-').split('e')[0].replace('.', '').strip('0')
+    return text.startswith('-'), len(digits), len(text)
+
+
+def _fails(path, value, spec):
+    mismatches = check_format([value], spec, [path])
+    return mismatches[0] if mismatches else None
+
+
+def shrink(mismatch, paths=None):
+    """
+    Args:
+        mismatch(:py:class:`Mismatch`): Mismatch from :py:func:`check_format`
+            or :py:func:`check_parse`
+        paths(list): Tuples of name and function the mismatch was found with
+
+    Returns:
+        :py:class:`Mismatch`: Simplest mismatch found which still fails for the same path
+
+    Specifications are shrunk by removing parts and reducing numbers,
+    values by removing significant digits, and parsed strings by removing characters.
+    If a mismatch only happens as part of a batch, it is returned unchanged.
+    """
+
+    if mismatch.spec is None:
+        return _shrink_parse(mismatch, paths or PARSE_PATHS)
+
+    path = dict(paths or FORMAT_PATHS)[mismatch.path]
+    path = (mismatch.path, path)
+    current = _fails(path, mismatch.value, mismatch.spec)
+    if current is None:
+        return mismatch
+
+    changed = True
+    while changed:
+        changed = False
+
+        for spec in _spec_candidates(current.spec):
+            smaller = _fails(path, current.value, spec)
+            if smaller is not None:
+                current, changed = smaller, True
+                break
+
+        for value in _value_candidates(current.value):
+            if _complexity(value) < _complexity(current.value):
+                smaller = _fails(path, value, current.spec)
+                if smaller is not None:
+                    current, changed = smaller, True
+                    break
+
+    return current
+
+
+def _shrink_parse(mismatch, paths):
+
+    path = (mismatch.path, dict(paths)[mismatch.path])
+    mismatches = check_parse([mismatch.value], [path])
+    if not mismatches:
+        return mismatch
+
+    current = mismatches[0]
+    changed = True
+    while changed:
+        changed = False
+        for index in range(len(current.value)):
+            string = current.value[:index] + current.value[index + 1:]
+            mismatches = check_parse([string], [path])
+            if mismatches:
+                current, changed = mismatches[0], True
+                break
+
+    return current
+
+
+def run_random(seed=0, count=100, batch=64, paths=None):
+    """
+    Args:
+        seed(int): Seed for random number generator
+        count(int): Number of format specifications to generate
+        batch(int): Number of values to format with each specification
+        paths(list): Tuples of name and function, default is :py:data:`FORMAT_PATHS`
+
+    Returns:
+        list: Shrunk :py:class:`Mismatch` instances, one per path and specification
+    """
+
+    rng = random.Random(seed)
+    found = []
+
+    for _ in range(count):
+        spec = random_spec(rng)
+        values = [random_value(rng) for _ in range(batch)]
+        found.extend(_first(check_format(values, spec, paths)))
+
+    return [shrink(mismatch, paths) for mismatch in found]
+
+
+def run_boundaries(specs=None, paths=None):
+    """
+    Args:
+        specs(list): Format specifications, default is :py:func:`boundary_specs`
+        paths(list): Tuples of name and function, default is :py:data:`FORMAT_PATHS`
+
+    Returns:
+        list: Shrunk :py:class:`Mismatch` instances, one per path and specification
+    """
+
+    values = boundary_values()
+    found = []
+
+    for spec in specs or boundary_specs():
+        found.extend(_first(check_format(values, spec, paths)))
+
+    return [shrink(mismatch, paths) for mismatch in found]
+
+
+def run_parse(seed=0, count=1000, paths=None):
+    """
+    Args:
+        seed(int): Seed for random number generator
+        count(int): Number of strings to generate
+        paths(list): Tuples of name and function, default is :py:data:`PARSE_PATHS`
+
+    Returns:
+        list: Shrunk :py:class:`Mismatch` instances, one per path
+    """
+
+    rng = random.Random(seed)
+    strings = [random_string(rng) for _ in range(count)]
+
+    return [shrink(mismatch, paths) for mismatch in _first(check_parse(strings, paths))]
+
+
+def _first(mismatches):
+    """
+    Only keep the first mismatch for each path
+    """
+
+    seen = set()
+    for mismatch in mismatches:
+        if mismatch.path not in seen:
+            seen.add(mismatch.path)
+            yield mismatch
+
+
+def describe(mismatch):
+    """
+    Args:
+        mismatch(:py:class:`Mismatch`): Mismatch to describe
+
+    Returns:
+        str: Reproducible description of the mismatch
+    """
+
+    def show(outcome):
+        return outcome.__name__ if isinstance(outcome, type) else repr(outcome)
+
+    if mismatch.spec is None:
+        call = 'Float(%r)' % (mismatch.value,)
+    else:
+        call = 'format(Float(%r), %r)' % (mismatch.value, mismatch.spec)
+
+    return '%s: %s expected %s, got %s' % (mismatch.path, call, show(mismatch.expected),
+                                           show(mismatch.actual))
+
+
+def get_parser():
+    """
+    Returns:
+        :py:class:`argparse.ArgumentParser`: Parser for command line arguments
+    """
+
+    parser = argparse.ArgumentParser(prog='python -m prefixed.fuzz',
+                                     description='Compare prefixed with the reference '
+                                                 'implementation')
+    parser.add_argument('-s', '--seed', type=int, default=0,
+                        help='Seed for random number generator (default: 0)')
+    parser.add_argument('-n', '--count', type=int, default=1000,
+                        help='Number of random format specifications (default: 1000)')
+    parser.add_argument('--boundaries', action='store_true',
+                        help='Check all boundary values with boundary specifications')
+
+    return parser
+
+
+def main(args=None):
+    """
+    Args:
+        args(list): Command line arguments, default is :py:data:`sys.argv`
+
+    Returns:
+        int: Exit status, 1 if any mismatches were found
+    """
+
+    options = get_parser().parse_args(args)
+
+    mismatches = run_random(options.seed, options.count)
+    mismatches.extend(run_parse(options.seed, options.count * 10))
+    if options.boundaries:
+        mismatches.extend(run_boundaries())
+
+    for mismatch in mismatches:
+        print(describe(mismatch))
+
+    print('%d mismatches' % len(mismatches))
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed matplotlib support**
+
+.. code-block:: python
+
+    >>> import matplotlib.pyplot as plt
+    >>> from prefixed.mpl import PrefixedFormatter
+
+    >>> fig, ax = plt.subplots()
+    >>> ax.plot(times, rates)
+    >>> ax.yaxis.set_major_formatter(PrefixedFormatter('!.3H', unit='B/s'))
+
+Requires `matplotlib <https://matplotlib.org>`_
+"""
+
+from __future__ import absolute_import
+
+from matplotlib.ticker import Formatter as _TickFormatter
+
+from prefixed import INF, SPEC_CACHE
+
+
+class PrefixedFormatter(_TickFormatter):
+    """
+    Args:
+        format_spec(str): Format specification
+        unit(str): Unit appended to each label
+
+    Tick formatter for :py:mod:`matplotlib` which uses a single prefix for all ticks on an axis
+
+    The prefix is selected from the larger absolute limit of the axis view interval,
+    using the same rules as :py:class:`prefixed.Float`, and is only selected again
+    when the view interval changes. Individual values, such as the cursor position,
+    are formatted with their own prefix.
+
+    Presentation types without prefixes are formatted individually.
+    """
+
+    def __init__(self, format_spec='.3H', unit=''):
+
+        self.formatter = SPEC_CACHE(format_spec)
+        self.unit = unit
+        self._limits = None
+        self._entry = None
+
+    def _select(self, limits):
+        """
+        Select prefix entry for the given limits if they've changed
+        """
+
+        if limits == self._limits:
+            return
+
+        # pylint: disable=protected-access
+        statistic = max(abs(limit) for limit in limits)
+        if 0 < statistic < INF:
+            self._entry = self.formatter._convert(statistic)[1]
+        else:
+            self._entry = self.formatter._unscaled
+
+        self._limits = limits
+
+    def set_locs(self, locs):
+        """
+        Args:
+            locs(list): Tick locations
+
+        Called by matplotlib when tick locations change
+        Selects the shared prefix from the view interval, or locs if not attached to an axis
+        """
+
+        if self.formatter._native:  # pylint: disable=protected-access
+            return
+
+        if self.axis is not None:
+            limits = tuple(float(limit) for limit in self.axis.get_view_interval())
+        else:
+            finite = [float(loc) for loc in locs if -INF < loc < INF]
+            limits = (min(finite), max(finite)) if finite else (0.0, 0.0)
+
+        self._select(limits)
+
+    def __call__(self, x, pos=None):
+
+        formatter = self.formatter
+        value = float(x)
+
+        # pylint: disable=protected-access
+        if formatter._native or self._entry is None:
+            return formatter(value) + self.unit
+
+        entry = self._entry
+        if not -INF < value < INF:
+            entry = formatter._unscaled
+
+        return formatter._render(value / (entry.magnitude or 1.0), entry) + self.unit
+
+    def format_data(self, value):
+        """
+        Format a single value with its own prefix
+        """
+
+        return self.formatter(value) + self.unit
+
+    def format_data_short(self, value):
+        """
+        Format a single value with its own prefix, used for the cursor position
+        """
+
+        return self.formatter(value) + self.unit
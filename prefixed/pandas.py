@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed pandas support**
+
+Importing this module registers a ``prefixed`` accessor for
+:py:class:`pandas.Series` and :py:class:`pandas.DataFrame`
+
+.. code-block:: python
+
+    >>> import pandas
+    >>> import prefixed.pandas
+
+    >>> pandas.Series([1246, 2.5e6, 0.004]).prefixed.format('.2h')
+    0    1.25k
+    1    2.50M
+    2    4.00m
+    dtype: object
+
+    >>> pandas.Series(['2Ki', '3.5M', '12μ']).prefixed.parse()
+    0    2.048000e+03
+    1    3.500000e+06
+    2    1.200000e-05
+    dtype: float64
+
+Requires `pandas <https://pandas.pydata.org>`_
+"""
+
+from __future__ import absolute_import
+
+import numpy
+import pandas
+
+from prefixed import format_array, parse_many
+
+
+def _format_series(series, format_spec):
+    """
+    Format numeric series, prefixes are selected for the whole series at once
+    """
+
+    values = series.to_numpy(dtype=numpy.float64, na_value=numpy.nan)
+    return pandas.Series(format_array(values, format_spec), index=series.index,
+                         name=series.name, dtype=object)
+
+
+def _parse_series(series, errors):
+    """
+    Convert series to floats, each distinct string is only parsed once
+    """
+
+    if errors not in {'raise', 'coerce'}:
+        raise ValueError("errors must be 'raise' or 'coerce', not %r" % (errors,))
+
+    if pandas.api.types.is_numeric_dtype(series.dtype):
+        return series.astype(numpy.float64)
+
+    # Missing values have a code of -1 and remain missing
+    codes, uniques = pandas.factorize(series)
+    parsed, mask = parse_many(uniques, errors='mask', ndarray=True)
+
+    if errors == 'raise' and mask.any():
+        position = numpy.flatnonzero(mask[codes] & (codes >= 0))[0]
+        value = series.iloc[position]
+        raise ValueError('Could not convert %s to Float at index %r: %r' %
+                         (value.__class__.__name__, series.index[position], value))
+
+    values = numpy.append(parsed, numpy.nan)[codes]
+    return pandas.Series(values, index=series.index, name=series.name)
+
+
+@pandas.api.extensions.register_series_accessor('prefixed')
+class SeriesAccessor(object):
+    """
+    Accessor available as ``Series.prefixed``
+    """
+
+    def __init__(self, series):
+        self._series = series
+
+    def format(self, format_spec):
+        """
+        Args:
+            format_spec(str): Format specification
+
+        Returns:
+            :py:class:`pandas.Series`: Series of strings with the same index
+
+        Equivalent to ``series.map(lambda value: format(Float(value), format_spec))``
+        Missing values are formatted as ``'nan'``
+        """
+
+        return _format_series(self._series, format_spec)
+
+    def parse(self, errors='raise'):
+        """
+        Args:
+            errors(str): ``'raise'`` for :py:exc:`ValueError` or ``'coerce'`` for ``nan``
+
+        Returns:
+            :py:class:`pandas.Series`: Series of float64 with the same index
+
+        Convert strings using the same rules as :py:class:`prefixed.Float`,
+        including SI and IEC prefixes. Missing values remain missing.
+        """
+
+        return _parse_series(self._series, errors)
+
+
+@pandas.api.extensions.register_dataframe_accessor('prefixed')
+class DataFrameAccessor(object):
+    """
+    Accessor available as ``DataFrame.prefixed``
+    """
+
+    def __init__(self, frame):
+        self._frame = frame
+
+    def format(self, format_spec, columns=None):
+        """
+        Args:
+            format_spec: Format specification or dictionary of format specifications by column
+            columns(list): Columns to format
+
+        Returns:
+            :py:class:`pandas.DataFrame`: Copy with formatted columns
+
+        If columns is not specified, columns in format_spec are used when it's a dictionary,
+        otherwise all numeric columns are formatted
+        """
+
+        frame = self._frame
+        if columns is None:
+            if isinstance(format_spec, dict):
+                columns = list(format_spec)
+            else:
+                columns = [column for column, dtype in frame.dtypes.items()
+                           if pandas.api.types.is_numeric_dtype(dtype)]
+
+        result = frame.copy()
+        for column in columns:
+            spec = format_spec[column] if isinstance(format_spec, dict) else format_spec
+            result[column] = _format_series(frame[column], spec)
+
+        return result
+
+    def parse(self, columns=None, errors='raise'):
+        """
+        Args:
+            columns(list): Columns to convert, default is all columns
+            errors(str): ``'raise'`` for :py:exc:`ValueError` or ``'coerce'`` for ``nan``
+
+        Returns:
+            :py:class:`pandas.DataFrame`: Copy with converted columns
+
+        See :py:meth:`SeriesAccessor.parse`
+        """
+
+        frame = self._frame
+        result = frame.copy()
+        for column in frame.columns if columns is None else columns:
+            result[column] = _parse_series(frame[column], errors)
+
+        return result
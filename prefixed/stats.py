@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+"""
+**Prefixed instrumentation**
+
+Opt-in counters for formatting and parsing with :py:class:`prefixed.Float`
+
+.. code-block:: python
+
+    >>> from prefixed import Float, stats
+
+    >>> with stats.collect():
+    ...     text = format(Float('2.5M'), '.2h')
+
+    >>> stats.snapshot()
+    {'format.h': 1, 'convert': 1, 'parse.prefix': 1}
+
+Collection can also be enabled for the whole process by setting the ``PREFIXED_STATS``
+environment variable to ``1``, or ``timing`` to include cumulative timing.
+Empty values, ``0``, and ``false`` leave collection disabled.
+
+When collection is disabled, the original methods are in place, so there is no overhead.
+While enabled, instrumented versions of :py:meth:`Float.__new__`, :py:meth:`Float.__format__`,
+and prefix selection are installed.
+
++----------------------+--------------------------------------------------------------------+
+| Key                  | Count                                                              |
++======================+====================================================================+
+| ``format.<type>``    | :py:func:`format` calls by presentation type, ``none`` if no type  |
++----------------------+--------------------------------------------------------------------+
+| ``format.fallback``  | Calls passed to :py:meth:`float.__format__`                        |
++----------------------+--------------------------------------------------------------------+
+| ``convert``          | Prefix selections for a value                                      |
++----------------------+--------------------------------------------------------------------+
+| ``parse.prefix``     | Strings converted with a prefix                                    |
++----------------------+--------------------------------------------------------------------+
+| ``parse.no_prefix``  | Strings converted without a prefix                                 |
++----------------------+--------------------------------------------------------------------+
+| ``error.<name>``     | :py:exc:`ValueError` and :py:exc:`TypeError` raised                |
++----------------------+--------------------------------------------------------------------+
+| ``time_ns.format``   | Cumulative time formatting in nanoseconds (timing only)            |
++----------------------+--------------------------------------------------------------------+
+| ``time_ns.parse``    | Cumulative time creating :py:class:`Float` instances (timing only) |
++----------------------+--------------------------------------------------------------------+
+
+Counts are not synchronized, so they may be approximate when multiple threads are used.
+"""
+
+from collections import Counter
+from contextlib import contextmanager
+import time
+
+from prefixed import _float
+from prefixed._compat import BASESTRING
+from prefixed._float import Float
+from prefixed._formatter import SPEC_CACHE, Formatter
+
+try:
+    _clock = time.perf_counter_ns
+except AttributeError:  # pragma: no cover
+    def _clock():
+        return int(getattr(time, 'perf_counter', time.time)() * 1e9)
+
+COUNTS = Counter()
+
+# Original implementations while instrumentation is enabled
+_ORIGINAL = {}
+_STATE = {'timing': False}
+
+
+def _format(self, format_spec):
+    """
+    Instrumented Float.__format__()
+    """
+
+    start = _STATE['timing'] and _clock()
+    try:
+        formatter = SPEC_CACHE(format_spec)
+        COUNTS['format.%s' % (formatter.spec.type or 'none')] += 1
+        if formatter._native:  # pylint: disable=protected-access
+            COUNTS['format.fallback'] += 1
+        return formatter(self)
+
+    except (TypeError, ValueError) as exc:
+        COUNTS['error.%s' % exc.__class__.__name__] += 1
+        raise
+
+    finally:
+        if start:
+            COUNTS['time_ns.format'] += _clock() - start
+
+
+def _new(cls, value=0.0):
+    """
+    Instrumented Float.__new__()
+    """
+
+    start = _STATE['timing'] and _clock()
+    try:
+        return _ORIGINAL['new'].__func__(cls, value)
+
+    except (TypeError, ValueError) as exc:
+        COUNTS['error.%s' % exc.__class__.__name__] += 1
+        raise
+
+    finally:
+        if start:
+            COUNTS['time_ns.parse'] += _clock() - start
+
+
+def _apply_prefix(value):
+    """
+    Instrumented prefixed._float._apply_prefix()
+    """
+
+    result = _ORIGINAL['apply_prefix'](value)
+    if isinstance(value, (BASESTRING, bytes)):
+        COUNTS['parse.no_prefix' if result is value else 'parse.prefix'] += 1
+
+    return result
+
+
+def _convert(self, value):
+    """
+    Instrumented Formatter._convert()
+    """
+
+    COUNTS['convert'] += 1
+    return _ORIGINAL['convert'](self, value)
+
+
+def enabled():
+    """
+    Returns:
+        bool: :py:data:`True` if collection is enabled
+    """
+
+    return bool(_ORIGINAL)
+
+
+def enable(timing=False):
+    """
+    Args:
+        timing(bool): Include cumulative timing
+
+    Start collecting counts, counts are not reset
+    """
+
+    _STATE['timing'] = timing
+    if _ORIGINAL:
+        return
+
+    # pylint: disable=protected-access
+    _ORIGINAL['new'] = Float.__dict__['__new__']
+    _ORIGINAL['format'] = Float.__format__
+    _ORIGINAL['apply_prefix'] = _float._apply_prefix
+    _ORIGINAL['convert'] = Formatter._convert
+
+    Float.__new__ = staticmethod(_new)
+    Float.__format__ = _format
+    _float._apply_prefix = _apply_prefix
+    Formatter._convert = _convert
+
+
+def disable():
+    """
+    Stop collecting counts and restore original implementations, counts are not reset
+    """
+
+    if not _ORIGINAL:
+        return
+
+    # pylint: disable=protected-access
+    Float.__new__ = _ORIGINAL.pop('new')
+    Float.__format__ = _ORIGINAL.pop('format')
+    _float._apply_prefix = _ORIGINAL.pop('apply_prefix')
+    Formatter._convert = _ORIGINAL.pop('convert')
+    _STATE['timing'] = False
+
+
+@contextmanager
+def collect(timing=False):
+    """
+    Args:
+        timing(bool): Include cumulative timing
+
+    Context manager which enables collection and restores the previous state on exit
+    """
+
+    previous = _STATE['timing'] if enabled() else None
+    enable(timing)
+    try:
+        yield COUNTS
+    finally:
+        if previous is None:
+            disable()
+        else:
+            _STATE['timing'] = previous
+
+
+def snapshot():
+    """
+    Returns:
+        dict: Copy of the current counts
+    """
+
+    return dict(COUNTS)
+
+
+def reset():
+    """
+    Reset all counts to zero
+    """
+
+    COUNTS.clear()
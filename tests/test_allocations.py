@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Allocation budgets for formatting and parsing hot paths
+
+Each path has a budget for the peak memory allocated by a single call,
+which covers intermediate objects, and the number of blocks still allocated
+after a call, which should only be the result.
+
+Run directly to report measurements for each path
+
+.. code-block:: console
+
+    $ python tests/test_allocations.py
+"""
+
+from __future__ import print_function
+
+import platform
+import sys
+
+from prefixed import Float, set_parse_cache_size
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+else:
+    import unittest
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    tracemalloc = None
+
+# Budgets in bytes for peak memory of a single call, including the result
+# Measured with Python 3.11 and later, see FRAME_ALLOWANCE for earlier versions
+FORMAT_BUDGETS = {
+    '.2h': 256,
+    '!.2h': 256,
+    '.3H': 256,
+    '#.3H': 256,
+    '.2k': 256,
+    '.3K': 256,
+    '.2m': 256,
+    '.3M': 256,
+    '%-5.2h': 256,
+    '*>10.2h': 256,
+    'h': 256,
+    '.2f': 192,
+}
+
+PARSE_BUDGETS = {
+    '1.5': 128,
+    '1.5k': 128,
+    '1.5Ki': 160,
+    u'12μ': 224,
+    '1.5e3k': 128,
+    b'1.5M': 160,
+}
+
+# Before Python 3.11, some frames for nested calls are allocated on the heap
+FRAME_ALLOWANCE = 128 if sys.version_info[:2] < (3, 11) else 0
+
+# Blocks still allocated after each call, only the result should remain
+RETAINED_BUDGET = 1.1
+
+VALUE = Float(12345.6789)
+REPEAT = 1000
+
+SUPPORTED = tracemalloc is not None and platform.python_implementation() == 'CPython' and \
+    hasattr(tracemalloc, 'reset_peak')
+
+
+def measure(func):
+    """
+    Returns:
+        tuple: Peak bytes allocated by a single call, blocks retained per call
+    """
+
+    # Warm caches
+    func()
+    func()
+
+    tracemalloc.start()
+    try:
+        # Peak for a single call, minimum of several to exclude unrelated allocations
+        peaks = []
+        for _ in range(10):
+            result = None
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            result = func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+        del result
+
+        # Blocks retained from many calls
+        results = [None] * REPEAT
+        before = tracemalloc.take_snapshot()
+        for index in range(REPEAT):
+            results[index] = func()
+        after = tracemalloc.take_snapshot()
+        blocks = sum(stat.count_diff for stat in after.compare_to(before, 'filename'))
+
+    finally:
+        tracemalloc.stop()
+
+    return min(peaks), blocks / float(REPEAT)
+
+
+def get_paths():
+    """
+    Returns:
+        list: Tuples of name, function, and peak budget
+    """
+
+    paths = []
+    for spec, budget in FORMAT_BUDGETS.items():
+        paths.append(('format:%s' % spec, lambda spec=spec: format(VALUE, spec),
+                      budget + FRAME_ALLOWANCE))
+
+    for string, budget in PARSE_BUDGETS.items():
+        paths.append(('parse:%r' % (string,), lambda string=string: Float(string),
+                      budget + FRAME_ALLOWANCE))
+
+    return paths
+
+
+def report(stream=sys.stdout):
+    """
+    Print measurements for each path
+    """
+
+    print('%-20s %8s %8s %8s' % ('path', 'peak', 'budget', 'retained'), file=stream)
+    for name, func, budget in get_paths():
+        peak, retained = measure(func)
+        print('%-20s %8d %8d %8.2f' % (name, peak, budget, retained), file=stream)
+
+
+@unittest.skipUnless(SUPPORTED, 'Requires tracemalloc.reset_peak() on CPython')
+@unittest.skipIf(sys.gettrace() is not None, 'Tracing functions allocate memory')
+class TestAllocations(unittest.TestCase):
+    """
+    Allocation budgets for hot paths
+    """
+
+    def check(self, name, func, budget):
+        """
+        Assert path is within budget
+        """
+
+        peak, retained = measure(func)
+        self.assertLessEqual(peak, budget, '%s: peak of %d bytes exceeds budget of %d bytes' %
+                             (name, peak, budget))
+        self.assertLessEqual(retained, RETAINED_BUDGET,
+                             '%s: %.2f blocks retained per call' % (name, retained))
+
+    def test_format(self):
+        """
+        Formatting for each presentation type
+        """
+
+        for name, func, budget in get_paths():
+            if name.startswith('format:'):
+                with self.subTest(path=name):
+                    self.check(name, func, budget)
+
+    def test_parse(self):
+        """
+        Parsing strings with and without prefixes
+        """
+
+        for name, func, budget in get_paths():
+            if name.startswith('parse:'):
+                with self.subTest(path=name):
+                    self.check(name, func, budget)
+
+    def test_parse_cached(self):
+        """
+        Cached parsing is within the same budgets
+        """
+
+        set_parse_cache_size(16)
+        try:
+            for string, budget in PARSE_BUDGETS.items():
+                with self.subTest(path=string):
+                    self.check('parse:%r (cached)' % (string,),
+                               lambda string=string: Float(string), budget + FRAME_ALLOWANCE)
+        finally:
+            set_parse_cache_size(0)
+
+
+if __name__ == '__main__':
+    report()
@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed asyncio support
+
+Async generators are driven without async syntax so this file can be
+loaded by versions of Python that don't support it
+"""
+
+import sys
+
+import prefixed
+from prefixed import Float, Formatter
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+    import mock
+else:
+    import unittest
+    from unittest import mock
+
+try:
+    import asyncio
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # pragma: no cover
+    asyncio = None
+
+ASYNC = sys.version_info[:2] >= (3, 6)
+VALUES = [1.2345 * 10 ** (exp % 60 - 30) for exp in range(1000)]
+
+
+class AsyncSource(object):
+    """
+    Asynchronous iterable which records how many items have been read
+
+    When stall is True, the source waits for more items after its items have been read
+    """
+
+    def __init__(self, items, stall=False):
+        self.items = iter(items)
+        self.read = 0
+        self.stall = stall
+        self.waiting = None
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+
+        try:
+            item = next(self.items)
+        except StopIteration:
+            future = asyncio.get_event_loop().create_future()
+            if self.stall:
+                # Completed by the test
+                self.waiting = future
+            else:
+                # pylint: disable-next=undefined-variable
+                future.set_exception(StopAsyncIteration())  # noqa: F821
+            return future
+
+        self.read += 1
+        return asyncio.sleep(0, result=item)
+
+
+def collect(agen, limit=None):
+    """
+    Consume async generator in a new event loop
+    """
+
+    loop = asyncio.new_event_loop()
+    results = []
+    try:
+        while limit is None or len(results) < limit:
+            try:
+                # anext() was added in Python 3.10
+                # pylint: disable-next=unnecessary-dunder-call
+                results.append(loop.run_until_complete(agen.__anext__()))
+            except StopAsyncIteration:  # noqa: F821 pylint: disable=undefined-variable
+                break
+        loop.run_until_complete(agen.aclose())
+    finally:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+
+    return results
+
+
+@unittest.skipUnless(ASYNC, 'Requires async generators')
+class TestAFormat(unittest.TestCase):
+    """
+    Tests for prefixed.aformat
+    """
+
+    def test_format(self):
+        """
+        Output matches formatting each value and is in order
+        """
+
+        expected = Formatter('!.3H').format_many(VALUES)
+        for batch in (1, 64, 1024, 5000):
+            with self.subTest(batch=batch):
+                result = collect(prefixed.aformat(AsyncSource(VALUES), '!.3H', batch=batch))
+                self.assertEqual(result, expected)
+
+        self.assertEqual(collect(prefixed.aformat(AsyncSource([]), '.2h')), [])
+
+        # Values are received before latency expires
+        result = collect(prefixed.aformat(AsyncSource(VALUES), '!.3H', batch=64, latency=5))
+        self.assertEqual(result, expected)
+
+    def test_executor(self):
+        """
+        Large batches are formatted in the executor
+        """
+
+        expected = Formatter('.2h').format_many(VALUES)
+
+        with ThreadPoolExecutor(2) as executor:
+            with mock.patch.object(executor, 'submit', wraps=executor.submit) as submit:
+                result = collect(prefixed.aformat(AsyncSource(VALUES), '.2h', batch=300,
+                                                  executor=executor))
+
+        self.assertEqual(result, expected)
+
+        # Last batch of 100 is below the threshold
+        self.assertEqual(submit.call_count, 3)
+
+        result = collect(prefixed.aformat(AsyncSource(VALUES), '.2h', batch=300, executor=True))
+        self.assertEqual(result, expected)
+
+    def test_backpressure(self):
+        """
+        Values are only read as results are consumed
+        """
+
+        source = AsyncSource(VALUES)
+        result = collect(prefixed.aformat(source, '.2h', batch=10), limit=15)
+        self.assertEqual(len(result), 15)
+        self.assertEqual(source.read, 20)
+
+    def test_latency(self):
+        """
+        Values from a stalled source aren't held back until the batch is full
+        """
+
+        source = AsyncSource([1e3, 2e6, 3e9], stall=True)
+        result = collect(prefixed.aformat(source, '.1h', batch=10, latency=0.01), limit=3)
+        self.assertEqual(result, ['1.0k', '2.0M', '3.0G'])
+
+        # Read in progress is cancelled when the generator is closed
+        self.assertTrue(source.waiting.cancelled())
+
+    def test_errors(self):
+        """
+        Invalid arguments raise when iteration starts
+        """
+
+        with self.assertRaises(ValueError):
+            collect(prefixed.aformat(AsyncSource(VALUES), '.x'))
+
+        with self.assertRaises(ValueError):
+            collect(prefixed.aformat(AsyncSource(VALUES), '.2h', batch=0))
+
+
+@unittest.skipUnless(ASYNC, 'Requires async generators')
+class TestAParse(unittest.TestCase):
+    """
+    Tests for prefixed.aparse
+    """
+
+    def test_parse(self):
+        """
+        Values converted to Float in order
+        """
+
+        strings = ['%.3fk' % value for value in range(600)]
+        for executor in (None, True):
+            with self.subTest(executor=executor):
+                result = collect(prefixed.aparse(AsyncSource(strings), batch=256,
+                                                 executor=executor))
+                self.assertEqual(result, [value * 1000.0 for value in range(600)])
+                self.assertEqual({type(value) for value in result}, {Float})
+
+    def test_latency(self):
+        """
+        Partial batches are converted when the source stalls
+        """
+
+        source = AsyncSource(['1k', '2k', '3k'], stall=True)
+        agen = prefixed.aparse(source, batch=10, latency=0.01)
+        loop = asyncio.new_event_loop()
+        try:
+            results = [loop.run_until_complete(asyncio.wait_for(agen.__anext__(), 5))
+                       for _ in range(3)]
+            self.assertEqual(results, [1e3, 2e3, 3e3])
+
+            # Source ends while the generator is waiting
+            # pylint: disable-next=undefined-variable
+            source.waiting.set_exception(StopAsyncIteration())  # noqa: F821
+            # pylint: disable-next=undefined-variable
+            with self.assertRaises(StopAsyncIteration):  # noqa: F821
+                loop.run_until_complete(agen.__anext__())
+        finally:
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def test_errors(self):
+        """
+        Invalid values raise with their position in the stream or are coerced
+        """
+
+        strings = ['1k', '2k', '3k', '4k', '5k', '6x', None]
+
+        with self.assertRaisesRegex(ValueError, "at index 5: '6x'"):
+            collect(prefixed.aparse(AsyncSource(strings), batch=2))
+
+        with self.assertRaisesRegex(TypeError, 'NoneType to Float at index 6'):
+            collect(prefixed.aparse(AsyncSource(strings[:5] + ['6k', None]), batch=4))
+
+        result = collect(prefixed.aparse(AsyncSource(strings), errors='coerce', batch=2))
+        self.assertEqual(result[:5], [1e3, 2e3, 3e3, 4e3, 5e3])
+        self.assertNotEqual(result[5], result[5])
+        self.assertNotEqual(result[6], result[6])
+
+        with self.assertRaisesRegex(ValueError, 'errors must be'):
+            collect(prefixed.aparse(AsyncSource(strings), errors='mask'))
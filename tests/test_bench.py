@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed.bench
+"""
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+from prefixed import bench
+
+if sys.version_info[0] < 3:
+    from StringIO import StringIO
+    import unittest2 as unittest
+    import mock
+else:
+    from io import StringIO
+    import unittest
+    from unittest import mock
+
+BASELINE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        'benchmarks', 'baseline.json')
+
+
+class TestBench(unittest.TestCase):
+    """
+    Tests for benchmark suite
+    """
+
+    def test_benchmarks(self):
+        """
+        All benchmarks run and names are unique
+        """
+
+        benchmarks = bench.get_benchmarks()
+        names = [name for name, _, _, _ in benchmarks]
+        self.assertEqual(len(names), len(set(names)))
+
+        for _, setup, statement, operations in benchmarks:
+            self.assertGreater(operations, 0)
+            timeit.Timer(statement, setup).timeit(1)
+
+    def test_coverage(self):
+        """
+        Presentation types, prefixes, and arithmetic are covered
+        """
+
+        names = set(name for name, _, _, _ in bench.get_benchmarks())
+        for spec_type in 'hkmHKM':
+            self.assertIn('format:.%d%s' % (3 if spec_type.isupper() else 2, spec_type), names)
+        for prefix in ('q', u'μ', 'k', 'Q', 'Ki', 'Yi', 'none'):
+            self.assertIn('parse:%s' % prefix, names)
+        self.assertIn('math:chain', names)
+
+    def test_run(self):
+        """
+        Results are filtered and JSON serializable
+        """
+
+        results = bench.run('math:add', repeat=1, min_time=0.001, stream=None)
+        self.assertEqual(list(results['results']), ['math:add'])
+        self.assertGreater(results['results']['math:add'], 0)
+        self.assertEqual(json.loads(json.dumps(results)), results)
+
+    def test_compare(self):
+        """
+        Only slowdowns beyond the threshold are regressions
+        """
+
+        baseline = {'results': {'a': 100.0, 'b': 100.0, 'c': 100.0}}
+        results = {'results': {'a': 109.0, 'b': 125.0, 'c': 50.0, 'd': 1000.0}}
+
+        self.assertEqual(bench.compare(results, baseline), [('b', 100.0, 125.0, 1.25)])
+        self.assertEqual(bench.compare(results, baseline, 0.3), [])
+
+    def test_baseline(self):
+        """
+        Stored baseline covers all benchmarks
+        """
+
+        with io.open(BASELINE, encoding='utf-8') as baseline:
+            results = json.load(baseline)['results']
+
+        self.assertEqual(set(results), set(name for name, _, _, _ in bench.get_benchmarks()))
+
+
+class TestMain(unittest.TestCase):
+    """
+    Tests for bench command line
+    """
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.output = os.path.join(self.tempdir, 'results.json')
+        self.baseline = os.path.join(self.tempdir, 'baseline.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def _main(self, *args):
+        with mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+            status = bench.main(['-k', 'math:add', '-r', '1', '--min-time', '0.001'] + list(args))
+        self.assertIn('math:add', stdout.getvalue())
+        return status
+
+    def test_output(self):
+        """
+        Results are written to file
+        """
+
+        self.assertEqual(self._main('-o', self.output), 0)
+        with io.open(self.output, encoding='utf-8') as output:
+            self.assertIn('math:add', json.load(output)['results'])
+
+    def test_regression(self):
+        """
+        Exit status is 1 when slower than baseline
+        """
+
+        with io.open(self.baseline, 'w', encoding='utf-8') as baseline:
+            baseline.write(u'%s' % json.dumps({'results': {'math:add': 1e-6}}))
+        self.assertEqual(self._main('-b', self.baseline), 1)
+
+        with io.open(self.baseline, 'w', encoding='utf-8') as baseline:
+            baseline.write(u'%s' % json.dumps({'results': {'math:add': 1e9}}))
+        self.assertEqual(self._main('-b', self.baseline), 0)
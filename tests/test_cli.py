@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed command line interface
+"""
+
+import io
+import os
+import runpy
+import shutil
+import sys
+import tempfile
+
+from prefixed import cli
+from prefixed._compat import PY2
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+    from mock import patch
+else:
+    import unittest
+    from unittest.mock import patch
+
+
+class TestParseFields(unittest.TestCase):
+    """
+    Tests for field list parsing
+    """
+
+    def test_valid(self):
+        """
+        Valid field lists
+        """
+
+        self.assertEqual(cli.parse_fields('1'), ((1, 1),))
+        self.assertEqual(cli.parse_fields('3,1'), ((1, 1), (3, 3)))
+        self.assertEqual(cli.parse_fields('2-4'), ((2, 4),))
+        self.assertEqual(cli.parse_fields('3-'), ((3, None),))
+        self.assertEqual(cli.parse_fields('-2'), ((1, 2),))
+        self.assertEqual(cli.parse_fields('-'), ((1, None),))
+
+    def test_invalid(self):
+        """
+        Invalid field lists
+        """
+
+        for fields in ('', 'a', '0', '3-2', '1,,2', '1-2-3'):
+            with self.subTest(fields=fields):
+                with self.assertRaises(ValueError):
+                    cli.parse_fields(fields)
+
+
+class TestConverter(unittest.TestCase):
+    """
+    Tests for prefixed.cli.Converter
+    """
+
+    def test_to(self):
+        """
+        Convert numbers to prefixed form
+        """
+
+        converter = cli.Converter(cli.parse_fields('2-'), format_spec='.3H')
+        self.assertEqual(converter.convert_line('host 1024 2048000 5\n'), 'host 1.02k 2.05M 5\n')
+
+        # Whitespace is preserved
+        self.assertEqual(converter.convert_line('  host\t1024   2048000 \r\n'),
+                         '  host\t1.02k   2.05M \r\n')
+
+        # Missing fields are ignored
+        self.assertEqual(converter.convert_line('host\n'), 'host\n')
+        self.assertEqual(converter.convert_line('\n'), '\n')
+
+    def test_from(self):
+        """
+        Convert prefixed numbers to plain numbers
+        """
+
+        converter = cli.Converter(cli.parse_fields('2'))
+        self.assertEqual(converter.convert_line('eth0 2Ki\n'), 'eth0 2048\n')
+        self.assertEqual(converter.convert_line('eth0 1.5μ\n'), 'eth0 1.5e-06\n')
+        self.assertEqual(converter.convert_line('eth0 1e20\n'), 'eth0 1e+20\n')
+
+        converter = cli.Converter(cli.parse_fields('2'), from_unit='none')
+        self.assertEqual(converter.convert_line('eth0 2.5\n'), 'eth0 2.5\n')
+        with self.assertRaises(cli.InvalidNumber):
+            converter.convert_line('eth0 2Ki\n')
+
+    def test_delimiter(self):
+        """
+        Fields separated by delimiter
+        """
+
+        converter = cli.Converter(cli.parse_fields('1,3'), delimiter=',', format_spec='.1k')
+        self.assertEqual(converter.convert_line('2048,2048,,3072\n'), '2.0Ki,2048,,3072\n')
+        self.assertEqual(converter.convert_line('2048,2048,3072'), '2.0Ki,2048,3.0Ki')
+
+    def test_invalid(self):
+        """
+        Invalid fields
+        """
+
+        converter = cli.Converter(format_spec='.1h')
+        with self.assertRaises(cli.InvalidNumber):
+            converter.convert_line('abc 1')
+
+        converter = cli.Converter(format_spec='.1h', invalid='ignore')
+        self.assertEqual(converter.convert_line('abc 1'), 'abc 1')
+
+    def test_stream(self):
+        """
+        Header lines are passed through
+        """
+
+        output = io.StringIO()
+        stream = io.StringIO(u'size\n2048\n1024\n')
+        cli.Converter(format_spec='.0m').convert_stream(stream, output, header=1)
+        self.assertEqual(output.getvalue(), u'size\n2K\n1K\n')
+
+
+class TestMain(unittest.TestCase):
+    """
+    Tests for prefixed.cli.main
+    """
+
+    def setUp(self):
+
+        self.tempdir = tempfile.mkdtemp()
+
+        # Standard streams are binary on Python 2
+        if PY2:
+            self.stdout = self.stdout_bytes = io.BytesIO()
+            self.stderr = io.BytesIO()
+        else:
+            self.stdout = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+            self.stdout_bytes = self.stdout.buffer
+            self.stderr = io.StringIO()
+
+    def tearDown(self):
+
+        shutil.rmtree(self.tempdir)
+
+    def write(self, name, content):
+        """
+        Write test input file, content is text or bytes
+        """
+
+        if not isinstance(content, bytes):
+            content = content.encode('utf-8')
+
+        path = os.path.join(self.tempdir, name)
+        with io.open(path, 'wb') as input_file:
+            input_file.write(content)
+        return path
+
+    @staticmethod
+    def stdin(content):
+        """
+        Standard input stream with bytes content
+        """
+
+        if PY2:
+            return io.BytesIO(content)
+        return io.TextIOWrapper(io.BytesIO(content), encoding='utf-8')
+
+    def run_main(self, *args):
+        """
+        Run main with captured output
+        """
+
+        with patch('sys.stdout', self.stdout), patch('sys.stderr', self.stderr):
+            status = cli.main(list(args))
+        self.stdout.flush()
+        return status, self.stdout_bytes.getvalue().decode('utf-8')
+
+    def test_files(self):
+        """
+        Multiple files are converted in order
+        """
+
+        first = self.write('first.txt', u'a 1000\n')
+        second = self.write('second.txt', u'b 0.000002\r\n')
+
+        status, output = self.run_main('--to', 'si', '--format', '!.2', '--field', '2',
+                                       first, second)
+        self.assertEqual(status, 0)
+        self.assertEqual(output, u'a 1 k\nb 2 μ\r\n')
+
+    def test_stdin(self):
+        """
+        Standard input is used when no files are given
+        """
+
+        with patch('sys.stdin', self.stdin(b'3Mi\n')):
+            status, output = self.run_main('--format', '.1k')
+
+        self.assertEqual(status, 0)
+        self.assertEqual(output, u'3.0Mi\n')
+
+    def test_invalid_utf8(self):
+        """
+        Bytes which aren't valid UTF-8 are passed through unchanged
+        """
+
+        with patch('sys.stdin', self.stdin(b'a\xff 1024\n')):
+            with patch('sys.stdout', self.stdout), patch('sys.stderr', self.stderr):
+                status = cli.main(['--to', 'si', '--field', '2'])
+        self.stdout.flush()
+        self.assertEqual(status, 0)
+        self.assertEqual(self.stdout_bytes.getvalue(), b'a\xff 1.02k\n')
+
+        path = self.write('input.txt', b'\xfe\xff 2Ki 2\xce\xbc\n')
+        with patch('sys.stdout', self.stdout), patch('sys.stderr', self.stderr):
+            status = cli.main(['--field', '2-', path])
+        self.stdout.flush()
+        self.assertEqual(status, 0)
+        self.assertEqual(self.stdout_bytes.getvalue(), b'a\xff 1.02k\n\xfe\xff 2048 2e-06\n')
+
+    def test_invalid_number(self):
+        """
+        Invalid numbers abort with exit status 2
+        """
+
+        path = self.write('input.txt', u'1\nbad\n')
+        status, output = self.run_main('--to', 'h', path)
+        self.assertEqual(status, 2)
+        self.assertEqual(output, u'')
+        self.assertIn("Invalid number: 'bad'", self.stderr.getvalue())
+
+    def test_missing_file(self):
+        """
+        Missing files exit with status 1
+        """
+
+        status, _ = self.run_main('--to', 'h', os.path.join(self.tempdir, 'missing.txt'))
+        self.assertEqual(status, 1)
+
+    def test_usage_errors(self):
+        """
+        Invalid arguments exit through argparse
+        """
+
+        for args in (('--field', '0'), ('--format', '.2'), ('--format', 'hh'),
+                     ('--to', 'si', '--format', '.2h'), ('-d', '')):
+            with self.subTest(args=args):
+                with self.assertRaises(SystemExit):
+                    self.run_main(*args)
+
+        self.assertIn('delimiter must not be empty', self.stderr.getvalue())
+
+    def test_module(self):
+        """
+        python -m prefixed runs the command line interface
+        """
+
+        with patch('prefixed.cli.main', return_value=3) as main:
+            with self.assertRaises(SystemExit) as context:
+                runpy.run_module('prefixed', run_name='__main__')
+
+        main.assert_called_once_with()
+        self.assertEqual(context.exception.code, 3)
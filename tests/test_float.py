@@ -385,6 +385,41 @@ class TestFloatFormatting(unittest.TestCase):  # pylint: disable=too-many-public
         with self.assertRaises(ValueError):
             Float('100\tk')
 
+        with self.assertRaises(ValueError):
+            Float('100  k')
+
+    def test_number_forms(self):
+        """
+        Any number accepted by float() can be used with a prefix
+        """
+
+        self.assertEqual(Float('1.5e3k'), 1.5e6)
+        self.assertEqual(Float('1E-3 M'), 1e3)
+        self.assertEqual(Float('.5Ki'), 512)
+        self.assertEqual(Float('5.k'), 5000)
+        self.assertEqual(Float('-2.5e+2m'), -0.25)
+
+        for value in ('infk', 'nanM', 'k', 'Ki', ' k', '1ek', '1.2.3k', '1mi', '1kk'):
+            with self.assertRaises(ValueError):
+                Float(value)
+
+        # Prefix letters at the end of valid floats
+        self.assertEqual(Float('inf'), float('inf'))
+        self.assertEqual(Float('-infinity'), float('-inf'))
+
+    @unittest.skipIf(sys.version_info[0] < 3, 'bytes and str are the same in Python 2')
+    def test_bytes(self):
+        """
+        Bytes are decoded as UTF-8
+        """
+
+        self.assertEqual(Float(b'2Ki'), 2048)
+        self.assertEqual(Float(u'1.5μ'.encode('utf-8')), 1.5e-6)
+        self.assertEqual(Float(b'42'), 42)
+
+        with self.assertRaises(ValueError):
+            Float(b'1\xffk')
+
     def test_invalid_format_spec(self):
         """
         Invalid format spec provided
@@ -483,6 +518,27 @@ class TestFloatFormatting(unittest.TestCase):  # pylint: disable=too-many-public
         self.assertEqual(format(Float(9.9999e10), '.2h'), '100.00G')
         self.assertEqual(format(Float(9.999e10), '.2h'), '99.99G')
 
+        # Values just below a prefix boundary
+        self.assertEqual(format(Float(995.01), '.2h'), '1.00k')
+        self.assertEqual(format(Float(995.0), '.2h'), '995.00')
+        self.assertEqual(format(Float(999.995), '.2h'), '1.00k')
+        self.assertEqual(format(Float(500.1), '.0h'), '1k')
+        self.assertEqual(format(Float(499.9), '.0h'), '500')
+        self.assertEqual(format(Float(999499.4), '.0h'), '1M')
+
+    def test_nonfinite(self):
+        """
+        Infinity and NaN are never scaled
+        """
+
+        for spec in ('h', '.2h', '.3H', '.2k', '#.3K', '.2m', '.2M'):
+            self.assertEqual(format(Float('inf'), spec), 'inf')
+            self.assertEqual(format(Float('-inf'), spec), '-inf')
+            self.assertEqual(format(Float('nan'), spec), 'nan')
+
+        self.assertEqual(format(Float('inf'), '>6.2h'), '   inf')
+        self.assertEqual(format(Float('inf'), '+!.2H'), '+inf ')
+
     def test_deprecated(self):
         """
         Confirm deprecated format specifiers function
@@ -732,3 +788,31 @@ class TestFloatMath(unittest.TestCase):
 
         with self.assertRaises(TypeError):
             object() ** Float(3.0)
+
+    @unittest.skipIf(sys.version_info[0] < 3, 'Negative float powers raise ValueError in Python 2')
+    def test_pow_complex(self):
+        """
+        Complex results are returned as complex
+        """
+
+        self.assertIsInstance(Float(-8.0) ** 0.5, complex)
+        self.assertIsInstance((-8.0) ** Float(0.5), complex)
+
+    def test_subclass(self):
+        """
+        Results of math operations retain subclass
+        """
+
+        class Subclass(Float):
+            """
+            Subclass of Float
+            """
+
+        value = Subclass(3.0)
+        for result in (value + 1, 1 + value, value - 1, 1 - value, value * 2, 2 * value,
+                       value / 2, 2 / value, value // 2, 2 // value, value % 2, 2 % value,
+                       value ** 2, 2 ** value, -value, +value, abs(value)):
+            self.assertIsInstance(result, Subclass)
+
+        for result in divmod(value, 2) + divmod(2, value):
+            self.assertIsInstance(result, Subclass)
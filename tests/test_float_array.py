@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed.FloatArray
+"""
+
+# Python 2 and optional NumPy imports are the same as in test_formatter
+# pylint: disable=duplicate-code
+
+import copy
+import pickle
+import sys
+
+import prefixed
+from prefixed import Float, FloatArray
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+    import mock
+else:
+    import unittest
+    from unittest import mock
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+VALUES = (0, -0.0, 1, 5e-324, 1e-33, 0.0015, 950, 999.999, 1024, -1050, 2.5e6, 1e30, 2**80)
+
+
+class TestFloatArray(unittest.TestCase):
+    """
+    Tests for prefixed.FloatArray
+    """
+
+    def test_sequence(self):
+        """
+        Elements are Float instances, slices are FloatArray instances
+        """
+
+        values = FloatArray([1, Float(2.5), 3e6])
+        self.assertEqual(len(values), 3)
+        self.assertEqual(repr(values), 'FloatArray([1.0, 2.5, 3000000.0])')
+
+        self.assertIs(type(values[0]), Float)
+        self.assertEqual(values[-1], 3e6)
+        self.assertEqual([type(value) for value in values], [Float] * 3)
+
+        self.assertIs(type(values[1:]), FloatArray)
+        self.assertEqual(list(values[1:]), [2.5, 3e6])
+
+        values[0] = Float('2k')
+        values.append(4)
+        self.assertEqual(list(values), [2000, 2.5, 3e6, 4])
+
+        self.assertEqual(FloatArray(), FloatArray([]))
+        with self.assertRaises(TypeError):
+            FloatArray(['1k'])
+
+    def test_slots(self):
+        """
+        Instances don't have a dictionary
+        """
+
+        with self.assertRaises(AttributeError):
+            FloatArray().attribute = 1
+
+        with self.assertRaises(AttributeError):
+            Float(1).attribute = 1
+
+    def test_pickle(self):
+        """
+        Pickled as raw bytes for all protocols
+        """
+
+        values = FloatArray(VALUES)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                result = pickle.loads(pickle.dumps(values, protocol))
+                self.assertIs(type(result), FloatArray)
+                self.assertEqual(result, values)
+
+        self.assertIs(type(copy.copy(values)), FloatArray)
+        self.assertIs(type(copy.deepcopy(values)), FloatArray)
+
+    def test_pickle_byteorder(self):
+        """
+        Values pickled on a machine with a different byte order are swapped
+        """
+
+        values = FloatArray(VALUES)
+        byteorder = 'big' if sys.byteorder == 'little' else 'little'
+        with mock.patch('prefixed.sys.byteorder', byteorder):
+            data = pickle.dumps(values)
+
+        self.assertNotEqual(pickle.loads(data), values)
+        swapped = FloatArray(values)
+        swapped.byteswap()
+        self.assertEqual(pickle.loads(data), swapped)
+
+    def test_format(self):
+        """
+        Output is identical to formatting individual values with Float
+        """
+
+        values = FloatArray(VALUES)
+        for spec in ('.2h', '!.3H', '.2k', '%-5.2h', '.2f'):
+            with self.subTest(spec=spec):
+                self.assertEqual(values.format(spec), [format(value, spec) for value in values])
+
+    def test_format_no_numpy(self):
+        """
+        Values are formatted individually without NumPy
+        """
+
+        values = FloatArray(VALUES)
+        with mock.patch.dict(sys.modules, {'prefixed._numpy': None}):
+            self.assertEqual(values.format('.2h'), [format(value, '.2h') for value in values])
+
+    def test_parse(self):
+        """
+        Strings converted with the same rules as Float
+        """
+
+        values = FloatArray.parse(['2Ki', '3.5M', u'12μ', 7])
+        self.assertIs(type(values), FloatArray)
+        self.assertEqual(list(values), [2048, 3.5e6, 12e-6, 7])
+
+        with self.assertRaisesRegex(ValueError, 'at index 1'):
+            FloatArray.parse(['2k', 'bad'])
+
+        values = FloatArray.parse(['2k', 'bad'], errors='coerce')
+        self.assertEqual(values[0], 2000)
+        self.assertNotEqual(values[1], values[1])
+
+        with self.assertRaisesRegex(ValueError, 'errors must be'):
+            FloatArray.parse(['2k'], errors='mask')
+
+    @unittest.skipIf(numpy is None, 'Requires NumPy')
+    def test_buffer(self):
+        """
+        NumPy views values without copying
+        """
+
+        values = FloatArray(VALUES)
+        view = numpy.frombuffer(values)
+        self.assertEqual(view.tolist(), list(values))
+
+        view = numpy.asarray(values)
+        self.assertTrue(numpy.shares_memory(view, values))
+
+        view[0] = 5
+        self.assertEqual(values[0], 5)
+
+        self.assertEqual(prefixed.format_array(values, '.2h').tolist(), values.format('.2h'))
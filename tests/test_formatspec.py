@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-# Copyright 2020 - 2023 Avram Lubkin, All Rights Reserved
+# Copyright 2020 - 2026 Avram Lubkin, All Rights Reserved
 
 # This Source Code Form is subject to the terms of the Mozilla Public
 # License, v. 2.0. If a copy of the MPL was not distributed with this
@@ -11,7 +11,8 @@ Test file for prefixed format spec parsing
 
 import unittest
 
-from prefixed import RE_FORMAT_SPEC
+from prefixed import (RE_FORMAT_SPEC, SPEC_CACHE, CacheInfo, Float,
+                      clear_spec_cache, spec_cache_info)
 
 FIELDS = ('fill', 'align', 'sign', 'alt', 'zero', 'prefix_space',
           'width', 'grouping', 'margin', 'precision', 'type')
@@ -122,3 +123,84 @@ class FormatSpec(unittest.TestCase):
             spec = RE_FORMAT_SPEC.match(item).groupdict()
             self.assertEqual(spec.pop('type'), item)
             self.assertTrue(all(field is None for field in spec.values()))
+
+
+class SpecCache(unittest.TestCase):
+    """
+    Tests for parsed format spec cache
+    """
+
+    def setUp(self):
+        clear_spec_cache()
+
+    def tearDown(self):
+        SPEC_CACHE.maxsize = 256
+        clear_spec_cache()
+
+    def test_parsed_spec(self):
+        """
+        Margin and precision are converted when parsed
+        """
+
+        spec = SPEC_CACHE('!5%-5.2j').spec
+        self.assertEqual(spec.type, 'k')
+        self.assertEqual(spec.width, '5')
+        self.assertEqual(spec.prefix_space, '!')
+        self.assertEqual(spec.margin, 0.95)
+        self.assertEqual(spec.precision, 2)
+
+        spec = SPEC_CACHE('f').spec
+        self.assertEqual(spec.margin, 1.0)
+        self.assertIsNone(spec.precision)
+
+    def test_hits_misses(self):
+        """
+        Repeated format specs are only parsed once
+        """
+
+        self.assertEqual(spec_cache_info(), CacheInfo(0, 0, 256, 0))
+
+        for _ in range(3):
+            self.assertEqual(format(Float(2048), '.2k'), '2.00Ki')
+            self.assertEqual(format(Float(2048), '.2f'), '2048.00')
+
+        self.assertEqual(spec_cache_info(), CacheInfo(4, 2, 256, 2))
+
+        clear_spec_cache()
+        self.assertEqual(spec_cache_info(), CacheInfo(0, 0, 256, 0))
+
+    def test_invalid_not_cached(self):
+        """
+        Invalid format specs raise every time and are not stored
+        """
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                format(Float(1), 'hh')
+
+        self.assertEqual(spec_cache_info(), CacheInfo(0, 2, 256, 0))
+
+    def test_bounded(self):
+        """
+        Cache never exceeds maxsize
+        """
+
+        SPEC_CACHE.maxsize = 3
+        for precision in range(5):
+            format(Float(2048), '.%dh' % precision)
+
+        self.assertEqual(spec_cache_info(), CacheInfo(0, 5, 3, 3))
+
+        # Most recent entries are kept
+        format(Float(2048), '.4h')
+        self.assertEqual(spec_cache_info().hits, 1)
+
+    def test_disabled(self):
+        """
+        Caching is disabled when maxsize is 0
+        """
+
+        SPEC_CACHE.maxsize = 0
+        format(Float(2048), '.2h')
+        format(Float(2048), '.2h')
+        self.assertEqual(spec_cache_info(), CacheInfo(0, 2, 0, 0))
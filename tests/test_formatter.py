@@ -0,0 +1,611 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed.Formatter
+"""
+
+import array
+import io
+import logging
+import random
+import sys
+
+import prefixed
+from prefixed import (THRESHOLD_CACHE, Float, Formatter, IncrementalFormatter, Int, LazyFormat,
+                      Template, format_column, format_into, lazy, split, split_many)
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+    import mock
+else:
+    import unittest
+    from unittest import mock
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+SPECS = ('h', '.2h', '!.2h', '!!.2h', '10.2h', '<10.2h', '%-5.2h', '%5.2h', '.3H', '#.3H',
+         '!.3H', '=+12.3H', 'k', '.2k', '#!.2k', '.3K', '#.3K', '.2m', '.0M', '_.2m', '.2f', 'e')
+
+# Python 2 doesn't support the alternate form for floats or underscore grouping
+if sys.version_info[0] < 3:
+    SPECS = tuple(spec for spec in SPECS if spec not in ('#!.2k', '_.2m'))
+
+VALUES = (0, -0.0, 1, 5e-324, 1e-33, 0.95e-30, 0.0015, 0.999, 950, 999.999, 1000, 1023.9999,
+          1024, -1050, 12345.6789, 2.5e6, 1e30, 1e35, 2**80, 2**95)
+
+
+class TestFormatter(unittest.TestCase):
+    """
+    Tests for prefixed.Formatter
+    """
+
+    def test_matches_float(self):
+        """
+        Output is identical to formatting with Float
+        """
+
+        for spec in SPECS:
+            formatter = Formatter(spec)
+            for value in VALUES:
+                with self.subTest(spec=spec, value=value):
+                    self.assertEqual(formatter(value), format(Float(value), spec))
+                    self.assertEqual(formatter(Float(value)), format(Float(value), spec))
+
+    def test_significant_digits_fast_path(self):
+        """
+        Single rounding for significant digits matches rounding twice
+        """
+
+        rng = random.Random(42)
+        values = [rng.uniform(1, 1000) for _ in range(2000)]
+        values += [round(value, rng.randint(0, 8)) + 5 * 10.0 ** -rng.randint(1, 9)
+                   for value in values]
+        values += [9.99995, 99.9995, 999.995, 9.9999, 1.0, 10.0, 100.0, 1.0005, 10.005]
+        values += [-value for value in values]
+
+        for spec in ('.3H', '#.3H', '.1H', '+.6K', '%-5.2M', '>12.10H', '.0H'):
+            fast = Formatter(spec)
+            slow = Formatter(spec)
+            slow._sig_ranges = ()  # pylint: disable=protected-access
+            with self.subTest(spec=spec):
+                self.assertEqual(fast.format_many(values), slow.format_many(values))
+
+    def test_padding(self):
+        """
+        Sign, fill, and alignment applied to significant digits match formatting again
+        """
+
+        values = (0, -0.0, 1, -1, 999.5, 1246, -1246, 2.5e6, -1e-7, 1e35)
+        for spec in ('=+12.3H', '>10.3H', '*^14.2K', '<12M', ' 9.3H', '*=+12.3H', '012.3H',
+                     '0=+12.3H', '*<010.2H', '!4H', '+!10.3M'):
+            padded = Formatter(spec)
+            formatted = Formatter(spec)
+            formatted._text_specs = None  # pylint: disable=protected-access
+            with self.subTest(spec=spec):
+                self.assertIsNotNone(padded._text_specs)  # pylint: disable=protected-access
+                self.assertEqual(padded.format_many(values), formatted.format_many(values))
+
+        # Grouping and widths narrower than prefixes format the number again
+        self.assertIsNone(Formatter(',.3H')._text_specs)  # pylint: disable=protected-access
+        self.assertIsNone(Formatter('+1.2H')._text_specs)  # pylint: disable=protected-access
+
+    def test_format_many(self):
+        """
+        Multiple values are formatted in order
+        """
+
+        formatter = Formatter('!.3H')
+        self.assertEqual(formatter.format_many([1246, 2.5e6, 0.004]), ['1.25 k', '2.5 M', '4 m'])
+        self.assertEqual(formatter.format_many(iter(())), [])
+
+    def test_native(self):
+        """
+        Presentation types not handled are passed to float.__format__()
+        """
+
+        self.assertEqual(Formatter('.2f')(3), '3.00')
+        self.assertEqual(Formatter('>8.1e')(1500), ' 1.5e+03')
+
+        # Valid for prefixed, but not float
+        with self.assertRaises(ValueError):
+            Formatter('!.2f')(3)
+
+    def test_invalid(self):
+        """
+        Invalid format specs raise when compiled
+        """
+
+        with self.assertRaises(ValueError):
+            Formatter('hh')
+
+    def test_attributes(self):
+        """
+        Compiled format spec is exposed
+        """
+
+        formatter = Formatter('%-5.2j')
+        self.assertEqual(repr(formatter), "Formatter('%-5.2j')")
+        self.assertEqual(formatter.format_spec, '%-5.2j')
+        self.assertEqual(formatter.spec.type, 'k')
+        self.assertEqual(formatter.spec.margin, 0.95)
+
+    def test_shared_thresholds(self):
+        """
+        Specs with the same prefix table, margin, and precision share thresholds
+        """
+
+        THRESHOLD_CACHE.clear()
+        Formatter('.2h')
+        Formatter('!>10.2H')
+        Formatter('.2k')
+        Formatter('.2M')
+
+        # SI (large and small), IEC (large and empty small)
+        self.assertEqual(THRESHOLD_CACHE.info().misses, 4)
+        self.assertEqual(THRESHOLD_CACHE.info().hits, 4)
+
+    def test_near_threshold(self):
+        """
+        Values just below a threshold use the next prefix when they round up to it
+        """
+
+        formatter = Formatter('%-33.3h')
+        self.assertEqual(formatter(669665.0), '0.670M')
+        self.assertEqual(formatter(669664.0), '669.664k')
+        self.assertEqual(format(Float(669665.0), '%-33.3h'), '0.670M')
+
+
+class TestFormatColumn(unittest.TestCase):
+    """
+    Tests for shared prefix column formatting
+    """
+
+    def test_strategies(self):
+        """
+        Magnitude selected by statistic
+        """
+
+        values = [1.5e6, 250e3, 12e6, 0]
+        self.assertEqual(list(format_column(values, '.2h')),
+                         [' 1.50M', ' 0.25M', '12.00M', ' 0.00M'])
+        self.assertEqual(list(format_column(values, '.2h', strategy='median')),
+                         [' 1.50M', ' 0.25M', '12.00M', ' 0.00M'])
+        self.assertEqual(list(format_column(values, '.2h', strategy='min')),
+                         [' 1500.00k', '  250.00k', '12000.00k', '    0.00k'])
+
+    def test_rounding(self):
+        """
+        Magnitude selection matches single values
+        """
+
+        self.assertEqual(list(format_column([999.999, 5], '.2h')), ['1.00k', '0.01k'])
+        self.assertEqual(list(format_column([994.99, 5], '.2h')), ['994.99', '  5.00'])
+
+    def test_negative(self):
+        """
+        Width includes sign
+        """
+
+        self.assertEqual(list(format_column([2048, -1024, 512], '.1k')),
+                         [' 2.0Ki', '-1.0Ki', ' 0.5Ki'])
+
+        # Only negative values include a sign
+        self.assertEqual(list(format_column([-1, 100], '.1h')), [' -1.0', '100.0'])
+        self.assertEqual(list(format_column([-2e6, 12e6, 1e6], '.1h')),
+                         ['-2.0M', '12.0M', ' 1.0M'])
+
+    def test_significant_digits(self):
+        """
+        Significant digit types trim trailing zeros
+        """
+
+        self.assertEqual(list(format_column([1.5e6, 250e3, 12e6], '.3H')),
+                         [' 1.5M', '0.25M', '  12M'])
+        self.assertEqual(list(format_column([1000, 1230, 10000], '.3H')),
+                         ['   1k', '1.23k', '  10k'])
+        self.assertEqual(list(format_column([2**20, 1.5 * 2**20], '.3K')), ['  1Mi', '1.5Mi'])
+
+    def test_nonfinite(self):
+        """
+        Infinity and NaN are not scaled
+        """
+
+        self.assertEqual(list(format_column([1e6, float('inf'), float('nan')], '!.1h')),
+                         ['1.0 M', ' inf ', ' nan '])
+        self.assertEqual(list(format_column([0.0, float('nan')], '.1h')), ['0.0', 'nan'])
+
+    def test_magnitude(self):
+        """
+        Precomputed magnitude for streaming
+        """
+
+        values = iter([1.5e6, 250e3, 12e6])
+        self.assertEqual(list(format_column(values, '.2h', magnitude='M')),
+                         ['1.50M', '0.25M', '12.00M'])
+
+        self.assertEqual(list(format_column([2**20], '!.1k', magnitude=2**10)), ['1024.0 Ki'])
+        self.assertEqual(list(format_column([2**20], '.1k', magnitude='Mi')), ['1.0Mi'])
+        self.assertEqual(list(format_column([2e-6], '.1h', magnitude=u'µ')), ['2.0μ'])
+        self.assertEqual(list(format_column([2e-6], '.1h', magnitude=u'μ')), ['2.0μ'])
+        self.assertEqual(list(format_column([2e3], '.1h', magnitude=1)), ['2000.0'])
+
+        with self.assertRaises(ValueError):
+            format_column([1], '.2h', magnitude='Ki')
+
+        with self.assertRaises(ValueError):
+            format_column([1], '.2k', magnitude=1000)
+
+    def test_native(self):
+        """
+        Presentation types without prefixes are formatted individually
+        """
+
+        self.assertEqual(list(format_column(iter([3, 40]), '.1f')), ['3.0', '40.0'])
+        self.assertEqual(list(format_column(iter([3, 40]), '.1f', magnitude='k')), ['3.0', '40.0'])
+
+    def test_errors(self):
+        """
+        Invalid arguments
+        """
+
+        with self.assertRaises(ValueError):
+            format_column([1], '.2h', strategy='mean')
+
+        with self.assertRaises(TypeError):
+            format_column(iter([1]), '.2h')
+
+
+class TestLazy(unittest.TestCase):
+    """
+    Tests for prefixed.lazy
+    """
+
+    def test_lazy(self):
+        """
+        Formatted when converted to a string and cached
+        """
+
+        value = lazy(2.5e6, '.2h')
+        self.assertIsInstance(value, LazyFormat)
+        self.assertEqual(repr(value), "LazyFormat(2500000.0, '.2h')")
+
+        with mock.patch('prefixed._template.SPEC_CACHE', wraps=prefixed.SPEC_CACHE) as cache:
+            self.assertEqual(str(value), '2.50M')
+            self.assertEqual(str(value), '2.50M')
+            self.assertEqual('%s' % value, '2.50M')
+            self.assertEqual(cache.call_count, 1)
+
+    def test_format(self):
+        """
+        Format spec of str.format() and f-strings applies to the formatted string
+        """
+
+        value = lazy(Float(1024), '.1k')
+        self.assertEqual('{}'.format(value), '1.0Ki')
+        self.assertEqual('{:>8}'.format(value), '   1.0Ki')
+
+    def test_not_formatted(self):
+        """
+        Value is not formatted unless used, including errors
+        """
+
+        value = lazy(1, '.x')
+        with self.assertRaises(ValueError):
+            str(value)
+
+    def test_logging(self):
+        """
+        Filtered log records don't format the value
+        """
+
+        logger = logging.getLogger('prefixed.test')
+        logger.setLevel(logging.INFO)
+
+        with mock.patch('prefixed._template.SPEC_CACHE') as cache:
+            logger.debug('Throughput: %s', lazy(2.5e6, '.2h'))
+            cache.assert_not_called()
+
+
+class TestIncrementalFormatter(unittest.TestCase):
+    """
+    Tests for prefixed.IncrementalFormatter
+    """
+
+    def test_matches_float(self):
+        """
+        Output is identical to formatting with Float while values drift
+        """
+
+        rng = random.Random(42)
+        for spec in SPECS + ('%-150.2h', '%100.1H', '.0h', '.15h', '%-100.2h'):
+            formatter = IncrementalFormatter(spec)
+            for _ in range(20):
+                value = rng.choice((1, -1)) * 10 ** rng.uniform(-33, 33)
+                for _ in range(50):
+                    value *= 1 + rng.gauss(0, 10 ** rng.uniform(-9, -2))
+                    with self.subTest(spec=spec, value=value):
+                        try:
+                            expected = format(Float(value), spec)
+                        except ZeroDivisionError:
+                            continue
+                        self.assertEqual(formatter(value), expected)
+
+    def test_boundaries(self):
+        """
+        Values stepping across rounding and prefix boundaries
+        """
+
+        for spec in ('.2h', '.0h', '.3H', '.1H', '.2k', '.3K', '%-5.2h'):
+            formatter = IncrementalFormatter(spec)
+            for edge in (1.005, 999.5, 999.95, 9.995, 1023.95, -1.005e6, 0.9995, 1e-30, 0.095):
+                for step in range(-100, 100):
+                    value = edge * (1 + step * 1e-14)
+                    with self.subTest(spec=spec, value=value):
+                        self.assertEqual(formatter(value), format(Float(value), spec))
+
+    def test_update(self):
+        """
+        Changed flag and cached results
+        """
+
+        formatter = IncrementalFormatter('.1h')
+        self.assertEqual(repr(formatter), "IncrementalFormatter('.1h')")
+        self.assertEqual(formatter.update(1520), ('1.5k', True))
+
+        with mock.patch.object(Formatter, '_render') as render:
+            self.assertEqual(formatter.update(1530), ('1.5k', False))
+            render.assert_not_called()
+
+        self.assertEqual(formatter.update(1560), ('1.6k', True))
+        self.assertEqual(formatter.update(1.6e3), ('1.6k', False))
+
+    def test_not_cached(self):
+        """
+        Zero, infinity, NaN, and native types are always formatted
+        """
+
+        formatter = IncrementalFormatter('.1h')
+        self.assertEqual(formatter.update(0.0), ('0.0', True))
+        self.assertEqual(formatter.update(-0.0), ('-0.0', True))
+        self.assertEqual(formatter.update(float('inf')), ('inf', True))
+        self.assertEqual(formatter.update(float('nan')), ('nan', True))
+
+        formatter = IncrementalFormatter('.2f')
+        self.assertEqual(formatter.update(1.001), ('1.00', True))
+        self.assertEqual(formatter.update(1.002), ('1.00', False))
+        self.assertEqual(formatter.update(1.006), ('1.01', True))
+
+        formatter = IncrementalFormatter('%-100.2h')
+        with self.assertRaises(ZeroDivisionError):
+            formatter(1000)
+
+    def test_subnormal(self):
+        """
+        Rounding step underflows for subnormal values
+        """
+
+        for spec in ('M', '.3H', '.2h'):
+            formatter = IncrementalFormatter(spec)
+            for value in (5e-324, -1e-310, 5e-324):
+                with self.subTest(spec=spec, value=value):
+                    self.assertEqual(formatter(value), format(Float(value), spec))
+
+
+class TestFormatInto(unittest.TestCase):
+    """
+    Tests for prefixed.format_into
+    """
+
+    def test_bytearray(self):
+        """
+        Encoded values are appended
+        """
+
+        buf = bytearray(b'rates: ')
+        self.assertEqual(format_into(buf, [1246, 2.5e6, 2e-6], '.2h', sep=b' '), 19)
+        self.assertEqual(buf, u'rates: 1.25k 2.50M 2.00μ '.encode('utf-8'))
+
+        self.assertEqual(format_into(buf, [], '.2h'), 0)
+        self.assertEqual(len(buf), 26)
+
+    def test_matches_format(self):
+        """
+        Output matches formatting each value, including across chunks
+        """
+
+        values = [1.2345 * 10 ** (exp % 60 - 30) for exp in range(1000)]
+        expected = ''.join('%s\n' % format(Float(value), '!.3H') for value in values)
+        if not isinstance(expected, bytes):
+            expected = expected.encode('utf-8')
+
+        with mock.patch('prefixed._array.WRITE_CHUNK_SIZE', 64):
+            buf = bytearray()
+            self.assertEqual(format_into(buf, iter(values), '!.3H'), len(buf))
+            self.assertEqual(bytes(buf), expected)
+
+    def test_file(self):
+        """
+        Encoded values are written to binary files
+        """
+
+        output = io.BytesIO()
+        self.assertEqual(format_into(output, [1024, 2048], '.1k', sep=b'\r\n'), 14)
+        self.assertEqual(output.getvalue(), b'1.0Ki\r\n2.0Ki\r\n')
+
+    def test_memoryview(self):
+        """
+        Writable buffers are filled from the start
+        """
+
+        buf = bytearray(b'-' * 16)
+        self.assertEqual(format_into(memoryview(buf), [1246, 2e6], '.1h', sep=b','), 10)
+        self.assertEqual(buf, b'1.2k,2.0M,------')
+
+    @unittest.skipIf(sys.version_info[0] < 3, 'Arrays are not buffers in Python 2')
+    def test_array(self):
+        """
+        Buffers with larger items are filled as bytes
+        """
+
+        buf = array.array('d', [0.0])
+        self.assertEqual(format_into(buf, [1, 2], '.0h'), 4)
+        self.assertEqual(buf.tobytes()[:4], b'1\n2\n')
+
+    def test_errors(self):
+        """
+        Buffers that are too small or not writable
+        """
+
+        with self.assertRaisesRegex(ValueError, 'Buffer too small'):
+            format_into(memoryview(bytearray(8)), [1246, 2e6], '.1h')
+
+        with self.assertRaises(TypeError):
+            format_into(b'12345678', [1], '.1h')
+
+        with self.assertRaises(ValueError):
+            format_into(bytearray(), [1], '.x')
+
+
+class TestSplit(unittest.TestCase):
+    """
+    Tests for prefixed.split and prefixed.split_many
+    """
+
+    def test_split(self):
+        """
+        Scaled value and prefix match formatted output
+        """
+
+        self.assertEqual(split(2.5e6, '.2h'), (2.5, 'M'))
+        self.assertEqual(split(2048, '!.1k'), (2.0, 'Ki'))
+        self.assertEqual(split(2048, '.1m'), (2.0, 'K'))
+        self.assertEqual(split(999.9999, '.2h'), (0.9999999, 'k'))
+        self.assertEqual(split(5e-31, '.2h'), (0.5, 'q'))
+        self.assertEqual(split(12, '.2f'), (12.0, ''))
+
+        for spec in SPECS:
+            for value in VALUES:
+                with self.subTest(spec=spec, value=value):
+                    scaled, prefix = split(value, spec)
+                    self.assertTrue(format(Float(value), spec).strip().endswith(prefix))
+                    if Formatter(spec).spec.type not in 'mM':  # Short IEC prefixes don't parse
+                        self.assertAlmostEqual(Float('%r%s' % (scaled, prefix)) / (value or 1),
+                                               1.0 if value else 0.0, places=14)
+
+    def test_split_many(self):
+        """
+        Struct of arrays output matches split()
+        """
+
+        for spec in SPECS + ('%-150.2h',):
+            formatter = Formatter(spec)
+            values = VALUES + (float('inf'), float('nan'))
+            scaled, indices, prefixes = split_many(values, spec)
+            self.assertEqual(prefixes, formatter.prefixes)
+            self.assertEqual(prefixes[-1], '')
+            self.assertEqual(scaled.typecode, 'd')
+            self.assertEqual(indices.typecode, 'B')
+
+            for value, result, index in zip(values, scaled, indices):
+                with self.subTest(spec=spec, value=value):
+                    expected = formatter.split(value)
+                    self.assertEqual(repr((result, prefixes[index])), repr(expected))
+
+    @unittest.skipIf(numpy is None, 'Requires NumPy')
+    def test_split_many_ndarray(self):
+        """
+        Vectorized output matches split_many()
+        """
+
+        values = numpy.array(VALUES + (float('inf'), float('nan')), dtype=numpy.float64)
+        for spec in SPECS + ('%-150.2h',):
+            with self.subTest(spec=spec):
+                scaled, indices, prefixes = split_many(values.reshape(2, -1), spec, ndarray=True)
+                self.assertEqual(scaled.shape, (2, len(values) // 2))
+                self.assertEqual(indices.dtype, numpy.uint8)
+
+                expected = split_many(values, spec)
+                numpy.testing.assert_array_equal(scaled.ravel(), expected[0])
+                numpy.testing.assert_array_equal(indices.ravel(), expected[1])
+                self.assertEqual(prefixes, expected[2])
+
+
+class TestTemplate(unittest.TestCase):
+    """
+    Tests for prefixed.Template
+    """
+
+    def test_render(self):
+        """
+        Output matches str.format() with Float values
+        """
+
+        template = Template('{rx:!.2h}B/s {tx:!.2h}B/s {mem:.1k}B')
+        self.assertEqual(repr(template), "Template('{rx:!.2h}B/s {tx:!.2h}B/s {mem:.1k}B')")
+        self.assertEqual(template.render(rx=1.5e6, tx=2048, mem=3 * 2 ** 30),
+                         '1.50 MB/s 2.05 kB/s 3.0GiB')
+
+        for spec in SPECS:
+            template = Template('<{value:%s}>' % spec)
+            for value in VALUES:
+                with self.subTest(spec=spec, value=value):
+                    self.assertEqual(template.render(value=value),
+                                     '<%s>' % format(Float(value), spec))
+
+    def test_compiled(self):
+        """
+        Format specifications are only parsed when the template is created
+        """
+
+        template = Template('{0:.2h} {1:.3H}')
+        with mock.patch('prefixed._formatter._parse_format_spec') as parse:
+            self.assertEqual(template.render(1500, 2.5e-3), '1.50k 2.5m')
+            parse.assert_not_called()
+
+    def test_fields(self):
+        """
+        Positional, indexed, and attribute fields, conversions, and other types
+        """
+
+        self.assertEqual(Template('{} {} {{literal}} {!r:>6}').render(1, 2.5, 'a'),
+                         "1 2.5 {literal}    'a'")
+        self.assertEqual(Template('{1:.1h}/{0:.1h}').render(1e3, 2e6), '2.0M/1.0k')
+        self.assertEqual(Template('{0[1]:.2h} {a.real:.1H} {d[key]} {d[1]}').render(
+            [1, 2e6], a=3e3, d={'key': 'v', 1: 'one'}), '2.00M 3k v one')
+
+        # Other presentation types are formatted natively, so integers stay integers
+        self.assertEqual(Template('{n:,d} {n:.2f} {n} {s:>3}').render(n=1000, s='x'),
+                         '1,000 1000.00 1000   x')
+
+        # Conversions are applied before formatting
+        self.assertEqual(Template('{x!s:>5}').render(x=1.5), '  1.5')
+
+        # Int keeps exact formatting
+        self.assertEqual(Template('{:.21H}').render(Int(10**20 + 1)), '100.000000000000000001E')
+
+    def test_errors(self):
+        """
+        Invalid format strings raise ValueError when created, missing values when rendered
+        """
+
+        for format_string in ('{', '}', '{x:{width}}', '{} {0}', '{0} {}', '{x!z}', '{x.}',
+                              '{x[0}', '{x[0]y.z}'):
+            with self.subTest(format_string=format_string):
+                with self.assertRaises(ValueError):
+                    Template(format_string)
+
+        with self.assertRaises(KeyError):
+            Template('{x:.2h}').render(y=1)
+        with self.assertRaises(IndexError):
+            Template('{1:.2h}').render(1)
+        with self.assertRaises(ValueError):
+            Template('{x:.2hh}').render(x=1)
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed.fuzz
+"""
+
+import sys
+
+from prefixed import Float, fuzz
+
+if sys.version_info[0] < 3:
+    from StringIO import StringIO
+    import unittest2 as unittest
+    import mock
+else:
+    from io import StringIO
+    import unittest
+    from unittest import mock
+
+
+def _broken_format(values, spec):
+    """
+    Formats values with a 1 in the output incorrectly
+    """
+
+    return [result.replace('1', '7') if isinstance(result, str) and 'k' in result else result
+            for result in fuzz._format_float(values, spec)]  # pylint: disable=protected-access
+
+
+def _broken_parse(strings):
+    """
+    Parses large values incorrectly
+    """
+
+    return [value * 2 if isinstance(value, float) and value > 1e6 else value
+            for value in fuzz._parse_float(strings)]  # pylint: disable=protected-access
+
+
+class TestFuzz(unittest.TestCase):
+    """
+    Differential tests against the reference implementation
+    """
+
+    def test_random(self):
+        """
+        Random values and specifications match the reference
+        """
+
+        for seed in range(3):
+            with self.subTest(seed=seed):
+                self.assertEqual([fuzz.describe(mismatch) for mismatch in
+                                  fuzz.run_random(seed, count=50)], [])
+
+    def test_boundaries(self):
+        """
+        Values adjacent to prefix and rounding thresholds match the reference
+        """
+
+        specs = ['.0h', '.2h', '.3H', '!!.1K', '%-5.2m', '#%20M']
+        self.assertEqual([fuzz.describe(mismatch) for mismatch in
+                          fuzz.run_boundaries(specs)], [])
+
+    def test_parse(self):
+        """
+        Random strings match the reference, except for intended broadening
+        """
+
+        self.assertEqual([fuzz.describe(mismatch) for mismatch in fuzz.run_parse(0, 2000)], [])
+
+    def test_boundary_values(self):
+        """
+        Boundary values include special values and both signs
+        """
+
+        values = fuzz.boundary_values()
+        text = set(repr(value) for value in values)
+        for value in ('0.0', '-0.0', '5e-324', '-5e-324', 'inf', '-inf', 'nan', '1e-30',
+                      '999.5', '999.4999999999999', '-999.5000000000001', '1024.0'):
+            self.assertIn(value, text)
+
+    def test_boundary_specs(self):
+        """
+        Boundary specifications cover each prefixed presentation type
+        """
+
+        specs = fuzz.boundary_specs()
+        for spec in ('.0h', '.2h', '.3H', '.2k', '.2m'):
+            self.assertIn(spec, specs)
+
+    def test_expected_differences(self):
+        """
+        Intended differences from the reference are not reported
+        """
+
+        # Reference raises for infinity and NaN
+        self.assertIs(fuzz.reference_format(float('inf'), '.2h'), OverflowError)
+        self.assertEqual(fuzz.check_format([float('inf'), float('nan')], '!.2h'), [])
+
+        # Reference rejects numbers with leading decimal points and exponents before prefixes
+        self.assertIs(fuzz.reference_parse('.5k'), ValueError)
+        self.assertEqual(fuzz.check_parse(['.5k', '1e-3M', '1_000 Ki', '1.5k']), [])
+
+        # Reference and paths raise for the whole batch
+        self.assertEqual(fuzz.check_format([1.0, 2.0], '.2hh'), [])
+
+        def parse_batch(strings):
+            return [float(Float(string)) for string in strings]
+
+        self.assertEqual(fuzz.check_parse(['1k', 'x'], [('batch', parse_batch)]), [])
+
+    def test_broadened(self):
+        """
+        Only numbers accepted by float followed by a prefix are intended broadening
+        """
+
+        broadened = fuzz._broadened  # pylint: disable=protected-access
+        self.assertTrue(broadened('1e-3 M', 1000.0))
+        self.assertFalse(broadened('.5k', ValueError))
+        self.assertFalse(broadened('1e-k', 1.0))
+        self.assertFalse(broadened('1..5k', 1500.0))
+        self.assertFalse(broadened('1.5', 1.5))
+
+    def test_shrink_format(self):
+        """
+        Format mismatches are found and shrunk
+        """
+
+        paths = [('broken', _broken_format)]
+        mismatches = fuzz.run_random(3, count=50, paths=paths)
+        self.assertTrue(mismatches)
+        for mismatch in mismatches:
+            self.assertEqual(mismatch.path, 'broken')
+            self.assertNotEqual(mismatch.expected, mismatch.actual)
+
+        mismatch = fuzz.shrink(fuzz.Mismatch('broken', -1234.5678, '*>+012,%5.3h', None, None),
+                               paths)
+        self.assertEqual(mismatch, ('broken', 1000.0, 'h', '1.000000k', '7.000000k'))
+
+        # Invalid specifications aren't simplified
+        # pylint: disable-next=protected-access
+        self.assertEqual(list(fuzz._spec_candidates('.2hh')), [])
+
+        # Mismatches which can't be reproduced alone are not changed
+        original = fuzz.Mismatch('broken', 2.0, '.2h', None, None)
+        self.assertIs(fuzz.shrink(original, paths), original)
+
+    def test_shrink_parse(self):
+        """
+        Parse mismatches are found and shrunk
+        """
+
+        paths = [('broken', _broken_parse)]
+        mismatch = fuzz.shrink(fuzz.Mismatch('broken', '+12.5 M', None, None, None), paths)
+        self.assertEqual(mismatch, ('broken', '5M', None, 5e6, 10e6))
+        self.assertEqual(fuzz.describe(mismatch), "broken: Float('5M') expected 5000000.0, "
+                                                  "got 10000000.0")
+
+        original = fuzz.Mismatch('broken', '1k', None, None, None)
+        self.assertIs(fuzz.shrink(original, paths), original)
+
+    def test_batch_errors(self):
+        """
+        Unexpected errors for a batch are reported for the value which raises
+        """
+
+        def broken(values, spec):
+            if any(value > 1000 for value in values):
+                raise ZeroDivisionError
+            return fuzz._format_float(values, spec)  # pylint: disable=protected-access
+
+        mismatches = fuzz.check_format([1.0, 2000.0], '.1h', [('broken', broken)])
+        self.assertEqual(mismatches, [('broken', 2000.0, '.1h', '2.0k', ZeroDivisionError)])
+        self.assertEqual(fuzz.describe(mismatches[0]),
+                         "broken: format(Float(2000.0), '.1h') expected '2.0k', "
+                         "got ZeroDivisionError")
+
+        def broken_parse(strings):
+            if '2k' in strings:
+                raise TypeError
+            return fuzz._parse_float(strings)  # pylint: disable=protected-access
+
+        self.assertEqual(fuzz.check_parse(['1k', '2k'], [('broken', broken_parse)]),
+                         [('broken', '2k', None, 2000.0, TypeError)])
+
+        def broken_batch(strings):
+            if len(strings) > 1:
+                raise TypeError
+            return fuzz._parse_float(strings)  # pylint: disable=protected-access
+
+        # Reported for the first value when none raise alone
+        self.assertEqual(fuzz.check_parse(['1k', '2k'], [('broken', broken_batch)]),
+                         [('broken', '1k', None, 1000.0, TypeError)])
+
+    def test_main(self):
+        """
+        Exit status and output from command line
+        """
+
+        with mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+            self.assertEqual(fuzz.main(['--seed', '1', '--count', '5']), 0)
+        self.assertEqual(stdout.getvalue(), '0 mismatches\n')
+
+        with mock.patch.object(fuzz, 'FORMAT_PATHS', [('broken', _broken_format)]):
+            with mock.patch.object(fuzz, 'boundary_specs', return_value=['.1h']):
+                with mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+                    self.assertEqual(fuzz.main(['--count', '20', '--boundaries']), 1)
+
+        lines = stdout.getvalue().splitlines()
+        self.assertTrue(lines[0].startswith('broken: format(Float('))
+        self.assertRegex(lines[-1], r'^\d+ mismatches$')
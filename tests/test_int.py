@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed.Int
+"""
+
+from __future__ import division
+
+import sys
+
+from prefixed import Float, Formatter, Int
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+SPECS = ('h', '.2h', '!.2h', '10.2h', '<10.2h', '%-5.2h', '%5.2h', '.3H', '#.3H', '=+12.3H',
+         'k', '.2k', '#!.2k', '.3K', '.2m', '.0M', '_.2m', ',.1h', '#.0h')
+
+LARGE_SPECS = ('_.1h', ',.0h', '#.0h', '>30_.0h', '*^#20.0h', '<25,.2h', '+.0h', '=+20,.1h')
+
+# Python 2 doesn't support the alternate form for floats or underscore grouping
+# Python 2 also rounds halfway floats away from zero, and 1000 / 1024 is halfway for '.0M'
+if sys.version_info[0] < 3:
+    SPECS = tuple(spec for spec in SPECS if spec not in ('#!.2k', '_.2m', '#.0h', '.0M'))
+    LARGE_SPECS = tuple(spec for spec in LARGE_SPECS if '_' not in spec and '#' not in spec)
+
+# Values which aren't halfway between two outputs for any of SPECS
+VALUES = (0, 1, -1, 7, 951, 999, 1000, 1023, 1024, -1051, 12346, 123457, 2500001, 2**30 + 1,
+          10**15 + 1, 2**53 - 1)
+
+
+class TestInt(unittest.TestCase):
+    """
+    Tests for prefixed.Int
+    """
+
+    def test_matches_float(self):
+        """
+        Output is identical to Float when float division and rounding are exact
+        """
+
+        for spec in SPECS:
+            for value in VALUES:
+                with self.subTest(spec=spec, value=value):
+                    self.assertEqual(format(Int(value), spec), format(Float(value), spec))
+
+    def test_exact(self):
+        """
+        Digits beyond the precision of floats are kept
+        """
+
+        self.assertEqual(format(Int(12345678901234567891), '.15h'), '12.345678901234568E')
+        self.assertEqual(format(Int(2**80 + 1), '.12k'), '1.000000000000Yi')
+        self.assertEqual(format(Int(10**20 + 1), '.21H'), '100.000000000000000001E')
+        self.assertEqual(format(Int(10**40), '.1h'), '10000000000.0Q')
+        self.assertEqual(format(Int(-2**64), '.2k'), '-16.00Ei')
+
+    def test_large_options(self):
+        """
+        Format options for values with more digits than a float holds
+        """
+
+        for spec in LARGE_SPECS:
+            with self.subTest(spec=spec):
+                self.assertEqual(format(Int(10**40 + 1), spec), format(Float(10**40), spec))
+
+    def test_large_alternate(self):
+        """
+        Alternate form keeps the decimal point when there are no decimals
+        """
+
+        value = Int(10**50 + 1)
+        self.assertEqual(format(value, '#.0h'), '100000000000000000000.Q')
+        self.assertEqual(format(value, '*^#30.0h'), '***100000000000000000000.****Q')
+        self.assertEqual(format(value, '#,.0h'), '100,000,000,000,000,000,000.Q')
+
+    def test_rounding(self):
+        """
+        Halfway values are rounded to even, other values are rounded exactly
+        """
+
+        self.assertEqual(format(Int(995), '.2h'), '1.00k')
+        self.assertEqual(format(Int(994), '.2h'), '994.00')
+        self.assertEqual(format(Int(104955), '.2h'), '104.96k')
+        self.assertEqual(format(Int(104945), '.2h'), '104.94k')
+        self.assertEqual(format(Int(500), '.0h'), '500')
+        self.assertEqual(format(Int(501), '.0h'), '1k')
+        self.assertEqual(format(Int(1500), '.0h'), '2k')
+        self.assertEqual(format(Int(9235026769), '%5.3H'), '9.24G')
+
+    def test_margin(self):
+        """
+        Margin changes thresholds
+        """
+
+        self.assertEqual(format(Int(950), '%-5.2h'), '0.95k')
+        self.assertEqual(format(Int(1000), '%5.2h'), '1000.00')
+        self.assertEqual(format(Int(1050), '%5.2h'), '1.05k')
+        self.assertEqual(format(Int(12), '%-99.2k'), '0.01Ki')
+
+        with self.assertRaises(ZeroDivisionError):
+            format(Int(1000), '%-100.2h')
+
+    def test_margin_no_decimals(self):
+        """
+        Margins above 100% with no decimals can select a smaller prefix than digits suggest
+        """
+
+        for spec, value in (('%200.0h', 1200), ('%200.0h', 1200000), ('%200.0k', 1319413953331),
+                            ('%200.0h', 1501), ('%50.0h', 1200), ('%-50.0k', 600)):
+            with self.subTest(spec=spec, value=value):
+                self.assertEqual(format(Int(value), spec), format(Float(value), spec))
+
+        self.assertEqual(format(Int(1200), '%200.0h'), '1200')
+        self.assertEqual(format(Int(1200000), '%200.0h'), '1200k')
+        self.assertEqual(format(Int(1319413953331), '%200.0k'), '1229Gi')
+
+    def test_native(self):
+        """
+        Other presentation types use int.__format__()
+        """
+
+        self.assertEqual(format(Int(255), 'x'), 'ff')
+        self.assertEqual(format(Int(1234567), ',d'), '1,234,567')
+        self.assertEqual(format(Int(5), ''), '5')
+        self.assertEqual(Formatter('>4').format_int(5), '   5')
+
+    def test_parse(self):
+        """
+        Prefixed strings are converted exactly
+        """
+
+        self.assertEqual(Int('1.5Ki'), 1536)
+        self.assertEqual(Int('2.5 k'), 2500)
+        self.assertEqual(Int('1Q'), 10**30)
+        self.assertEqual(Int('3Yi'), 3 * 2**80)
+        self.assertEqual(Int('1.5e3M'), 1500000000)
+        self.assertEqual(Int(u'2000000μ'), 2)
+        self.assertEqual(Int('42'), 42)
+        self.assertEqual(Int('ff', 16), 255)
+        self.assertEqual(Int(3.9), 3)
+        self.assertIsInstance(Int('2k'), Int)
+
+        for value in ('1.5', '1m', '1.5k0', 'k', '1.0001k', 'bad'):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    Int(value)
+
+        with self.assertRaises(TypeError):
+            Int(3j)
+
+    def test_str(self):
+        """
+        String conversion
+        """
+
+        self.assertEqual(repr(Int(5)), 'Int(5)')
+        self.assertEqual(str(Int(5)), '5')
+        self.assertEqual('%d' % Int(-5), '-5')
+
+    def test_math(self):
+        """
+        Integer results are Int, true division is Float
+        """
+
+        value = Int(7)
+        for result in (value + 1, 1 + value, value - 1, 1 - value, value * 2, 2 * value,
+                       value // 2, 20 // value, value % 4, 20 % value, value ** 2, 2 ** value,
+                       value & 3, 3 & value, value | 8, 8 | value, value ^ 1, 1 ^ value,
+                       value << 2, 2 << value, value >> 1, 1024 >> value,
+                       -value, +value, abs(-value), ~value, pow(value, 2, 5)):
+            self.assertIsInstance(result, Int)
+
+        self.assertEqual(divmod(value, 2), (3, 1))
+        self.assertIsInstance(divmod(value, 2)[0], Int)
+        self.assertIsInstance(divmod(20, value)[1], Int)
+
+        for result in (value / 2, 14 / value, value ** -1, 2 ** -value):
+            self.assertIsInstance(result, Float)
+        self.assertEqual(value / 2, 3.5)
+
+        self.assertIsInstance(value + Float(1), Float)
+        for method in (value.__add__, value.__divmod__, value.__rdivmod__,
+                       value.__pow__, value.__rpow__):
+            self.assertIs(method(1.5), NotImplemented)
+
+    def test_subclass(self):
+        """
+        Subclasses are preserved and instances have no __dict__
+        """
+
+        class Bytes(Int):
+            """Subclass"""
+            __slots__ = ()
+
+        self.assertIsInstance(Bytes(5) + 1, Bytes)
+        self.assertFalse(hasattr(Int(5), '__dict__'))
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed matplotlib support
+"""
+
+import sys
+
+from prefixed import Float, Formatter
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+    import mock
+else:
+    import unittest
+    from unittest import mock
+
+try:
+    import matplotlib
+    matplotlib.use('Agg')
+    from matplotlib.figure import Figure
+    from prefixed.mpl import PrefixedFormatter  # pylint: disable=ungrouped-imports
+except ImportError:  # pragma: no cover
+    matplotlib = None
+
+
+@unittest.skipIf(matplotlib is None, 'Requires matplotlib')
+class TestPrefixedFormatter(unittest.TestCase):
+    """
+    Tests for prefixed.mpl.PrefixedFormatter
+    """
+
+    def setUp(self):
+
+        self.figure = Figure()
+        self.axes = self.figure.add_subplot()
+        self.axes.plot([0, 1, 2, 3], [0, 1.2e6, 2.5e6, 3.1e6])
+
+    def labels(self):
+        """
+        Draw figure and return y tick labels
+        """
+
+        self.figure.canvas.draw()
+        return [label.get_text() for label in self.axes.get_yticklabels()]
+
+    def test_axis(self):
+        """
+        All ticks share a prefix selected from the view interval
+        """
+
+        formatter = PrefixedFormatter('!.3H', unit='B/s')
+        self.axes.yaxis.set_major_formatter(formatter)
+        self.axes.set_ylim(0, 3e6)
+        self.assertEqual(self.labels(), ['0 MB/s', '0.5 MB/s', '1 MB/s', '1.5 MB/s',
+                                         '2 MB/s', '2.5 MB/s', '3 MB/s'])
+
+        self.axes.set_ylim(-2000, 8000)
+        self.assertEqual(self.labels(), ['-2 kB/s', '0 kB/s', '2 kB/s', '4 kB/s',
+                                         '6 kB/s', '8 kB/s'])
+
+        # Cursor position uses its own prefix
+        self.assertEqual(formatter.format_data_short(1234567.0), '1.23 MB/s')
+        self.assertEqual(formatter.format_data(0.5), '500 mB/s')
+
+    def test_cached(self):
+        """
+        Prefix is only selected again when the view interval changes
+        """
+
+        formatter = PrefixedFormatter('.1h')
+        self.axes.yaxis.set_major_formatter(formatter)
+        self.axes.set_ylim(0, 1500)
+
+        # pylint: disable=protected-access
+        with mock.patch.object(Formatter, '_convert', autospec=True,
+                               side_effect=Formatter._convert) as convert:
+            self.labels()
+            self.labels()
+            self.assertEqual(convert.call_count, 1)
+
+            self.axes.set_ylim(0, 2e6)
+            self.assertEqual(self.labels()[-1], '2.0M')
+            self.assertEqual(convert.call_count, 2)
+
+    def test_standalone(self):
+        """
+        Without an axis, the prefix is selected from the tick locations
+        """
+
+        formatter = PrefixedFormatter('.1h')
+        self.assertEqual(formatter(1500), '1.5k')
+        self.assertEqual(formatter.format_ticks([0, 500, 1000, 1500]),
+                         ['0.0k', '0.5k', '1.0k', '1.5k'])
+        self.assertEqual(formatter.format_ticks([0, 0.5]), ['0.0m', '500.0m'])
+        self.assertEqual(formatter.format_ticks([float('nan'), 2e6]), ['nan', '2.0M'])
+        self.assertEqual(formatter.format_ticks([0.0]), ['0.0'])
+
+    def test_native(self):
+        """
+        Presentation types without prefixes format values individually
+        """
+
+        formatter = PrefixedFormatter('.2f', unit=' V')
+        self.assertEqual(formatter.format_ticks([0, 1500]), ['0.00 V', '1500.00 V'])
+
+    def test_matches_float(self):
+        """
+        Labels match Float for the selected prefix
+        """
+
+        formatter = PrefixedFormatter('.2h')
+        values = [2e6, 1.5e6, 999.5e3, 0.0]
+        self.assertEqual(formatter.format_ticks(values), [format(Float(value), '.2h')
+                                                          for value in (2e6, 1.5e6, 999.5e3)] +
+                         ['0.00M'])
+        self.assertEqual(formatter.format_ticks([-0.5e6, 2e6]), ['-0.50M', '2.00M'])
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed NumPy support
+"""
+
+# Python 2 and optional NumPy imports are the same as in test_formatter
+# pylint: disable=duplicate-code
+
+import sys
+
+from prefixed import Formatter, format_array
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+else:
+    import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+SPECS = ('h', '.2h', '.0h', '!.2h', '!!.2h', '10.2h', '%-5.2h', '%5.3H', '%-150.2h', '.3H',
+         '#.3H', 'k', '.2k', '.3K', '#.3K', '.2m', '.0M', '.15h', '.2f')
+
+
+@unittest.skipIf(numpy is None, 'Requires NumPy')
+class TestFormatArray(unittest.TestCase):
+    """
+    Tests for prefixed.format_array
+    """
+
+    def setUp(self):
+
+        rng = numpy.random.RandomState(42)  # pylint: disable=no-member
+        magnitudes = numpy.array([1e-30, 1e-27, 1e-6, 1e-3, 1e3, 1e6, 1e30, 2**10, 2**20, 2**80])
+        offsets = numpy.array([0.5, 0.05, 0.005, 0.0005, 0.00005])
+
+        # Random values and values close to prefix boundaries
+        near = magnitudes[rng.randint(0, len(magnitudes), 2000)] * \
+            (1 - offsets[rng.randint(0, len(offsets), 2000)] * rng.uniform(0.999, 1.001, 2000))
+
+        self.values = numpy.concatenate((
+            10 ** rng.uniform(-40, 40, 2000), near, -near,
+            [0.0, -0.0, 1.0, 5e-324, 1e-30, 0.95e-30, 995.0, 995.01, 1024, 2.0**90,
+             numpy.inf, -numpy.inf, numpy.nan]
+        ))
+
+    def test_matches_scalar(self):
+        """
+        Output is identical to formatting each element individually
+        """
+
+        for spec in SPECS:
+            formatter = Formatter(spec)
+            expected = [formatter(value) for value in self.values.tolist()]
+            with self.subTest(spec=spec):
+                self.assertEqual(format_array(self.values, spec).tolist(), expected)
+
+    def test_shape(self):
+        """
+        Output has the same shape as input
+        """
+
+        output = format_array([[1, 2000], [3e9, 4e-9]], '.2h')
+        self.assertEqual(output.shape, (2, 2))
+        self.assertEqual(output.dtype, object)
+        self.assertEqual(output.tolist(), [['1.00', '2.00k'], ['3.00G', '4.00n']])
+
+        self.assertEqual(format_array(2048, '.1k').tolist(), '2.0Ki')
+        self.assertEqual(format_array(numpy.array([]), '.1k').tolist(), [])
+
+    def test_integers(self):
+        """
+        Integer arrays are converted
+        """
+
+        output = format_array(numpy.arange(0, 4096, 1024), '.1m')
+        self.assertEqual(output.tolist(), ['0.0', '1.0K', '2.0K', '3.0K'])
+
+    def test_errors(self):
+        """
+        Errors match scalar formatting
+        """
+
+        with self.assertRaises(ValueError):
+            format_array([1.0], 'hh')
+
+        with self.assertRaises(ValueError):
+            format_array([1.0], '!.2f')
+
+        with self.assertRaises(ZeroDivisionError):
+            format_array([1.0], '%-100.2h')
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed pandas support
+"""
+
+import math
+import sys
+
+from prefixed import Float
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+else:
+    import unittest
+
+try:
+    import pandas
+    import prefixed.pandas  # noqa: F401  # pylint: disable=unused-import
+except ImportError:  # pragma: no cover
+    pandas = None
+
+
+VALUES = [1246, 2.5e6, 0.004, -3e-9, 0.0, 999.5, 2**20, float('inf'), float('nan')]
+
+
+@unittest.skipIf(pandas is None, 'Requires pandas')
+class TestSeriesAccessor(unittest.TestCase):
+    """
+    Tests for Series.prefixed
+    """
+
+    def test_format(self):
+        """
+        Formatting matches Float for each value and keeps index and name
+        """
+
+        series = pandas.Series(VALUES, index=list('abcdefghi'), name='rate')
+        for spec in ('.2h', '!.3H', '%-5.1k', '.2f'):
+            result = series.prefixed.format(spec)
+            self.assertEqual(list(result), [format(Float(value), spec) for value in VALUES])
+            self.assertEqual(list(result.index), list('abcdefghi'))
+            self.assertEqual(result.name, 'rate')
+
+    def test_format_missing(self):
+        """
+        Missing values in nullable columns are formatted as nan
+        """
+
+        series = pandas.Series([1000, None], dtype='Int64')
+        self.assertEqual(list(series.prefixed.format('.1h')), ['1.0k', 'nan'])
+
+    def test_format_empty(self):
+        """
+        Empty series
+        """
+
+        self.assertEqual(len(pandas.Series([], dtype=float).prefixed.format('.2h')), 0)
+
+    def test_parse(self):
+        """
+        Strings are converted the same as Float, missing values remain missing
+        """
+
+        strings = ['2Ki', '3.5M', '-4.2 k', u'12µ', '12μ', '42', '2Ki', None]
+        result = pandas.Series(strings, name='size').prefixed.parse()
+
+        self.assertEqual(result.dtype, 'float64')
+        self.assertEqual(result.name, 'size')
+        self.assertEqual(list(result[:-1]), [float(Float(value)) for value in strings[:-1]])
+        self.assertTrue(math.isnan(result.iloc[-1]))
+
+    def test_parse_numeric(self):
+        """
+        Numeric series are converted to float64
+        """
+
+        result = pandas.Series([1, 2, 3]).prefixed.parse()
+        self.assertEqual(result.dtype, 'float64')
+        self.assertEqual(list(result), [1.0, 2.0, 3.0])
+
+    def test_parse_errors(self):
+        """
+        Invalid values raise or are coerced to nan
+        """
+
+        series = pandas.Series(['2Ki', 'bad', '1k'], index=['x', 'y', 'z'])
+
+        with self.assertRaises(ValueError) as ctx:
+            series.prefixed.parse()
+        self.assertEqual(str(ctx.exception), "Could not convert str to Float at index 'y': 'bad'")
+
+        result = series.prefixed.parse(errors='coerce')
+        self.assertEqual(result['x'], 2048.0)
+        self.assertTrue(math.isnan(result['y']))
+
+        with self.assertRaises(ValueError):
+            series.prefixed.parse(errors='mask')
+
+
+@unittest.skipIf(pandas is None, 'Requires pandas')
+class TestDataFrameAccessor(unittest.TestCase):
+    """
+    Tests for DataFrame.prefixed
+    """
+
+    def setUp(self):
+        self.frame = pandas.DataFrame({'rate': [1e3, 2e6], 'host': ['a', 'b'],
+                                       'size': ['1Ki', '2M'], 'count': [5, 1500]})
+
+    def test_format(self):
+        """
+        All numeric columns are formatted by default
+        """
+
+        result = self.frame.prefixed.format('.1h')
+        self.assertEqual(list(result['rate']), ['1.0k', '2.0M'])
+        self.assertEqual(list(result['count']), ['5.0', '1.5k'])
+        self.assertEqual(list(result['host']), ['a', 'b'])
+        self.assertEqual(list(self.frame['rate']), [1e3, 2e6])
+
+    def test_format_columns(self):
+        """
+        Specs can be given per column
+        """
+
+        result = self.frame.prefixed.format({'rate': '.0h', 'count': '.2k'})
+        self.assertEqual(list(result['rate']), ['1k', '2M'])
+        self.assertEqual(list(result['count']), ['5.00', '1.46Ki'])
+
+        result = self.frame.prefixed.format('.0h', columns=['count'])
+        self.assertEqual(list(result['count']), ['5', '2k'])
+        self.assertEqual(list(result['rate']), [1e3, 2e6])
+
+    def test_parse(self):
+        """
+        Columns are converted
+        """
+
+        result = self.frame.prefixed.parse(['size'])
+        self.assertEqual(list(result['size']), [1024.0, 2e6])
+        self.assertEqual(list(result['host']), ['a', 'b'])
+
+        with self.assertRaises(ValueError):
+            self.frame.prefixed.parse()
+
+        result = self.frame.prefixed.parse(errors='coerce')
+        self.assertEqual(list(result['count']), [5.0, 1500.0])
+        self.assertTrue(result['host'].isna().all())
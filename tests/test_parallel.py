@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed.format_many
+"""
+
+import sys
+import types
+
+from prefixed import Float, format_many
+
+try:
+    from prefixed import _parallel
+except ImportError:  # pragma: no cover
+    _parallel = None
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+    import mock
+else:
+    import unittest
+    from unittest import mock
+
+
+VALUES = [1.2345 * 10 ** exp * sign for exp in range(-32, 33) for sign in (1, -1)] + \
+    [0.0, 999.5, 1023.9, 2**20, float('inf'), float('nan')]
+
+
+class TestFormatMany(unittest.TestCase):
+    """
+    Tests for prefixed.format_many
+    """
+
+    @unittest.skipIf(_parallel is None, 'concurrent.futures not available')
+    def test_serial(self):
+        """
+        Small inputs are formatted in the current process
+        """
+
+        with mock.patch('prefixed._parallel.ProcessPoolExecutor') as executor:
+            result = format_many(VALUES, '.2h', workers=4)
+            self.assertIsInstance(result, types.GeneratorType)
+            self.assertEqual(list(result), [format(Float(value), '.2h') for value in VALUES])
+            executor.assert_not_called()
+
+    def test_invalid_spec(self):
+        """
+        Format spec is validated before any values are formatted
+        """
+
+        with self.assertRaises(ValueError):
+            format_many(VALUES, '.x')
+
+    @unittest.skipIf(_parallel is None, 'concurrent.futures not available')
+    @mock.patch('prefixed.PARALLEL_THRESHOLD', 10)
+    def test_parallel(self):
+        """
+        Results from worker processes are in input order
+        """
+
+        for spec in ('.2h', '!.3H', '%-5.1k', '>10.2M', '.2f'):
+            expected = [format(Float(value), spec) for value in VALUES]
+            result = format_many(iter(VALUES), spec, workers=2, chunksize=7)
+            self.assertEqual(list(result), expected)
+
+    @unittest.skipIf(_parallel is None, 'concurrent.futures not available')
+    @mock.patch('prefixed.PARALLEL_THRESHOLD', 10)
+    def test_single_worker(self):
+        """
+        One worker is formatted in the current process
+        """
+
+        with mock.patch('prefixed._parallel.ProcessPoolExecutor') as executor:
+            self.assertEqual(list(format_many(VALUES, '.2h', workers=1)),
+                             [format(Float(value), '.2h') for value in VALUES])
+            executor.assert_not_called()
+
+    @unittest.skipIf(_parallel is None, 'concurrent.futures not available')
+    @mock.patch('prefixed.PARALLEL_THRESHOLD', 10)
+    def test_single_processor(self):
+        """
+        Number of processors is resolved before choosing a process pool
+        """
+
+        with mock.patch('prefixed._parallel.ProcessPoolExecutor') as executor:
+            with mock.patch('multiprocessing.cpu_count', return_value=1):
+                self.assertEqual(list(format_many(VALUES, '.2h', workers=None)),
+                                 [format(Float(value), '.2h') for value in VALUES])
+            executor.assert_not_called()
+
+    @unittest.skipIf(_parallel is None, 'concurrent.futures not available')
+    @mock.patch('prefixed.PARALLEL_THRESHOLD', 10)
+    def test_default_serial(self):
+        """
+        Worker processes are not used unless requested
+        """
+
+        with mock.patch('prefixed._parallel.ProcessPoolExecutor') as executor:
+            self.assertEqual(list(format_many(VALUES, '.2h')),
+                             [format(Float(value), '.2h') for value in VALUES])
+            executor.assert_not_called()
+
+    @unittest.skipIf(_parallel is None, 'concurrent.futures not available')
+    @mock.patch('prefixed.PARALLEL_THRESHOLD', 10)
+    def test_invalid_values(self):
+        """
+        Invalid values raise the same exceptions with and without worker processes
+        """
+
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                self.assertEqual(list(format_many(['1e3'] * 12, '.1h', workers=workers)),
+                                 ['1.0k'] * 12)
+
+                with self.assertRaises(ValueError):
+                    list(format_many(VALUES[:11] + ['1x'], '.2h', workers=workers))
+
+                with self.assertRaises(TypeError):
+                    list(format_many(VALUES[:11] + [None], '.2h', workers=workers))
+
+    @unittest.skipIf(_parallel is None, 'concurrent.futures not available')
+    def test_abandoned(self):
+        """
+        Pending chunks are cancelled when the generator is closed
+        """
+
+        future = mock.Mock()
+        # pylint: disable-next=protected-access
+        future.result.return_value = _parallel._format_chunk('.2h', VALUES[:3])
+
+        with mock.patch('prefixed._parallel.ProcessPoolExecutor') as executor:
+            executor.return_value.__enter__.return_value.submit.return_value = future
+            result = _parallel.format_many(VALUES, '.2h', workers=1, chunksize=3)
+            self.assertEqual(next(result), format(Float(VALUES[0]), '.2h'))
+            result.close()
+
+        # One chunk was still pending when the generator was closed
+        future.cancel.assert_called_once_with()
+
+    def test_split(self):
+        """
+        Chunk results are split back into strings
+        """
+
+        if _parallel is None:  # pragma: no cover
+            self.skipTest('concurrent.futures not available')
+
+        # pylint: disable=protected-access
+        text, lengths = _parallel._format_chunk('.1h', [1e3, 0.0, 2.5e-6])
+        self.assertEqual(list(_parallel._split(text, lengths)), ['1.0k', '0.0', '2.5μ'])
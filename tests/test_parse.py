@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for parsing prefixed strings in bulk
+"""
+
+# Python 2 and optional NumPy imports are the same as in test_formatter
+# pylint: disable=duplicate-code
+
+from array import array
+import math
+import sys
+import threading
+
+from prefixed import (Float, clear_parse_cache, parse_cache_info, parse_many,
+                      set_parse_cache_size)
+from prefixed._common import _BoundedCache
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+else:
+    import unittest
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+
+VALID = ('2Ki', '3.5M', '-4.2 k', '+7m', '12μ', u'12µ', '1Yi', '1Q', '1q',
+         '42', '1e3', '1.5', 3, 2.5)
+
+
+class TestParseMany(unittest.TestCase):
+    """
+    Tests for prefixed.parse_many
+    """
+
+    def test_matches_float(self):
+        """
+        Values are converted the same as Float
+        """
+
+        output = parse_many(VALID)
+        self.assertIsInstance(output, array)
+        self.assertEqual(output.typecode, 'd')
+        self.assertEqual(output.tolist(), [Float(value) for value in VALID])
+
+    def test_empty(self):
+        """
+        Empty input returns an empty array
+        """
+
+        self.assertEqual(parse_many(iter(())).tolist(), [])
+        output, mask = parse_many((), errors='mask')
+        self.assertEqual(output.tolist(), [])
+        self.assertEqual(mask.tolist(), [])
+
+    def test_raise(self):
+        """
+        First invalid value raises by default
+        """
+
+        with self.assertRaises(ValueError) as cm:
+            parse_many(['2k', '3x'])
+        self.assertEqual(str(cm.exception), "Could not convert str to Float at index 1: '3x'")
+
+        with self.assertRaises(TypeError) as cm:
+            parse_many(['2k', None])
+        self.assertEqual(str(cm.exception), 'Could not convert NoneType to Float at index 1: None')
+
+    def test_coerce(self):
+        """
+        Invalid values are nan when coerced
+        """
+
+        output = parse_many(['2k', '3x', None, '1Ki'], errors='coerce')
+        self.assertEqual(output[0], 2000.0)
+        self.assertTrue(math.isnan(output[1]))
+        self.assertTrue(math.isnan(output[2]))
+        self.assertEqual(output[3], 1024.0)
+
+    def test_mask(self):
+        """
+        Mask identifies invalid values
+        """
+
+        output, mask = parse_many(['2k', '3x', 'nan', '1Ki'], errors='mask')
+        self.assertEqual(mask, array('B', [0, 1, 0, 0]))
+        self.assertEqual(output[0], 2000.0)
+        self.assertTrue(math.isnan(output[1]))
+        self.assertTrue(math.isnan(output[2]))
+
+    def test_invalid_errors(self):
+        """
+        Unknown values for errors raise ValueError
+        """
+
+        with self.assertRaises(ValueError):
+            parse_many(['2k'], errors='ignore')
+
+    @unittest.skipIf(numpy is None, 'Requires NumPy')
+    def test_ndarray(self):
+        """
+        NumPy arrays returned when requested
+        """
+
+        output = parse_many(['2Ki', '1M'], ndarray=True)
+        self.assertIsInstance(output, numpy.ndarray)
+        self.assertEqual(output.dtype, numpy.float64)
+        self.assertEqual(output.tolist(), [2048.0, 1e6])
+
+        output, mask = parse_many(['2Ki', 'bad'], errors='mask', ndarray=True)
+        self.assertEqual(mask.dtype, numpy.bool_)
+        self.assertEqual(mask.tolist(), [False, True])
+        self.assertTrue(numpy.isnan(output[1]))
+
+
+class TestParseCache(unittest.TestCase):
+    """
+    Tests for cache of parsed strings
+    """
+
+    def tearDown(self):
+        set_parse_cache_size(0)
+
+    def test_disabled(self):
+        """
+        Cache is disabled by default
+        """
+
+        Float('2Ki')
+        self.assertEqual(tuple(parse_cache_info()), (0, 0, 0, 0))
+
+    def test_cache(self):
+        """
+        Repeated strings are served from the cache
+        """
+
+        set_parse_cache_size(2)
+        self.assertEqual(Float('2Ki'), 2048)
+        self.assertEqual(Float('2Ki'), 2048)
+        self.assertEqual(Float('1.5'), 1.5)
+        self.assertEqual(tuple(parse_cache_info()), (1, 1, 2, 1))
+
+        # Invalid values are cached too, but still raise
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                Float('2Kx')
+        self.assertEqual(tuple(parse_cache_info()), (2, 2, 2, 2))
+
+        # Oldest entry is discarded
+        self.assertEqual(parse_many(['3M', '2Ki']).tolist(), [3e6, 2048])
+        self.assertEqual(tuple(parse_cache_info()), (2, 4, 2, 2))
+
+        clear_parse_cache()
+        self.assertEqual(tuple(parse_cache_info()), (0, 0, 2, 0))
+
+    def test_size(self):
+        """
+        Size must be non-negative
+        """
+
+        with self.assertRaises(ValueError):
+            set_parse_cache_size(-1)
+
+    @unittest.skipIf(sys.version_info[0] < 3, 'Requires sys.setswitchinterval()')
+    def test_threads(self):
+        """
+        Entries are discarded while other threads add entries
+        """
+
+        set_parse_cache_size(8)
+        errors = []
+
+        def parse(number):
+            try:
+                for index in range(25000):
+                    Float('%d.%dk' % (number, index))
+            except Exception as exc:  # pylint: disable=broad-except  # pragma: no cover
+                errors.append(exc)
+
+        threads = [threading.Thread(target=parse, args=(number,)) for number in range(4)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+
+    def test_resized(self):
+        """
+        Eviction is retried when the cache changes size while the oldest key is found
+        """
+
+        class Resizing(dict):
+            """
+            Adds an entry after the first iterator is created
+            """
+
+            def __iter__(self):
+                iterator = dict.__iter__(self)
+                if 'added' not in self:
+                    self['added'] = 'added'
+                return iterator
+
+        cache = _BoundedCache(str, 2)
+        cache._cache = Resizing(a='a', b='b')  # pylint: disable=protected-access
+        self.assertEqual(cache('c'), 'c')
+        self.assertEqual(cache.info().currsize, 2)
+        self.assertIn('c', cache._cache)  # pylint: disable=protected-access
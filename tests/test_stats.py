@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+# Copyright 2026 Avram Lubkin, All Rights Reserved
+
+# This Source Code Form is subject to the terms of the Mozilla Public
+# License, v. 2.0. If a copy of the MPL was not distributed with this
+# file, You can obtain one at http://mozilla.org/MPL/2.0/.
+
+"""
+Test file for prefixed.stats
+"""
+
+import os
+import subprocess
+import sys
+
+from prefixed import Float, Formatter, _float, stats
+
+if sys.version_info[0] < 3:
+    import unittest2 as unittest
+else:
+    import unittest
+
+
+class TestStats(unittest.TestCase):
+    """
+    Tests for prefixed.stats
+    """
+
+    def setUp(self):
+        stats.reset()
+
+    def tearDown(self):
+        stats.disable()
+        stats.reset()
+
+    def test_counts(self):
+        """
+        Formatting, parsing, and errors are counted while collecting
+        """
+
+        with stats.collect() as counts:
+            self.assertTrue(stats.enabled())
+            self.assertEqual(format(Float('2.5M'), '.2h'), '2.50M')
+            self.assertEqual(format(Float(b'12'), '.1H'), '10')
+            self.assertEqual(format(Float(3), '.2f'), '3.00')
+            self.assertEqual(format(Float(3), ''), '3.0')
+            self.assertEqual(Float('1.5k'), 1500)
+
+            with self.assertRaises(ValueError):
+                Float('1x')
+            with self.assertRaises(TypeError):
+                Float(None)
+            with self.assertRaises(ValueError):
+                format(Float(3), 'hh')
+
+        self.assertFalse(stats.enabled())
+        self.assertEqual(stats.snapshot(), {
+            'format.h': 1, 'format.H': 1, 'format.f': 1, 'format.none': 1, 'format.fallback': 2,
+            'convert': 2, 'parse.prefix': 2, 'parse.no_prefix': 2,
+            'error.ValueError': 2, 'error.TypeError': 1,
+        })
+        self.assertIs(counts, stats.COUNTS)
+
+        # Not counted when disabled
+        format(Float('2.5M'), '.2h')
+        self.assertEqual(stats.snapshot()['format.h'], 1)
+
+        stats.reset()
+        self.assertEqual(stats.snapshot(), {})
+
+    def test_timing(self):
+        """
+        Cumulative time is only recorded when requested
+        """
+
+        with stats.collect():
+            format(Float('2.5M'), '.2h')
+        self.assertNotIn('time_ns.format', stats.snapshot())
+
+        with stats.collect(timing=True):
+            format(Float('2.5M'), '.2h')
+
+        snapshot = stats.snapshot()
+        self.assertGreater(snapshot['time_ns.format'], 0)
+        self.assertGreater(snapshot['time_ns.parse'], 0)
+
+    def test_restored(self):
+        """
+        Original implementations are restored when disabled
+        """
+
+        # pylint: disable=protected-access
+        originals = (Float.__dict__['__new__'], Float.__format__, _float._apply_prefix,
+                     Formatter._convert)
+
+        stats.enable()
+        stats.enable(timing=True)
+        self.assertIsNot(Float.__format__, originals[1])
+
+        # Nested collection keeps outer state
+        with stats.collect():
+            pass
+        self.assertTrue(stats.enabled())
+
+        stats.disable()
+        stats.disable()
+        self.assertEqual((Float.__dict__['__new__'], Float.__format__, _float._apply_prefix,
+                          Formatter._convert), originals)
+        self.assertEqual(Float('1k'), 1000)
+
+    def test_environment(self):
+        """
+        Collection can be enabled with an environment variable
+        """
+
+        env = dict(os.environ, PREFIXED_STATS='timing')
+        code = ('from __future__ import print_function; '
+                'from prefixed import Float, stats; format(Float(1), ".2h"); '
+                'print(stats.enabled(), sorted(stats.snapshot()))')
+        output = subprocess.check_output([sys.executable, '-c', code], env=env)
+        self.assertEqual(output.decode().strip(),
+                         "True ['convert', 'format.h', 'time_ns.format', 'time_ns.parse']")
+
+    def test_environment_disabled(self):
+        """
+        Empty values, 0, and false don't enable collection
+        """
+
+        code = 'from __future__ import print_function; from prefixed import stats; ' \
+            'print(stats.enabled())'
+        for value in ('', '0', 'False'):
+            with self.subTest(value=value):
+                env = dict(os.environ, PREFIXED_STATS=value)
+                output = subprocess.check_output([sys.executable, '-c', code], env=env)
+                self.assertEqual(output.decode().strip(), 'False')